@@ -0,0 +1,3 @@
+"""
+Data loading and metric computation for the Messi vs Ronaldo analysis.
+"""
@@ -0,0 +1,391 @@
+"""
+Local HTTP/JSON query service over the player statistics, computed like the dashboard.
+
+The figures are computed by analysis/metrics.py from the cubes of the shared loading cache, so every
+answer matches the page. Filtered queries compute the metrics of a discipline on the filtered cubes.
+Encoded answers are kept in a LRU cache limited in entries and bytes, an entry is only used as long
+as the cubes it was computed from are unchanged.
+
+Endpoints:
+    GET /players                                 names of all players
+    GET /players/{name}                          totals of all five disciplines
+    GET /players/{name}/{discipline}             totals of a discipline, e.g. /players/Lionel%20Messi/penalties
+    GET /players/{name}/{discipline}?by=...      breakdown of a discipline, see BREAKDOWNS
+    GET /cache                                   hit and miss counts of the result cache
+    GET /metrics                                 span totals in the Prometheus text format, see analysis/instrument.py
+Every query of a player can be filtered by season=2009 or season=2009-2014 (year the season started)
+and competition=LaLiga, e.g. /players/Lionel%20Messi/penalties?by=competition&season=2009-2014.
+
+Usage:
+    python -m analysis.api [--port 8600] [--cache-entries 1024] [--cache-mb 32] [--warm-up]
+"""
+import argparse
+import json
+import logging
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import numpy as np
+
+from analysis.cube import CUBES
+from analysis.instrument import PROMETHEUS_CONTENT_TYPE, prometheus_text, span
+from analysis.loading import load_cube
+from analysis.metrics import DISCIPLINES, derive_totals, discipline_metrics, for_player, select
+from analysis.ranges import SUMMED_TOTALS
+from analysis.report import available_players, json_records
+from analysis.warmup import warm_up
+
+logger = logging.getLogger(__name__)
+
+# discipline -> value of the by parameter -> metric of the discipline
+BREAKDOWNS = {
+    "goals": {"type": "types", "position": "positions", "minute": "minutes", "phase": "phases"},
+    "penalties": {"season": "per_saison", "competition": "per_competition"},
+    "assists": {"competition": "per_tournament"},
+    "fair_play": {"competition": "per_competition"},
+    "titles": {"title": "per_title"},
+}
+
+FILTERS = ["season", "competition"]
+
+
+class QueryError(Exception):
+    """
+    Error of a query, answered with its HTTP status and message.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ResultCache:
+    """
+    Thread safe LRU cache of encoded answers, limited in number of entries and total size.
+
+    Args:
+        max_entries: Maximal number of cached answers, 0 disables the cache.
+        max_bytes: Maximal total size of the cached answers.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 2 ** 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, cubes):
+        """
+        Returns a cached answer.
+
+        Args:
+            key: Key of the query.
+            cubes: Cubes the answer is computed from, the answer is outdated if one of them was rebuilt.
+
+        Returns:
+            body: Encoded answer or None if it is not cached or outdated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not all(old is new for old, new in zip(entry[0], cubes)):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, cubes, body):
+        """
+        Stores an answer, the least recently used answers are dropped until the limits hold.
+
+        Args:
+            key: Key of the query.
+            cubes: Cubes the answer was computed from.
+            body: Encoded answer.
+        """
+        if len(body) > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old[1])
+            self._entries[key] = (cubes, body)
+            self.size += len(body)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self.size -= len(dropped)
+                self.evictions += 1
+
+    def stats(self):
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            stats: Dictionary with the number of entries, their size, hits, misses and evictions.
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.size, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+
+def parse_filters(params):
+    """
+    Reads the filters of a query.
+
+    Args:
+        params: Dictionary of query parameters.
+
+    Returns:
+        filters: Dictionary of filter name and value, the season as inclusive range of start years.
+    """
+    filters = {}
+    if "season" in params:
+        first, _, last = params["season"].partition("-")
+        try:
+            filters["season"] = (int(first), int(last or first))
+        except ValueError:
+            raise QueryError(400, f"season has to be a year or a range of years like 2009-2014, not '{params['season']}'")
+    if "competition" in params:
+        filters["competition"] = params["competition"]
+    return filters
+
+
+def filter_cube(cube, filters):
+    """
+    Returns the rows of a cube matching the filters.
+
+    Args:
+        cube: Dataframe of a cube.
+        filters: Filters as returned by parse_filters().
+
+    Returns:
+        cube: Filtered cube.
+    """
+    if "competition" in filters and "competition" not in cube.columns:
+        raise QueryError(400, "the competition filter is not available for this discipline")
+    return select(cube, seasons=filters.get("season"), competition=filters.get("competition"))
+
+
+def _metrics(discipline, cubes, filters):
+    if not filters:
+        # the same computation and memo as the dashboard
+        return discipline_metrics(discipline)
+    _, compute = DISCIPLINES[discipline]
+    with span(f"compute/{discipline} filtered"):
+        return compute(*[filter_cube(cube, filters) for cube in cubes])
+
+
+def _totals(discipline, metrics, player):
+    # a player without rows left by the filters has zero summed totals like on the page, see
+    # SeasonIndex.totals(), only the derived ratios can be missing then
+    totals = metrics["totals"]
+    summed = totals[SUMMED_TOTALS[discipline]].reindex([player], fill_value=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return json_records(derive_totals(discipline, summed)[totals.columns])[0]
+
+
+def answer(path, params):
+    """
+    Answers a query.
+
+    Args:
+        path: Path of the request.
+        params: Dictionary of query parameters.
+
+    Returns:
+        cubes: Cubes the answer is computed from.
+        payload: JSON serializable answer.
+    """
+    parts = [unquote(part) for part in path.strip("/").split("/")]
+    if not parts or parts[0] != "players" or len(parts) > 3:
+        raise QueryError(404, f"unknown path '{path}'")
+    unknown = [name for name in params if name not in FILTERS + ["by"]]
+    if unknown:
+        raise QueryError(400, f"unknown parameters {unknown}, available are {FILTERS + ['by']}")
+
+    disciplines = [parts[2]] if len(parts) == 3 else list(DISCIPLINES)
+    if disciplines[0] not in DISCIPLINES:
+        raise QueryError(404, f"unknown discipline '{disciplines[0]}', available are {list(DISCIPLINES)}")
+    sources = list(CUBES) if len(parts) < 3 else DISCIPLINES[disciplines[0]][0]
+    cubes = [load_cube(source) for source in sources]
+    players = available_players(dict(zip(sources, cubes)))
+    if len(parts) == 1:
+        return cubes, {"players": players}
+
+    player = parts[1]
+    if player not in players:
+        raise QueryError(404, f"unknown player '{player}', available are {players}")
+    filters = parse_filters(params)
+    payload = {"player": player, "filters": {name: params[name] for name in FILTERS if name in params}}
+    by = params.get("by")
+    if len(parts) == 2:
+        if by is not None:
+            raise QueryError(400, "by is only available for a single discipline")
+        by_cube = dict(zip(sources, cubes))
+        payload["totals"] = {}
+        for name in disciplines:
+            discipline_cubes = [by_cube[source] for source in DISCIPLINES[name][0]]
+            # disciplines without competitions, e.g. the titles, are left out if filtered by competition
+            if "competition" in filters and not all("competition" in cube.columns for cube in discipline_cubes):
+                continue
+            payload["totals"][name] = _totals(name, _metrics(name, discipline_cubes, filters), player)
+        return cubes, payload
+
+    discipline = disciplines[0]
+    metrics = _metrics(discipline, cubes, filters)
+    payload["discipline"] = discipline
+    if by is None:
+        payload["totals"] = _totals(discipline, metrics, player)
+    elif by in BREAKDOWNS[discipline]:
+        payload["by"] = by
+        payload["rows"] = json_records(for_player(metrics[BREAKDOWNS[discipline][by]], player).reset_index())
+    else:
+        raise QueryError(400, f"by has to be one of {list(BREAKDOWNS[discipline])} for {discipline}")
+    return cubes, payload
+
+
+def cache_key(path, params):
+    return path.rstrip("/"), tuple(sorted(params.items()))
+
+
+class QueryServer:
+    """
+    Threaded HTTP server answering the queries of this module.
+
+    Args:
+        host: Interface the server listens on.
+        port: Port of the server, 0 for any free port.
+        cache: ResultCache of the answers, a cache with the default limits if not given.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, cache=None):
+        self.cache = cache if cache is not None else ResultCache()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are written separately, with Nagle's algorithm the body of a kept alive
+            # connection waits for the delayed ACK of the client (about 40 ms)
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                params = dict(parse_qsl(parts.query))
+                if parts.path.rstrip("/") == "/cache":
+                    self._send(200, json.dumps(server.cache.stats()).encode("utf-8"))
+                    return
+                if parts.path.rstrip("/") == "/metrics":
+                    self._send(200, prometheus_text().encode("utf-8"), PROMETHEUS_CONTENT_TYPE)
+                    return
+                status, body = server.query(parts.path, params)
+                self._send(status, body)
+
+            def _send(self, status, body, content_type="application/json; charset=utf-8"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    def query(self, path, params):
+        """
+        Answers a query from the cache or computes it.
+
+        Args:
+            path: Path of the request.
+            params: Dictionary of query parameters.
+
+        Returns:
+            status: HTTP status.
+            body: Encoded JSON answer.
+        """
+        key = cache_key(path, params)
+        try:
+            # the cubes are loaded first, an outdated answer is not returned
+            sources = self._sources(path)
+            cubes = [load_cube(source) for source in sources]
+            body = self.cache.get(key, cubes)
+            if body is not None:
+                return 200, body
+            cubes, payload = answer(path, params)
+        except QueryError as e:
+            return e.status, json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8")
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.cache.put(key, cubes, body)
+        return 200, body
+
+    @staticmethod
+    def _sources(path):
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if len(parts) == 3 and parts[2] in DISCIPLINES:
+            return DISCIPLINES[parts[2]][0]
+        return list(CUBES)
+
+    @property
+    def base_url(self):
+        """
+        Url of the server.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Starts the server in a background thread.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Runs the server in the current thread until it is interrupted.
+        """
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """
+        Stops the server.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Serves the player statistics as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--cache-entries", type=int, default=1024, help="answers kept in the cache, 0 disables it")
+    parser.add_argument("--cache-mb", type=float, default=32, help="maximal size of the cached answers in MB")
+    parser.add_argument("--warm-up", action="store_true", help="load and compute everything before accepting requests")
+    args = parser.parse_args()
+    if args.warm_up:
+        warm_up(charts=False)
+    server = QueryServer(args.host, args.port, ResultCache(args.cache_entries, int(args.cache_mb * 2 ** 20)))
+    logger.info("Serving the player statistics on %s", server.base_url)
+    server.serve_forever()
@@ -0,0 +1,124 @@
+"""
+Binning of the chart data on the server, so the data sent to the browser does not grow with the data.
+
+The goals per minute are summed to buckets of minutes, the seasons to groups of seasons and the competitions
+to the largest ones and "Andere", like the small goal types of the pie chart. Whatever is binned, a chart
+gets at most MAX_CHART_POINTS points: neighbouring points of an ordered axis are merged, otherwise only the
+largest values are kept. All functions take the values of a single player, see for_player().
+"""
+import numpy as np
+import pandas as pd
+
+from analysis.cube import season_start
+from analysis.metrics import minute_labels
+
+# maximal number of points of a chart
+MAX_CHART_POINTS = 120
+
+# label of the combined small values
+OTHER = "Andere"
+
+
+def minute_bins(minutes, width):
+    """
+    Sums the goals per minute to buckets of minutes, e.g. "1-5", "6-10", ... The buckets start again with the
+    second half and with extra time, the added time of a half is a bucket of its own ("45+" and "90+").
+
+    Args:
+        minutes: Series of goals indexed by goal_minute and added_time.
+        width: Minutes per bucket, 1 keeps the single minutes labeled by minute_labels().
+
+    Returns:
+        goals: Series of goals indexed by the label of the bucket, in the order of the game.
+    """
+    goal_minute = minutes.index.get_level_values("goal_minute")
+    added_time = minutes.index.get_level_values("added_time")
+    if width <= 1:
+        labels = minute_labels(goal_minute, added_time).array
+        return minutes.groupby(labels, observed=True).sum().rename_axis("minute")
+    minute = np.asarray(goal_minute, dtype="int64")
+    stoppage = (np.asarray(added_time, dtype="int64") > 0) & (minute <= 90)
+    # first minute and last minute of the half or of extra time
+    origin = np.select([minute <= 45, minute <= 90], [1, 46], default=91)
+    last = np.select([minute <= 45, minute <= 90], [45, 90], default=np.iinfo("int64").max)
+    start = origin + (minute - origin) // width * width
+    end = np.minimum(start + width - 1, last)
+    order = np.where(stoppage, np.where(minute <= 45, 45.5, 90.5), start)
+    labels = [
+        ("45+" if first <= 45 else "90+") if added else f"{first}-{stop}"
+        for first, stop, added in zip(start, end, stoppage)
+    ]
+    goals = pd.Series(minutes.to_numpy(), index=pd.MultiIndex.from_arrays([order, labels]), name=minutes.name)
+    return goals.groupby(level=[0, 1]).sum().droplevel(0).rename_axis("minute")
+
+
+def season_groups(per_saison, size):
+    """
+    Sums the values per season to groups of seasons, e.g. "05/06–09/10". The groups start with the years
+    divisible by the size, so a season is in the same group for every player and season range.
+
+    Args:
+        per_saison: Series indexed by season labels like "05/06".
+        size: Seasons per group, 1 keeps the single seasons.
+
+    Returns:
+        values: Series indexed by the label of the group, in the order of the seasons.
+    """
+    if size <= 1:
+        return per_saison
+    first = season_start(pd.Series(per_saison.index.astype(str))).to_numpy().astype("int64") // size * size
+    values = per_saison.groupby(first).sum()
+    values.index = [f"{year % 100:02d}/{(year + 1) % 100:02d}–{(year + size - 1) % 100:02d}/{(year + size) % 100:02d}"
+                    for year in values.index]
+    return values.rename_axis(per_saison.index.name)
+
+
+def top_k(values, k, other=OTHER):
+    """
+    Keeps the k largest values and sums the others to a single value.
+
+    Args:
+        values: Series of values, e.g. per competition.
+        k: Number of kept values, None keeps all values.
+        other: Label of the summed values.
+
+    Returns:
+        values: The kept values in their order, followed by the sum of the others unless it is 0.
+    """
+    if k is None or len(values) <= k:
+        return values
+    kept = values.index.isin(values.nlargest(k, keep="first").index)
+    top = values[kept]
+    top.index = top.index.astype(str)
+    if values[~kept].sum() == 0:
+        return top.rename_axis(values.index.name)
+    combined = pd.Series([values[~kept].sum()], index=[other], name=values.name)
+    return pd.concat([top, combined]).rename_axis(values.index.name)
+
+
+def cap_points(values, max_points=MAX_CHART_POINTS, ordered=True):
+    """
+    Limits a chart to a number of points.
+
+    Args:
+        values: Series of the chart.
+        max_points: Maximal number of points.
+        ordered: Whether the index is an ordered axis, e.g. minutes or seasons. Neighbouring points of an
+                 ordered axis are merged to ranges like "44–45+1", otherwise top_k() is applied.
+
+    Returns:
+        values: Series with at most max_points points.
+    """
+    if len(values) <= max_points:
+        return values
+    if not ordered:
+        return top_k(values, max_points - 1)
+    size = -(-len(values) // max_points)
+    groups = np.arange(len(values)) // size
+    labels = [str(label) for label in values.index]
+    merged = values.groupby(groups).sum()
+    merged.index = [
+        labels[first] if first == last else f"{labels[first]}–{labels[last]}"
+        for first, last in ((group * size, min(group * size + size, len(labels)) - 1) for group in merged.index)
+    ]
+    return merged.rename_axis(values.index.name)
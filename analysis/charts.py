@@ -0,0 +1,148 @@
+"""
+Rendering of the matplotlib charts shown on the page.
+
+A chart is drawn once for its input data and kept as encoded image bytes, so a rerun of the page only
+sends the already rendered image. The figures are created without pyplot, so they are not registered
+in the global figure manager of pyplot and do not pile up in a long running server.
+
+Matplotlib is optional and only imported when the first chart is drawn, importing it takes about half a
+second. Without it the pages show native charts instead, see sections/charts.py.
+"""
+import colorsys
+import hashlib
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+
+from analysis.instrument import span
+
+# whether matplotlib is installed, checked without importing it
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+
+# colour of the slice combining the small goal types
+OTHER_COLOR = "#9e9e9e"
+
+# colour of the bars of the leaderboards
+BAR_COLOR = "skyblue"
+
+# same options st.pyplot uses when saving a figure
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200}
+
+# maximal number of rendered charts kept in memory
+MAX_CACHED_CHARTS = 128
+
+_rendered = OrderedDict()
+_lock = threading.Lock()
+
+
+def label_color(label):
+    """
+    Returns a colour derived from the hash of a label, so a label always gets the same colour
+    independent of the other labels of a chart.
+
+    Args:
+        label: Label of a slice or bar, e.g. a goal type.
+
+    Returns:
+        color: Hex colour code.
+    """
+    if label == "Andere":
+        return OTHER_COLOR
+    hue = int(hashlib.sha256(str(label).encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+    red, green, blue = colorsys.hsv_to_rgb(hue, 0.65, 0.8)
+    return "#{:02x}{:02x}{:02x}".format(round(red * 255), round(green * 255), round(blue * 255))
+
+
+def _render(key, draw, image_format):
+    # Returns the cached image for the key or draws the figure and caches its encoded bytes.
+    key = hashlib.sha256(repr((key, image_format)).encode("utf-8")).hexdigest()
+    with _lock:
+        if key in _rendered:
+            _rendered.move_to_end(key)
+            return _rendered[key]
+
+    from matplotlib.figure import Figure
+
+    with span("render/chart"):
+        fig = Figure()
+        draw(fig)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=image_format, **SAVEFIG_OPTIONS)
+        image = buffer.getvalue()
+    if image_format == "svg":
+        image = image.decode("utf-8")
+
+    with _lock:
+        _rendered[key] = image
+        while len(_rendered) > MAX_CACHED_CHARTS:
+            _rendered.popitem(last=False)
+    return image
+
+
+def warm_up_charts():
+    """
+    Imports matplotlib and draws an empty figure, which loads the fonts and the backend of the first chart.
+    """
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    fig.subplots().set_title("warm-up")
+    fig.savefig(io.BytesIO(), format="png", **SAVEFIG_OPTIONS)
+
+
+def pie_chart(labels, values, title, image_format="png"):
+    """
+    Renders a pie chart with percentages, the colours of the slices are taken from label_color().
+
+    Args:
+        labels: Labels of the slices.
+        values: Values of the slices.
+        title: Title of the chart.
+        image_format: "png" or "svg".
+
+    Returns:
+        image: PNG bytes or SVG text of the chart.
+    """
+    labels = [str(label) for label in labels]
+    values = [int(value) for value in values]
+
+    def draw(fig):
+        fig.patch.set_facecolor('none')
+        ax = fig.subplots()
+        wedges, texts, autotexts = ax.pie(values, labels=labels, colors=[label_color(label) for label in labels], autopct='%1.1f%%', startangle=90)
+        ax.set_title(title, color='black')
+        for text in texts:  # Labels
+            text.set_color('black')
+        for autotext in autotexts:  # Percentages
+            autotext.set_color('white')
+
+    return _render(("pie", labels, values, title), draw, image_format)
+
+
+def barh_chart(names, values, xlabel, ylabel, title, image_format="png"):
+    """
+    Renders a horizontal bar chart, the bars are drawn from bottom to top in the given order.
+
+    Args:
+        names: Labels of the bars.
+        values: Values of the bars.
+        xlabel: Label of the x axis.
+        ylabel: Label of the y axis.
+        title: Title of the chart.
+        image_format: "png" or "svg".
+
+    Returns:
+        image: PNG bytes or SVG text of the chart.
+    """
+    names = [str(name) for name in names]
+    values = [int(value) for value in values]
+
+    def draw(fig):
+        ax = fig.subplots()
+        ax.barh(names, values, color=BAR_COLOR)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+
+    return _render(("barh", names, values, xlabel, ylabel, title), draw, image_format)
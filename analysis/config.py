@@ -0,0 +1,27 @@
+"""
+Locations and names of the datasets used by the analysis.
+"""
+import os
+
+# DASHBOARD_DATA_DIR points the app, the ingest step and the scrapers to another data folder,
+# e.g. the synthetic datasets of benchmarks/synthetic.py
+DATA_DIR = os.environ.get("DASHBOARD_DATA_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"
+)
+
+# folder for the typed files created by the ingest step, see analysis/ingest.py
+TYPED_DIR = os.path.join(DATA_DIR, "typed")
+
+# name of the dataset -> csv file in the data folder
+DATASETS = {
+    "achievements": "player_achievements.csv",
+    "club_goals": "player_club_goals.csv",
+    "club_performances": "player_club_performance.csv",
+    "injuries": "player_injuries.csv",
+    "international_performances": "player_international_performance.csv",
+    "penalties": "player_penalties.csv",
+    "la_liga_top_scorer": "laliga_top_scorer.csv",
+    "cl_top_scorer": "cl_top_scorer.csv",
+    "most_penalties": "all_time_most_penalties.csv",
+    "most_assists": "all_time_most_assists.csv",
+}
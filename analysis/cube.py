@@ -0,0 +1,230 @@
+"""
+Materialized aggregates of the player datasets.
+
+Everything shown on the page is a small aggregate of the row level datasets. The cubes in this module
+are built once by the ingest step, keyed by player, season and competition, and stored next to the
+typed files. The page only reads these cubes, so the cost of a rerun does not grow with the amount
+of goals or games in the row level data.
+"""
+import hashlib
+import os
+
+import pandas as pd
+
+from analysis.config import TYPED_DIR
+
+# increase when the layout of a cube changes, so outdated cube files are built again
+CUBE_VERSION = "3"
+
+
+def season_start(saison):
+    """
+    Converts the different season notations of the datasets into the year the season started.
+
+    Args:
+        saison: Series of seasons, either as year ("2024", 2004) or as season ("23/24").
+
+    Returns:
+        season: Series of start years.
+    """
+    text = saison.astype("string")
+    split = text.str.split("/", n=1)
+    first = pd.to_numeric(split.str[0], errors="coerce")
+    # "23/24" -> 2023, "99/00" -> 1999
+    short = split.str.len() > 1
+    first = first.where(~short, first + 2000)
+    first = first.where(~(short & (first > 2070)), first - 100)
+    return first.astype("int16")
+
+
+def season_of_date(date):
+    """
+    Returns the season of a game date. Seasons start in July.
+
+    Args:
+        date: Series of game dates.
+
+    Returns:
+        season: Series of start years.
+        saison: Series of season labels, e.g. "05/06".
+    """
+    season = (date.dt.year - (date.dt.month < 7)).astype("int16")
+    saison = (season % 100).map("{:02d}".format) + "/" + ((season + 1) % 100).map("{:02d}".format)
+    return season, saison.astype("category")
+
+
+def _sum(df, keys, measures):
+    return df.groupby(keys, observed=True, sort=True)[measures].sum().reset_index()
+
+
+def _size(df, keys, name):
+    return df.groupby(keys, observed=True, sort=True).size().rename(name).reset_index()
+
+
+def _category(df, columns):
+    for column in columns:
+        df[column] = df[column].astype("category")
+    return df
+
+
+def _goal_cube(club_goals, column):
+    goals = club_goals.assign(season=club_goals["saison"].astype("int16"), competition=club_goals["league"])
+    keys = ["player_name", "season", "venue", "competition"] + ([column] if isinstance(column, str) else column)
+    cube = _size(goals, keys, "goals")
+    cube["goals"] = cube["goals"].astype("int32")
+    # all club goals, the source is added after the groupby instead of once per goal
+    cube.insert(2, "source", pd.Categorical(["Club"] * len(cube)))
+    return cube
+
+
+def build_goal_types(data):
+    """
+    Club goals per player, season, venue, league and goal type.
+    """
+    return _goal_cube(data["club_goals"], "goal_type")
+
+
+def build_goal_positions(data):
+    """
+    Club goals per player, season, venue, league and position of the player.
+    """
+    return _goal_cube(data["club_goals"], "player_position")
+
+
+def build_goal_minutes(data):
+    """
+    Club goals per player, season, venue, league, minute and added time.
+    """
+    return _goal_cube(data["club_goals"], ["goal_minute", "added_time"])
+
+
+def build_penalties(data):
+    """
+    Penalties taken and scored per player, season, competition type and competition.
+    """
+    penalties = data["penalties"]
+    # the competition type of a penalty is either "Club" or "International"
+    penalties = penalties.assign(season=season_start(penalties["saison"]), source=penalties["competition_type"],
+                                 scored=penalties["has_scored"].astype("int32"), taken=1)
+    keys = ["player_name", "season", "saison", "source", "competition_type", "competition"]
+    cube = _sum(penalties, keys, ["taken", "scored"])
+    return cube.astype({"taken": "int32", "scored": "int32"})
+
+
+def build_performances(data):
+    """
+    Games, goals, assists and cards per player, season, venue and competition, for club and international games.
+    The club performances are totals of a season, their venue is unknown ("").
+    """
+    # player names and competitions share their vocabulary in both datasets, so the concat below keeps
+    # their categories and the groupby runs on the codes
+    club = data["club_performances"]
+    club = pd.DataFrame({
+        "player_name": club["player_name"],
+        "season": season_start(club["saison"]),
+        "saison": club["saison"].astype(str),
+        "source": "Club",
+        "venue": "",
+        "competition_type": club["competition_type"],
+        "competition": club["competition"],
+        "games": club["games_played"],
+        "entries": 1,
+        "goals": club["goals"],
+        "assists": club["assists"],
+        "yellow_cards": club["yellow_cards"],
+        "yellow_red_cards": club["yellow_red_cards"],
+        "red_cards": club["red_cards"],
+    })
+
+    international = data["international_performances"]
+    season, saison = season_of_date(international["date"])
+    international = pd.DataFrame({
+        "player_name": international["player_name"],
+        "season": season,
+        "saison": saison.astype(str),
+        "source": "International",
+        "venue": international["venue"].astype(str),
+        # international games are shown per tournament in the card tables
+        "competition_type": international["tournament"],
+        "competition": international["tournament"],
+        "games": 1,
+        "entries": 1,
+        "goals": international["goals"],
+        "assists": international["assists_amount"],
+        "yellow_cards": international["yellow_card"].astype("int16"),
+        "yellow_red_cards": international["yellow_red_card"].astype("int16"),
+        "red_cards": international["red_card"].astype("int16"),
+    })
+
+    keys = ["player_name", "season", "saison", "source", "venue", "competition_type", "competition"]
+    measures = ["games", "entries", "goals", "assists", "yellow_cards", "yellow_red_cards", "red_cards"]
+    rows = _category(pd.concat([club, international], ignore_index=True), keys[2:] + ["player_name"])
+    cube = _sum(rows, keys, measures)
+    return cube.astype({measure: "int32" for measure in measures})
+
+
+def build_titles(data):
+    """
+    Titles won per player, season and title.
+    """
+    achievements = data["achievements"]
+    achievements = achievements.assign(season=season_start(achievements["year"]))
+    cube = _size(achievements, ["player_name", "season", "year", "title"], "titles")
+    cube["titles"] = cube["titles"].astype("int32")
+    return cube
+
+
+# name of the cube -> (datasets the cube is built from, function building the cube)
+CUBES = {
+    "goal_types": (["club_goals"], build_goal_types),
+    "goal_positions": (["club_goals"], build_goal_positions),
+    "goal_minutes": (["club_goals"], build_goal_minutes),
+    "penalties": (["penalties"], build_penalties),
+    "performances": (["club_performances", "international_performances"], build_performances),
+    "titles": (["achievements"], build_titles),
+}
+
+
+def cube_path(name, typed_dir=TYPED_DIR):
+    """
+    Returns the path of the file of a cube.
+
+    Args:
+        name: Name of the cube.
+        typed_dir: Folder containing the typed files.
+
+    Returns:
+        path: Path of the cube file.
+    """
+    return os.path.join(typed_dir, "cube_" + name + ".arrow")
+
+
+def cube_key(name, source_digests):
+    """
+    Returns the key identifying the content of a cube, derived from the hashes of its source datasets.
+
+    Args:
+        name: Name of the cube.
+        source_digests: Dictionary of dataset name and hash of its csv file.
+
+    Returns:
+        key: Hash of the cube version and the source hashes.
+    """
+    sources, _ = CUBES[name]
+    text = CUBE_VERSION + ";" + ";".join(f"{source}={source_digests[source]}" for source in sources)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_cube(name, data):
+    """
+    Builds a cube from the typed datasets.
+
+    Args:
+        name: Name of the cube.
+        data: Dictionary of dataset name and typed dataframe, must contain the sources of the cube.
+
+    Returns:
+        cube: Dataframe of the cube.
+    """
+    _, build = CUBES[name]
+    return build(data)
@@ -0,0 +1,174 @@
+"""
+Dependency graph from the csv files of the data folder to everything computed from them, for incremental
+recomputation after a dataset was refreshed or appended.
+
+Every node of the graph is one cached result of the process:
+- "csv:<dataset>": content hash of a csv file
+- "dataset:<dataset>": typed dataset; the player datasets share the vocabularies of all player csv files
+- "cube:<cube>": materialized aggregate, see analysis/cube.py
+- "metrics:<discipline>": metrics of a discipline, see analysis/metrics.py
+- "season_index" and "season_range": prefix sums and first and last season of the filters, see analysis/ranges.py
+- "index:<drill-down>": inverted index of a drill-down, see analysis/lookup.py
+refresh() checks the csv files and recomputes only the nodes downstream of a changed file. Every node is
+cached by the identity of its inputs, so a recomputed node that returns the same object as before, e.g. a
+cube whose files did not change, stops the propagation. Each change increases the version of the node;
+pages compare the versions of the nodes they show, see sections/common.py and sections/updates.py.
+
+watch_data() runs refresh() in a background thread every DATA_WATCH_SECONDS seconds (5 by default, 0 turns
+it off), so a refreshed dataset is recomputed once for the process while the server keeps running.
+
+Usage:
+    python -m analysis.dependencies penalties
+"""
+import logging
+import os
+import sys
+import threading
+import time
+
+from analysis.config import DATASETS
+from analysis.cube import CUBES
+from analysis.ingest import VOCABULARY_SOURCES
+from analysis.instrument import span
+from analysis.loading import dataset_digest, load_cube, load_dataset
+from analysis.lookup import DRILL_DOWNS, inverted_index
+from analysis.metrics import DISCIPLINES, discipline_metrics
+from analysis.ranges import INDEX_CUBES, season_index
+
+logger = logging.getLogger(__name__)
+
+# seconds between two checks of the csv files, 0 turns the watcher off
+WATCH_SECONDS = float(os.environ.get("DATA_WATCH_SECONDS", "5"))
+
+
+def _season_range():
+    index = season_index()
+    return index.first_season, index.last_season
+
+
+def _nodes():
+    # node -> (nodes it is computed from, function computing it), every node follows its inputs
+    nodes = {f"csv:{name}": ([], lambda name=name: dataset_digest(name)) for name in DATASETS}
+    for name in DATASETS:
+        # a new value in one player dataset changes the vocabularies of all of them, see analysis/ingest.py
+        sources = VOCABULARY_SOURCES if name in VOCABULARY_SOURCES else [name]
+        nodes[f"dataset:{name}"] = ([f"csv:{source}" for source in sources], lambda name=name: load_dataset(name))
+    for name, (sources, _) in CUBES.items():
+        # a cube is identified by the hashes of its csv files only, see cube_key()
+        nodes[f"cube:{name}"] = ([f"csv:{source}" for source in sources], lambda name=name: load_cube(name))
+    for name, (cubes, _) in DISCIPLINES.items():
+        nodes[f"metrics:{name}"] = ([f"cube:{cube}" for cube in cubes], lambda name=name: discipline_metrics(name))
+    nodes["season_index"] = ([f"cube:{cube}" for cube in INDEX_CUBES], season_index)
+    nodes["season_range"] = (["season_index"], _season_range)
+    for name, (dataset, column, _) in DRILL_DOWNS.items():
+        nodes[f"index:{name}"] = ([f"dataset:{dataset}"], lambda dataset=dataset, column=column: inverted_index(dataset, column))
+    return nodes
+
+
+NODES = _nodes()
+
+# node -> result of its last computation by refresh() and number of changes since the first one
+_values = {}
+_versions = {}
+_lock = threading.Lock()
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def downstream(nodes):
+    """
+    Returns the nodes computed from the given nodes, directly or indirectly.
+
+    Args:
+        nodes: Names of nodes, e.g. ["csv:penalties"].
+
+    Returns:
+        nodes: Set of the given and all dependent nodes.
+    """
+    affected = set(nodes)
+    for node, (inputs, _) in NODES.items():
+        if affected.intersection(inputs):
+            affected.add(node)
+    return affected
+
+
+def _same(old, new):
+    # hashes and season ranges are compared by value, cached results by identity
+    return old is new or (isinstance(new, (str, tuple)) and old == new)
+
+
+def refresh():
+    """
+    Checks the csv files and recomputes the nodes depending on a changed file. Nodes that were never computed
+    by refresh() are computed as well, so the first call computes the whole graph.
+
+    Returns:
+        changed: Set of the nodes whose result changed, empty on the first call.
+    """
+    with _lock, span("refresh/data"):
+        changed = set()
+        for node, (inputs, compute) in NODES.items():
+            if inputs and node in _values and not changed.intersection(inputs):
+                continue
+            value = compute()
+            if node in _values and not _same(_values[node], value):
+                changed.add(node)
+                _versions[node] = _versions.get(node, 0) + 1
+            _values[node] = value
+    if changed:
+        logger.info("Recomputed after a change of %s: %s",
+                    ", ".join(sorted(node[4:] for node in changed if node.startswith("csv:"))),
+                    ", ".join(sorted(node for node in changed if not node.startswith("csv:"))))
+    return changed
+
+
+def versions(nodes):
+    """
+    Returns the versions of nodes, a version increases with every change seen by refresh().
+
+    Args:
+        nodes: Names of nodes.
+
+    Returns:
+        versions: Tuple of the versions in the order of the nodes.
+    """
+    return tuple(_versions.get(node, 0) for node in nodes)
+
+
+def watch_data(seconds=WATCH_SECONDS):
+    """
+    Starts a background thread running refresh() every few seconds, only once per process.
+
+    Args:
+        seconds: Seconds between two checks, 0 does not start the thread.
+
+    Returns:
+        thread: The running thread or None.
+    """
+    global _watcher
+    if seconds <= 0:
+        return None
+    with _watcher_lock:
+        if _watcher is not None:
+            return _watcher
+
+        def run():
+            # the first check does not compete with the first session, warm_up() already computed the graph
+            while True:
+                time.sleep(seconds)
+                try:
+                    refresh()
+                except Exception:
+                    # e.g. a csv file replaced while it was read, checked again next time
+                    logger.exception("Could not refresh the datasets")
+
+        _watcher = threading.Thread(target=run, name="data-watcher", daemon=True)
+        _watcher.start()
+        return _watcher
+
+
+if __name__ == "__main__":
+    # prints the nodes depending on the given datasets
+    for node in sorted(downstream([f"csv:{name}" for name in sys.argv[1:] or DATASETS]), key=list(NODES).index):
+        print(node)
@@ -0,0 +1,598 @@
+"""
+Ingest step that turns the raw csv files of the data folder into typed columnar files.
+
+The scrapers store every value as text as it is shown on transfermarkt, e.g. minutes played as
+"1.486'" or a yellow card as the minute it was given. This module declares a schema for every
+dataset, normalizes the raw values once and stores the result as an uncompressed Arrow IPC file
+in data/typed. These files are read memory mapped, so the app does not have to fix types on every run.
+The aggregates shown on the page are built from the typed datasets in the same step.
+
+Repeated text is stored dictionary encoded. Columns holding the same kind of value, e.g. the teams and
+opponents of all datasets, share one vocabulary (data/typed/vocabularies.arrow), so their categories
+have the same integer codes in every dataset and joins, concats and groupbys across datasets work on
+the codes instead of the text.
+
+Usage:
+    python -m analysis.ingest
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from analysis import cube
+from analysis.config import DATA_DIR, DATASETS, TYPED_DIR
+
+logger = logging.getLogger(__name__)
+
+# Column types used in the schemas:
+#   category  repeated text, stored dictionary encoded, with a shared vocabulary if listed in VOCABULARIES
+#   string    free text
+#   int*/Int* integer (Int* allows missing values)
+#   bool      boolean
+#   date      date of a game or injury
+#   minutes   minutes played as shown on transfermarkt, e.g. "1.486'" -> 1486
+#   minute    minute in a game, e.g. "64'" -> 64, missing if empty (Int8)
+#   card      minute a card was given, stored as boolean flag plus a "<column>_minute" column
+SCHEMAS = {
+    "achievements": {
+        "player_name": "category",
+        "year": "category",
+        "title": "category",
+        "team": "category",
+    },
+    "club_goals": {
+        "player_name": "category",
+        "game_id": "int64",
+        "saison": "int16",
+        "league": "category",
+        "gameday": "category",
+        "venue": "category",
+        "team": "category",
+        "team_table_position": "Int8",
+        "opponent": "category",
+        "opponent_table_position": "Int8",
+        "result": "string",
+        "player_position": "category",
+        "goal_minute": "int8",
+        "goal_score": "string",
+        "goal_type": "category",
+        "goal_added_time": "int8",
+        "added_time": "int8",
+    },
+    "club_performances": {
+        "player_name": "category",
+        "saison": "category",
+        "competition_type": "category",
+        "competition": "category",
+        "club": "category",
+        "games_played": "int8",
+        "goals": "int8",
+        "assists": "int8",
+        "owngoals": "int8",
+        "substitute_in": "int8",
+        "substitute_out": "int8",
+        "yellow_cards": "int8",
+        "yellow_red_cards": "int8",
+        "red_cards": "int8",
+        "penalties": "int8",
+        "minutes_played": "minutes",
+    },
+    "injuries": {
+        "player_name": "category",
+        "saison": "category",
+        "injury_description": "category",
+        "start_date": "date",
+        "end_date": "date",
+        "days": "int16",
+        "missed_games": "int16",
+    },
+    "international_performances": {
+        "player_name": "category",
+        "game_id": "int64",
+        "player_current_club": "category",
+        "tournament": "category",
+        "gameday": "category",
+        "venue_country": "category",
+        "venue_city": "category",
+        "venue": "category",
+        "date": "date",
+        "team": "category",
+        "opponent": "category",
+        "result": "string",
+        "player_position": "category",
+        "goals": "int8",
+        "assists_amount": "int8",
+        "own_goals_amount": "int8",
+        "substitute_in": "minute",
+        "substitute_out": "minute",
+        "yellow_card": "card",
+        "yellow_red_card": "card",
+        "red_card": "card",
+        "minutes_played": "minutes",
+    },
+    "penalties": {
+        "player_name": "category",
+        "game_id": "int64",
+        "saison": "category",
+        "competition_type": "category",
+        "competition": "category",
+        "team": "category",
+        "opponent": "category",
+        "date": "date",
+        "result": "string",
+        "minute": "minute",
+        "score": "string",
+        "goalkeeper": "category",
+        "has_scored": "bool",
+    },
+    "la_liga_top_scorer": {
+        "name": "string",
+        "appearances": "int32",
+        "minutes_played": "minutes",
+        "goals": "int32",
+    },
+    "cl_top_scorer": {
+        "name": "string",
+        "seasons": "int16",
+        "appearances": "int32",
+        "goals": "int32",
+    },
+    "most_penalties": {
+        "player_name": "string",
+        "penalties_scored": "int32",
+    },
+    "most_assists": {
+        "player_name": "string",
+        "assists": "int32",
+        "appearances": "int32",
+    },
+}
+
+# name of the vocabulary -> columns sharing it, as (dataset, column)
+VOCABULARIES = {
+    "players": [
+        (name, "player_name")
+        for name in ["achievements", "club_goals", "club_performances", "injuries", "international_performances", "penalties"]
+    ],
+    "teams": [
+        ("achievements", "team"),
+        ("club_goals", "team"),
+        ("club_goals", "opponent"),
+        ("club_performances", "club"),
+        ("international_performances", "player_current_club"),
+        ("international_performances", "team"),
+        ("international_performances", "opponent"),
+        ("penalties", "team"),
+        ("penalties", "opponent"),
+    ],
+    # the international games are shown per tournament where the club games are shown per competition type
+    "competitions": [
+        ("club_goals", "league"),
+        ("club_performances", "competition_type"),
+        ("club_performances", "competition"),
+        ("international_performances", "tournament"),
+        ("penalties", "competition_type"),
+        ("penalties", "competition"),
+    ],
+    "seasons": [("club_performances", "saison"), ("injuries", "saison"), ("penalties", "saison")],
+    "positions": [("club_goals", "player_position"), ("international_performances", "player_position")],
+    "venues": [("club_goals", "venue"), ("international_performances", "venue")],
+}
+
+# datasets the vocabularies are built from
+VOCABULARY_SOURCES = sorted({name for columns in VOCABULARIES.values() for name, _ in columns})
+
+# file of the vocabularies in the folder of the typed files
+VOCABULARY_FILE = "vocabularies.arrow"
+
+
+def vocabulary_columns(name):
+    """
+    Returns the columns of a dataset that share a vocabulary.
+
+    Args:
+        name: Name of the dataset.
+
+    Returns:
+        columns: Dictionary of column and name of its vocabulary.
+    """
+    return {
+        column: vocabulary
+        for vocabulary, columns in VOCABULARIES.items()
+        for dataset, column in columns
+        if dataset == name
+    }
+
+
+def schema_version(name):
+    """
+    Returns a short hash of the schema of a dataset, used to detect typed files written with an older schema.
+
+    Args:
+        name: Name of the dataset.
+
+    Returns:
+        version: Hash of the schema.
+    """
+    return hashlib.sha256(repr(sorted(SCHEMAS[name].items())).encode("utf-8")).hexdigest()[:16]
+
+
+def typed_path(name, typed_dir=TYPED_DIR):
+    """
+    Returns the path of the typed file for a dataset.
+
+    Args:
+        name: Name of the dataset.
+        typed_dir: Folder containing the typed files.
+
+    Returns:
+        path: Path of the typed file.
+    """
+    return os.path.join(typed_dir, name + ".arrow")
+
+
+def _text(series):
+    return series.astype("string").str.strip()
+
+
+def _to_minutes(series):
+    # "1.486'" -> 1486, "-" or missing -> 0
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).astype("int32")
+    text = _text(series).str.replace("'", "", regex=False).str.replace(".", "", regex=False)
+    return pd.to_numeric(text.replace("-", "0"), errors="coerce").fillna(0).astype("int32")
+
+
+def _to_minute(series):
+    # "64'" -> 64, empty -> <NA>
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("Int8")
+    text = _text(series).str.rstrip("'")
+    return pd.to_numeric(text, errors="coerce").astype("Int8")
+
+
+def _to_bool(series):
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    return _text(series).str.lower().map({"true": True, "false": False}).fillna(False).astype(bool)
+
+
+def _to_integer(series, kind):
+    values = pd.to_numeric(series, errors="coerce")
+    # numpy wraps values that do not fit into the compact types around instead of failing
+    limits = np.iinfo(kind.lower())
+    if values.min() < limits.min or values.max() > limits.max:
+        raise ValueError(f"values of column '{series.name}' do not fit into {kind}")
+    return values.astype(kind)
+
+
+def _to_category(series, categories=None):
+    text = _text(series)
+    if categories is None:
+        return text.astype("category")
+    values = pd.Categorical(text, categories=categories)
+    if ((values.codes == -1) & text.notna().to_numpy()).any():
+        raise ValueError(f"column '{series.name}' has values missing in its vocabulary")
+    return pd.Series(values, index=series.index)
+
+
+def normalize(name, df, vocabularies=None):
+    """
+    Converts the raw values of a dataset into the types declared in its schema.
+
+    Args:
+        name: Name of the dataset.
+        df: Dataframe as read from the csv file.
+        vocabularies: Dictionary of vocabulary name and categories, see build_vocabularies(). The shared
+            columns get the categories of their vocabulary, all other categories are built from the dataset.
+
+    Returns:
+        df: Dataframe with typed columns.
+    """
+    schema = SCHEMAS[name]
+    shared = vocabulary_columns(name) if vocabularies is not None else {}
+    columns = {}
+    for column, kind in schema.items():
+        series = df[column]
+        if kind == "category":
+            columns[column] = _to_category(series, vocabularies[shared[column]] if column in shared else None)
+        elif kind == "string":
+            columns[column] = _text(series)
+        elif kind == "bool":
+            columns[column] = _to_bool(series)
+        elif kind == "date":
+            columns[column] = pd.to_datetime(series, format="%Y-%m-%d")
+        elif kind == "minutes":
+            columns[column] = _to_minutes(series)
+        elif kind == "minute":
+            columns[column] = _to_minute(series)
+        elif kind == "card":
+            columns[column] = series.notna()
+            columns[column + "_minute"] = _to_minute(series)
+        else:
+            columns[column] = _to_integer(series, kind)
+    return pd.DataFrame(columns)
+
+
+def write_arrow(df, path, metadata):
+    """
+    Stores a dataframe as an uncompressed Arrow IPC file. The file is written to a temporary path first
+    and then moved into place, so readers never see a partially written file.
+
+    Args:
+        df: Dataframe to store.
+        path: Path of the Arrow file.
+        metadata: Dictionary of text keys and values stored in the schema of the file.
+
+    Returns:
+        path: Path of the Arrow file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        **{key.encode("utf-8"): value.encode("utf-8") for key, value in metadata.items()},
+    })
+    temp_path = path + ".tmp"
+    with pa.OSFile(temp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(temp_path, path)
+    return path
+
+
+def read_arrow(path, metadata):
+    """
+    Reads an Arrow IPC file memory mapped. Numeric columns without missing values are not copied.
+
+    Args:
+        path: Path of the Arrow file.
+        metadata: Dictionary of text keys and values the file has to contain, otherwise it is outdated.
+
+    Returns:
+        df: Dataframe stored in the file or None if the file is missing or outdated.
+    """
+    if not os.path.exists(path):
+        return None
+    source = pa.memory_map(path, "r")
+    reader = pa.ipc.open_file(source)
+    stored = reader.schema.metadata or {}
+    for key, value in metadata.items():
+        if stored.get(key.encode("utf-8")) != value.encode("utf-8"):
+            return None
+    return reader.read_all().to_pandas(split_blocks=True)
+
+
+def vocabulary_key(source_digests):
+    """
+    Returns the key identifying the vocabularies built from the current content of their source datasets.
+
+    Args:
+        source_digests: Dictionary of dataset name and hash of its csv file, must contain VOCABULARY_SOURCES.
+
+    Returns:
+        key: Hash of the vocabulary definition and the source hashes.
+    """
+    text = repr(sorted(VOCABULARIES.items())) + ";" + ";".join(f"{name}={source_digests[name]}" for name in VOCABULARY_SOURCES)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def vocabulary_digest(name, vocabularies):
+    """
+    Returns a hash of the vocabularies used by a dataset, stored with its typed file.
+
+    Args:
+        name: Name of the dataset.
+        vocabularies: Dictionary of vocabulary name and categories.
+
+    Returns:
+        digest: Hash of the categories of the vocabularies of the dataset.
+    """
+    used = {vocabulary: list(vocabularies[vocabulary]) for vocabulary in sorted(set(vocabulary_columns(name).values()))}
+    return hashlib.sha256(json.dumps(used, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def build_vocabularies(frames):
+    """
+    Collects the categories of every vocabulary from the columns sharing it.
+
+    Args:
+        frames: Dictionary of dataset name and dataframe as read from the csv file, must contain VOCABULARY_SOURCES.
+
+    Returns:
+        vocabularies: Dictionary of vocabulary name and sorted list of its categories.
+    """
+    return {
+        vocabulary: sorted(set().union(*(_text(frames[name][column]).dropna().unique() for name, column in columns)))
+        for vocabulary, columns in VOCABULARIES.items()
+    }
+
+
+def write_vocabularies(vocabularies, key, typed_dir=TYPED_DIR):
+    """
+    Stores the vocabularies as Arrow file, one row per category.
+
+    Args:
+        vocabularies: Dictionary of vocabulary name and categories.
+        key: Key of the vocabularies, see vocabulary_key().
+        typed_dir: Folder containing the typed files.
+
+    Returns:
+        path: Path of the vocabulary file.
+    """
+    df = pd.DataFrame({
+        "vocabulary": [vocabulary for vocabulary, categories in vocabularies.items() for _ in categories],
+        "category": [category for categories in vocabularies.values() for category in categories],
+    })
+    return write_arrow(df, os.path.join(typed_dir, VOCABULARY_FILE), {"vocabulary_key": key})
+
+
+def read_vocabularies(key, typed_dir=TYPED_DIR):
+    """
+    Reads the stored vocabularies.
+
+    Args:
+        key: Key the vocabularies have to be stored with, otherwise they are outdated.
+        typed_dir: Folder containing the typed files.
+
+    Returns:
+        vocabularies: Dictionary of vocabulary name and categories or None if the file is missing or outdated.
+    """
+    df = read_arrow(os.path.join(typed_dir, VOCABULARY_FILE), {"vocabulary_key": key})
+    if df is None:
+        return None
+    vocabularies = {vocabulary: [] for vocabulary in VOCABULARIES}
+    for vocabulary, category in zip(df["vocabulary"], df["category"]):
+        vocabularies[vocabulary].append(category)
+    return vocabularies
+
+
+def load_vocabularies(paths, source_digests, typed_dir=TYPED_DIR):
+    """
+    Returns the vocabularies for the current content of their source datasets. If the stored vocabularies
+    are missing or outdated, they are built from the shared columns of the csv files and stored again.
+
+    Args:
+        paths: Dictionary of dataset name and path of its csv file, must contain VOCABULARY_SOURCES.
+        source_digests: Dictionary of dataset name and hash of its csv file.
+        typed_dir: Folder containing the typed files.
+
+    Returns:
+        vocabularies: Dictionary of vocabulary name and categories.
+    """
+    key = vocabulary_key(source_digests)
+    vocabularies = read_vocabularies(key, typed_dir)
+    if vocabularies is not None:
+        return vocabularies
+
+    frames = {name: pd.read_csv(paths[name], usecols=list(vocabulary_columns(name))) for name in VOCABULARY_SOURCES}
+    vocabularies = build_vocabularies(frames)
+    try:
+        path = write_vocabularies(vocabularies, key, typed_dir)
+        logger.info("Built vocabularies into %s", path)
+    except OSError as e:
+        logger.warning("Could not write vocabularies: %s", e)
+    return vocabularies
+
+
+def _typed_metadata(name, vocabularies):
+    metadata = {"schema_version": schema_version(name)}
+    if vocabularies is not None:
+        metadata["vocabulary_sha256"] = vocabulary_digest(name, vocabularies)
+    return metadata
+
+
+def write_typed(name, df, source_digest, typed_dir=TYPED_DIR, vocabularies=None):
+    """
+    Stores a normalized dataset as typed file.
+
+    Args:
+        name: Name of the dataset.
+        df: Normalized dataframe.
+        source_digest: Hash of the csv file the dataframe was created from.
+        typed_dir: Folder containing the typed files.
+        vocabularies: Vocabularies the dataframe was normalized with, if any.
+
+    Returns:
+        path: Path of the typed file.
+    """
+    metadata = {"source_sha256": source_digest, **_typed_metadata(name, vocabularies)}
+    return write_arrow(df, typed_path(name, typed_dir), metadata)
+
+
+def read_typed(name, source_digest=None, typed_dir=TYPED_DIR, vocabularies=None):
+    """
+    Reads the typed file of a dataset memory mapped.
+
+    Args:
+        name: Name of the dataset.
+        source_digest: If given, the typed file is only used if it was created from a csv file with this hash.
+        typed_dir: Folder containing the typed files.
+        vocabularies: If given, the typed file is only used if it was normalized with these vocabularies.
+
+    Returns:
+        df: Dataframe of the dataset or None if there is no up to date typed file.
+    """
+    metadata = _typed_metadata(name, vocabularies)
+    if source_digest is not None:
+        metadata["source_sha256"] = source_digest
+    return read_arrow(typed_path(name, typed_dir), metadata)
+
+
+def load_typed(name, content, source_digest, typed_dir=TYPED_DIR, vocabularies=None):
+    """
+    Returns the typed dataframe for the content of a csv file. If the typed file is missing or outdated,
+    the csv content is normalized and the typed file is written again.
+
+    Args:
+        name: Name of the dataset.
+        content: Raw bytes of the csv file.
+        source_digest: Hash of the csv content.
+        typed_dir: Folder containing the typed files.
+        vocabularies: Shared vocabularies of the categorical columns, see load_vocabularies().
+
+    Returns:
+        df: Typed dataframe of the dataset.
+    """
+    df = read_typed(name, source_digest, typed_dir, vocabularies)
+    if df is not None:
+        return df
+
+    df = normalize(name, pd.read_csv(io.BytesIO(content)), vocabularies)
+    try:
+        write_typed(name, df, source_digest, typed_dir, vocabularies)
+        # read back memory mapped, so the process uses the same representation as on a warm start
+        df = read_typed(name, source_digest, typed_dir, vocabularies)
+        logger.info("Ingested dataset '%s' into %s", name, typed_path(name, typed_dir))
+    except OSError as e:
+        logger.warning("Could not write typed file for dataset '%s': %s", name, e)
+    return df
+
+
+def ingest_all(data_dir=DATA_DIR, typed_dir=TYPED_DIR):
+    """
+    Converts every csv file of the data folder into a typed file and builds the cubes, see analysis/cube.py.
+
+    Args:
+        data_dir: Folder containing the csv files.
+        typed_dir: Folder the typed files are written to.
+
+    Returns:
+        paths: Dictionary of dataset name, "vocabularies" or "cube:<cube>" and path of the written file.
+    """
+    paths = {}
+    raw = {}
+    digests = {}
+    for name, filename in DATASETS.items():
+        with open(os.path.join(data_dir, filename), "rb") as file:
+            content = file.read()
+        digests[name] = hashlib.sha256(content).hexdigest()
+        raw[name] = pd.read_csv(io.BytesIO(content))
+
+    vocabularies = build_vocabularies(raw)
+    paths["vocabularies"] = write_vocabularies(vocabularies, vocabulary_key(digests), typed_dir)
+    data = {}
+    for name in DATASETS:
+        shared = vocabularies if name in VOCABULARY_SOURCES else None
+        data[name] = normalize(name, raw[name], shared)
+        paths[name] = write_typed(name, data[name], digests[name], typed_dir, shared)
+
+    for name in cube.CUBES:
+        path = cube.cube_path(name, typed_dir)
+        # cubes may be named like a dataset, e.g. penalties
+        paths[f"cube:{name}"] = write_arrow(cube.build_cube(name, data), path, {"cube_key": cube.cube_key(name, digests)})
+    return paths
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for name, path in ingest_all().items():
+        print(f"{name}: {path}")
+    sys.exit(0)
@@ -0,0 +1,332 @@
+"""
+Named timing and memory spans around loading, computing and rendering.
+
+A span is opened with `with span("goals/metrics"):`. Spans are only measured if they are recorded for
+the current thread, e.g. by the debug panel of the page for its session, or if INSTRUMENTATION=1 is set
+for the whole process; otherwise span() returns a shared no-op context manager. Measured spans are added
+to process wide totals per span name, which are written as JSON log lines and served in the Prometheus
+text format, by analysis/api.py under /metrics or by serve_metrics() on a port of its own.
+Peak memory is only measured while tracemalloc is tracing. It slows down every allocation of the process,
+so it is only started for the whole process with TRACE_MEMORY=1, never by a single session.
+The points and the size of the data sent for every chart are recorded the same way, see record_payload().
+
+Usage:
+    INSTRUMENTATION=1 TRACE_MEMORY=1 METRICS_PORT=9108 streamlit run app.py
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# measure the spans of all threads, not only the recorded ones
+ENABLED = os.environ.get("INSTRUMENTATION") == "1"
+
+# trace the memory allocations of the process for the peak memory of the spans, see trace_memory_from_env()
+TRACE_MEMORY = os.environ.get("TRACE_MEMORY") == "1"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_DISABLED = contextlib.nullcontext()
+
+
+class _Local(threading.local):
+    # defaults as class attributes, a missing attribute of a thread local is slow to look up
+    recorder = None
+    stack = None
+
+
+_local = _Local()
+
+# span name -> [count, seconds, largest peak memory increase in bytes]
+_totals = {}
+_totals_lock = threading.Lock()
+
+# chart name -> (points, bytes) of the last time it was sent
+_payloads = {}
+
+_server = None
+_server_lock = threading.Lock()
+
+
+class Span:
+    """
+    Measured span.
+
+    Args:
+        name: Name of the span.
+        depth: Number of enclosing spans.
+    """
+
+    __slots__ = ("name", "depth", "seconds", "peak_bytes")
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.seconds = 0.0
+        # increase of the traced memory at its peak, None without tracemalloc
+        self.peak_bytes = None
+
+
+class Recorder:
+    """
+    Spans of a thread in the order they were opened, e.g. the spans of one rerun of the page.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.stack = []
+        # (chart name, points, bytes) in the order the charts were sent
+        self.payloads = []
+
+
+class _Measure:
+    __slots__ = ("span", "recorder", "start", "memory", "peak")
+
+    def __init__(self, name, recorder):
+        stack = _stack(recorder)
+        self.span = Span(name, len(stack))
+        self.recorder = recorder
+        self.memory = None
+        if recorder is not None:
+            recorder.spans.append(self.span)
+
+    def __enter__(self):
+        stack = _stack(self.recorder)
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # the peak is reset for this span, the enclosing span keeps the peak seen so far
+            if stack and stack[-1].memory is not None:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.memory, self.peak = current, current
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self.span
+
+    def __exit__(self, *exc):
+        span = self.span
+        span.seconds = time.perf_counter() - self.start
+        stack = _stack(self.recorder)
+        stack.pop()
+        if self.memory is not None and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], self.peak)
+            span.peak_bytes = peak - self.memory
+            if stack and stack[-1].memory is not None:
+                stack[-1].peak = max(stack[-1].peak, peak)
+        _add(span)
+        return False
+
+
+def _stack(recorder):
+    if recorder is not None:
+        return recorder.stack
+    if _local.stack is None:
+        _local.stack = []
+    return _local.stack
+
+
+def _add(span):
+    with _totals_lock:
+        totals = _totals.setdefault(span.name, [0, 0.0, 0])
+        totals[0] += 1
+        totals[1] += span.seconds
+        totals[2] = max(totals[2], span.peak_bytes or 0)
+    if ENABLED:
+        logger.info(json.dumps({"span": span.name, "depth": span.depth, "ms": round(span.seconds * 1000, 3),
+                                "peak_bytes": span.peak_bytes}))
+
+
+def span(name):
+    """
+    Returns a context manager measuring the time and peak memory of a block.
+
+    Args:
+        name: Name of the span, e.g. "goals/metrics".
+
+    Returns:
+        context: Context manager returning the Span, a no-op if nothing is recorded.
+    """
+    recorder = _local.recorder
+    if recorder is None and not ENABLED:
+        return _DISABLED
+    return _Measure(name, recorder)
+
+
+def measured():
+    """
+    Returns whether the current thread is measured, e.g. to skip measurements that are costly themselves.
+
+    Returns:
+        measured: True if the spans of the thread are recorded or INSTRUMENTATION is set.
+    """
+    return _local.recorder is not None or ENABLED
+
+
+def record_payload(name, points, size):
+    """
+    Records the data sent to the browser for a chart, only call it if measured() is true.
+
+    Args:
+        name: Name of the chart, e.g. "goals/minutes Messi".
+        points: Number of points of the chart.
+        size: Size of the sent data in bytes.
+    """
+    recorder = _local.recorder
+    if recorder is not None:
+        recorder.payloads.append((name, points, size))
+    with _totals_lock:
+        _payloads[name] = (points, size)
+    if ENABLED:
+        logger.info(json.dumps({"chart": name, "points": points, "bytes": size}))
+
+
+@contextlib.contextmanager
+def recording():
+    """
+    Records the spans of the current thread, also if INSTRUMENTATION is not set.
+
+    Returns:
+        context: Context manager returning the Recorder.
+    """
+    previous = _local.recorder
+    recorder = _local.recorder = Recorder()
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
+
+
+def trace_memory(enabled):
+    """
+    Starts or stops tracing the memory allocations of the process, needed for the peak memory of the spans.
+
+    Args:
+        enabled: Whether the allocations are traced.
+    """
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def trace_memory_from_env():
+    """
+    Starts tracing the memory allocations of the process, if TRACE_MEMORY is set.
+    """
+    if TRACE_MEMORY:
+        trace_memory(True)
+
+
+def span_totals():
+    """
+    Returns the totals of all measured spans of the process.
+
+    Returns:
+        totals: Dictionary of span name and (count, seconds, largest peak memory increase in bytes).
+    """
+    with _totals_lock:
+        return {name: tuple(totals) for name, totals in _totals.items()}
+
+
+def payload_totals():
+    """
+    Returns the data sent the last time for every chart of the process.
+
+    Returns:
+        payloads: Dictionary of chart name and (points, bytes).
+    """
+    with _totals_lock:
+        return dict(_payloads)
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """
+    Returns the totals of the spans in the Prometheus text format.
+
+    Returns:
+        text: Text of the exposition format 0.0.4.
+    """
+    totals = sorted(span_totals().items())
+    lines = [
+        "# HELP dashboard_span_seconds Time spent in a span.",
+        "# TYPE dashboard_span_seconds summary",
+    ]
+    for name, (count, seconds, _) in totals:
+        lines.append(f'dashboard_span_seconds_count{{span="{_label(name)}"}} {count}')
+        lines.append(f'dashboard_span_seconds_sum{{span="{_label(name)}"}} {seconds:.6f}')
+    lines += [
+        "# HELP dashboard_span_peak_bytes Largest increase of the traced memory during a span, 0 without tracemalloc.",
+        "# TYPE dashboard_span_peak_bytes gauge",
+    ]
+    for name, (_, _, peak) in totals:
+        lines.append(f'dashboard_span_peak_bytes{{span="{_label(name)}"}} {peak}')
+    payloads = sorted(payload_totals().items())
+    if payloads:
+        lines += [
+            "# HELP dashboard_chart_points Points of a chart the last time it was sent.",
+            "# TYPE dashboard_chart_points gauge",
+        ]
+        lines += [f'dashboard_chart_points{{chart="{_label(name)}"}} {points}' for name, (points, _) in payloads]
+        lines += [
+            "# HELP dashboard_chart_payload_bytes Size of the data of a chart the last time it was sent.",
+            "# TYPE dashboard_chart_payload_bytes gauge",
+        ]
+        lines += [f'dashboard_chart_payload_bytes{{chart="{_label(name)}"}} {size}' for name, (_, size) in payloads]
+    return "\n".join(lines) + "\n"
+
+
+def serve_metrics(port, host="127.0.0.1"):
+    """
+    Serves prometheus_text() under /metrics in a background thread, only once per process.
+
+    Args:
+        port: Port of the server.
+        host: Interface the server listens on.
+
+    Returns:
+        server: The running HTTP server.
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+                body = prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        _server = ThreadingHTTPServer((host, port), Handler)
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+        logger.info("Serving the span metrics on http://%s:%d/metrics", host, port)
+        return _server
+
+
+def serve_metrics_from_env():
+    """
+    Starts serve_metrics() on the port of METRICS_PORT, if it is set.
+    """
+    port = os.environ.get("METRICS_PORT")
+    if port:
+        serve_metrics(int(port))
@@ -0,0 +1,310 @@
+"""
+Shared loading layer for the datasets in the data folder.
+
+Streamlit executes app.py again on every widget interaction and for every new session.
+The cache in this module lives once per process, so every session shares the parsed
+DataFrames and a csv file is only parsed again when its content actually changed.
+The frames are read from the typed files and cubes created by the ingest step, see analysis/ingest.py.
+"""
+import hashlib
+import logging
+import os
+import threading
+
+from analysis import cube, ingest
+from analysis.config import DATA_DIR, DATASETS, TYPED_DIR
+from analysis.instrument import span
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    """
+    Cached state of a single dataset.
+    """
+    __slots__ = ("mtime_ns", "size", "digest", "frame", "vocabulary")
+
+    def __init__(self, mtime_ns, size, digest, frame):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.frame = frame
+        # hash of the vocabularies the frame was loaded with
+        self.vocabulary = None
+
+
+class DatasetCache:
+    """
+    Process wide cache for the datasets in the data folder.
+
+    A dataset is parsed on first access. On every following access only the modification time
+    and size of the file are checked. If they changed, the content hash decides whether the file
+    has to be parsed again, so touching a file without changing it does not cause a reload.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, datasets=DATASETS, typed_dir=None):
+        self.data_dir = data_dir
+        self.typed_dir = typed_dir or (TYPED_DIR if data_dir == DATA_DIR else os.path.join(data_dir, "typed"))
+        self.datasets = dict(datasets)
+        self._entries = {}
+        self._cubes = {}
+        # key, vocabularies and their hash per dataset, see analysis/ingest.py
+        self._vocabularies = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, name):
+        """
+        Returns the path of the csv file for a dataset.
+
+        Args:
+            name: Name of the dataset.
+
+        Returns:
+            path: Absolute path of the csv file.
+        """
+        if name not in self.datasets:
+            raise KeyError(f"Unknown dataset '{name}'")
+        return os.path.join(self.data_dir, self.datasets[name])
+
+    def _refresh(self, name):
+        # Returns the entry of a dataset with an up to date content hash. The file is only read if its
+        # modification time or size changed. If the content changed, the cached frame is dropped.
+        path = self.path(name)
+        stat = os.stat(path)
+        entry = self._entries.get(name)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry, None
+
+        with open(path, "rb") as file:
+            content = file.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if entry is None or entry.digest != digest:
+            if entry is not None:
+                logger.info("Content of %s changed", path)
+            entry = _Entry(stat.st_mtime_ns, stat.st_size, digest, None)
+            self._entries[name] = entry
+        else:
+            # file was touched, but the content is the same
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+        return entry, content
+
+    def digest(self, name):
+        """
+        Returns the content hash of the csv file of a dataset without parsing it.
+
+        Args:
+            name: Name of the dataset.
+
+        Returns:
+            digest: Sha256 hash of the csv file.
+        """
+        with self._lock:
+            entry, _ = self._refresh(name)
+            return entry.digest
+
+    def vocabularies(self):
+        """
+        Returns the vocabularies shared by the categorical columns of the datasets, built again only if one
+        of their source datasets changed.
+
+        Returns:
+            vocabularies: Dictionary of vocabulary name and categories or None if the cache does not know
+                all source datasets of the vocabularies.
+        """
+        if not set(ingest.VOCABULARY_SOURCES) <= set(self.datasets):
+            return None
+        with self._lock:
+            digests = {source: self._refresh(source)[0].digest for source in ingest.VOCABULARY_SOURCES}
+            key = ingest.vocabulary_key(digests)
+            if self._vocabularies is None or self._vocabularies[0] != key:
+                paths = {source: self.path(source) for source in ingest.VOCABULARY_SOURCES}
+                vocabularies = ingest.load_vocabularies(paths, digests, self.typed_dir)
+                used = {source: ingest.vocabulary_digest(source, vocabularies) for source in ingest.VOCABULARY_SOURCES}
+                self._vocabularies = (key, vocabularies, used)
+            return self._vocabularies[1]
+
+    def load(self, name):
+        """
+        Returns the typed DataFrame of a dataset, ingesting the csv file only if it changed since the last call.
+        The returned DataFrame is shared between all sessions and must not be modified.
+
+        Args:
+            name: Name of the dataset.
+
+        Returns:
+            df: DataFrame of the dataset.
+        """
+        with self._lock:
+            # checked first, a changed source of the vocabularies is then seen by the refresh below as well
+            vocabularies = self.vocabularies() if name in ingest.VOCABULARY_SOURCES else None
+            vocabulary = self._vocabularies[2][name] if vocabularies is not None else None
+            entry, content = self._refresh(name)
+            if entry.frame is not None and entry.vocabulary == vocabulary:
+                self.hits += 1
+                return entry.frame
+
+            if content is None:
+                with open(self.path(name), "rb") as file:
+                    content = file.read()
+                entry.digest = hashlib.sha256(content).hexdigest()
+            entry.frame = ingest.load_typed(name, content, entry.digest, self.typed_dir, vocabularies)
+            entry.vocabulary = vocabulary
+            self.misses += 1
+            logger.info("Loaded dataset '%s' from %s", name, self.path(name))
+            return entry.frame
+
+    def load_cube(self, name):
+        """
+        Returns a materialized aggregate, see analysis/cube.py. The cube is read from its file if it was built
+        from the current content of its source datasets, otherwise it is built again and stored.
+
+        Args:
+            name: Name of the cube.
+
+        Returns:
+            df: DataFrame of the cube.
+        """
+        sources, _ = cube.CUBES[name]
+        with self._lock:
+            key = cube.cube_key(name, {source: self._refresh(source)[0].digest for source in sources})
+            cached = self._cubes.get(name)
+            if cached is not None and cached[0] == key:
+                self.hits += 1
+                return cached[1]
+
+            path = cube.cube_path(name, self.typed_dir)
+            frame = ingest.read_arrow(path, {"cube_key": key})
+            if frame is None:
+                frame = cube.build_cube(name, {source: self.load(source) for source in sources})
+                try:
+                    ingest.write_arrow(frame, path, {"cube_key": key})
+                    frame = ingest.read_arrow(path, {"cube_key": key})
+                    logger.info("Built cube '%s' into %s", name, path)
+                except OSError as e:
+                    logger.warning("Could not write cube '%s': %s", name, e)
+            self._cubes[name] = (key, frame)
+            self.misses += 1
+            return frame
+
+    def load_all(self):
+        """
+        Loads every dataset known to the cache.
+
+        Returns:
+            data: Dictionary of dataset name and DataFrame.
+        """
+        data = {name: self.load(name) for name in self.datasets}
+        logger.info("Dataset cache: %(hits)d hits, %(misses)d misses", self.stats())
+        return data
+
+    def load_cubes(self):
+        """
+        Loads every cube.
+
+        Returns:
+            cubes: Dictionary of cube name and DataFrame.
+        """
+        cubes = {name: self.load_cube(name) for name in cube.CUBES}
+        logger.info("Dataset cache: %(hits)d hits, %(misses)d misses", self.stats())
+        return cubes
+
+    def stats(self):
+        """
+        Returns the hit and miss counts of the cache.
+
+        Returns:
+            stats: Dictionary with the amount of hits, misses and cached datasets and cubes.
+        """
+        with self._lock:
+            cached = sum(entry.frame is not None for entry in self._entries.values()) + len(self._cubes)
+            return {"hits": self.hits, "misses": self.misses, "cached": cached}
+
+    def clear(self):
+        """
+        Removes all cached datasets and cubes and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._cubes.clear()
+            self._vocabularies = None
+            self.hits = 0
+            self.misses = 0
+
+
+# module level cache, shared by all sessions of the streamlit server
+_cache = DatasetCache()
+
+
+def load_dataset(name):
+    """
+    Loads a single dataset using the shared cache.
+
+    Args:
+        name: Name of the dataset.
+
+    Returns:
+        df: DataFrame of the dataset.
+    """
+    with span(f"load/{name}"):
+        return _cache.load(name)
+
+
+def dataset_digest(name):
+    """
+    Returns the content hash of the csv file of a dataset using the shared cache, the file is only read if its
+    modification time or size changed.
+
+    Args:
+        name: Name of the dataset.
+
+    Returns:
+        digest: Sha256 hash of the csv file.
+    """
+    return _cache.digest(name)
+
+
+def load_datasets():
+    """
+    Loads all datasets using the shared cache.
+
+    Returns:
+        data: Dictionary of dataset name and DataFrame.
+    """
+    return _cache.load_all()
+
+
+def load_cube(name):
+    """
+    Loads a single materialized aggregate using the shared cache.
+
+    Args:
+        name: Name of the cube.
+
+    Returns:
+        df: DataFrame of the cube.
+    """
+    with span(f"load/cube {name}"):
+        return _cache.load_cube(name)
+
+
+def load_cubes():
+    """
+    Loads all materialized aggregates using the shared cache.
+
+    Returns:
+        cubes: Dictionary of cube name and DataFrame.
+    """
+    return _cache.load_cubes()
+
+
+def cache_stats():
+    """
+    Returns the hit and miss counts of the shared cache.
+
+    Returns:
+        stats: Dictionary with the amount of hits, misses and cached datasets.
+    """
+    return _cache.stats()
@@ -0,0 +1,170 @@
+"""
+Inverted indexes of the row level datasets for the drill-down queries of the page, e.g. the penalties of a
+player against a goalkeeper or the goals against the top four of the table.
+
+An index sorts the positions of the rows of a dataset once by player and by the value of a column. The rows
+of a player and a set of values are then found with a binary search per value and only the matching rows are
+taken from the dataset, instead of comparing every row of a dataset with millions of goals. The keys are the
+integer codes of the categorical columns, see the shared vocabularies of analysis/ingest.py. The indexes are
+built on first use, once per process, and again only if their dataset was loaded again.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analysis.instrument import span
+from analysis.loading import load_dataset
+
+# drill-down -> (dataset, looked up column, columns shown for the matching rows)
+DRILL_DOWNS = {
+    "penalties_by_goalkeeper": ("penalties", "goalkeeper",
+                                ["date", "competition", "opponent", "result", "minute", "score", "has_scored"]),
+    "penalties_by_opponent": ("penalties", "opponent",
+                              ["date", "competition", "goalkeeper", "result", "minute", "score", "has_scored"]),
+    "goals_by_opponent": ("club_goals", "opponent",
+                          ["saison", "league", "gameday", "venue", "result", "goal_minute", "goal_score", "goal_type"]),
+    "goals_by_table_position": ("club_goals", "opponent_table_position",
+                                ["saison", "league", "gameday", "venue", "opponent", "opponent_table_position",
+                                 "result", "goal_minute", "goal_type"]),
+    "games_by_competition": ("international_performances", "tournament",
+                             ["date", "gameday", "venue", "opponent", "result", "goals", "assists_amount",
+                              "minutes_played"]),
+}
+
+# (dataset, column) -> (dataset frame the index was built from, index)
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _codes(series):
+    # integer codes and values of a column, -1 for missing values
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, values = pd.factorize(series, sort=True)
+    return codes, pd.Index(values)
+
+
+class InvertedIndex:
+    """
+    Positions of the rows of a dataset sorted by player and by the value of a column.
+
+    Args:
+        df: Typed dataset, the index keeps a reference to it.
+        column: Column the rows are looked up by.
+    """
+
+    def __init__(self, df, column):
+        self.df = df
+        self.column = column
+        player_codes, self.players = _codes(df["player_name"])
+        value_codes, self.values = _codes(df[column])
+        # one key per player and value, rows with a missing player or value are not indexed
+        dtype = "int32" if len(self.players) * len(self.values) < 2 ** 31 else "int64"
+        keys = player_codes.astype(dtype) * len(self.values) + value_codes
+        positions = np.flatnonzero((player_codes >= 0) & (value_codes >= 0))
+        order = np.argsort(keys[positions], kind="stable")
+        self._positions = positions[order].astype("int32" if len(df) < 2 ** 31 else "int64")
+        self._keys = keys[positions][order]
+
+    def _player_codes(self, player):
+        if player is None:
+            return np.arange(len(self.players))
+        return self.players.get_indexer([player])
+
+    def positions(self, values, player=None):
+        """
+        Returns the positions of the rows of a player with one of the values.
+
+        Args:
+            values: Values of the column.
+            player: Name of the player, None for all players.
+
+        Returns:
+            positions: Sorted positions of the matching rows in the dataset.
+        """
+        value_codes = self.values.get_indexer(list(values))
+        value_codes = value_codes[value_codes >= 0]
+        player_codes = self._player_codes(player)
+        player_codes = player_codes[player_codes >= 0]
+        # searched with the dtype of the index, numpy would cast all keys of the index otherwise
+        keys = (player_codes[:, None] * len(self.values) + value_codes[None, :]).ravel().astype(self._keys.dtype)
+        starts = np.searchsorted(self._keys, keys, side="left")
+        sizes = np.searchsorted(self._keys, keys, side="right") - starts
+        # positions of all ranges without a python loop: the start of every range plus the offset within it
+        offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        return np.sort(self._positions[np.repeat(starts, sizes) + offsets])
+
+    def rows(self, values, player=None, columns=None):
+        """
+        Returns the rows of a player with one of the values.
+
+        Args:
+            values: Values of the column.
+            player: Name of the player, None for all players.
+            columns: Columns of the returned rows, all columns if not given.
+
+        Returns:
+            rows: Matching rows in the order of the dataset.
+        """
+        df = self.df if columns is None else self.df[columns]
+        return df.take(self.positions(values, player))
+
+    def counts(self, player=None):
+        """
+        Returns the number of rows of every value.
+
+        Args:
+            player: Name of the player, None for all players.
+
+        Returns:
+            counts: Series of value and number of rows, sorted by the values, values without rows are left out.
+        """
+        player_codes = self._player_codes(player)
+        player_codes = player_codes[player_codes >= 0]
+        counts = np.zeros(len(self.values), dtype="int64")
+        for code in player_codes:
+            bounds = np.array([code * len(self.values), (code + 1) * len(self.values)], dtype=self._keys.dtype)
+            start, stop = np.searchsorted(self._keys, bounds)
+            counts += np.bincount(self._keys[start:stop] - code * len(self.values), minlength=len(self.values))
+        return pd.Series(counts, index=self.values, name="rows")[counts > 0]
+
+
+def inverted_index(dataset, column):
+    """
+    Returns the index of a column of a dataset. It is built once per process and again only if the dataset
+    was loaded again.
+
+    Args:
+        dataset: Name of the dataset.
+        column: Column the rows are looked up by.
+
+    Returns:
+        index: InvertedIndex.
+    """
+    df = load_dataset(dataset)
+    with _indexes_lock:
+        built = _indexes.get((dataset, column))
+        if built is not None and built[0] is df:
+            return built[1]
+    with span(f"compute/index {dataset}.{column}"):
+        index = InvertedIndex(df, column)
+    with _indexes_lock:
+        _indexes[(dataset, column)] = (df, index)
+    return index
+
+
+def drill_down(name, values, player=None):
+    """
+    Returns the rows of a drill-down, e.g. drill_down("penalties_by_goalkeeper", ["Hugo Lloris"], lm).
+
+    Args:
+        name: Name of the drill-down, see DRILL_DOWNS.
+        values: Values of the looked up column.
+        player: Name of the player, None for all players.
+
+    Returns:
+        rows: Matching rows with the columns of the drill-down.
+    """
+    dataset, column, columns = DRILL_DOWNS[name]
+    return inverted_index(dataset, column).rows(values, player, columns)
@@ -0,0 +1,417 @@
+"""
+Aggregation engine for the metrics shown in the five disciplines.
+
+The metrics are computed from the cubes of analysis/cube.py, not from the row level datasets.
+Each metric is computed for all players in a single groupby pass, instead of filtering the rows of
+every player again for every section.
+The results are indexed by player_name as first level, use for_player() to get the values of one player.
+The metrics of the pages are computed once per process and the same objects are handed to every session,
+see read_only().
+"""
+import threading
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from analysis.instrument import span
+from analysis.loading import load_cube
+
+# titles counted as continental championship of a national team
+CONTINENTAL_TITLES = ["Europameister", "Copa América-Sieger"]
+
+# columns of the card tables
+CARD_COLUMNS = ["yellow_cards", "yellow_red_cards", "red_cards"]
+
+# phases of a game in the order they are played
+MATCH_PHASES = ["Regular time", "First half added time", "Second half added time", "Extra time"]
+
+
+def for_player(metric, player):
+    """
+    Returns the part of a metric that belongs to a single player.
+
+    Args:
+        metric: Series or dataframe with player_name as first index level.
+        player: Name of the player.
+
+    Returns:
+        values: Values of the player without the player_name level, empty if the player has no data.
+    """
+    if player in metric.index.get_level_values(0):
+        return metric.xs(player, level=0, drop_level=True)
+    return metric.iloc[0:0].droplevel(0) if metric.index.nlevels > 1 else metric.iloc[0:0]
+
+
+def player_totals(totals, player):
+    """
+    Returns the totals of a single player, keeping the type of every column.
+
+    Args:
+        totals: Dataframe of totals indexed by player_name.
+        player: Name of the player.
+
+    Returns:
+        totals: Dictionary of column name and value.
+    """
+    return totals.loc[[player]].to_dict("records")[0]
+
+
+def minute_labels(goal_minute, added_time):
+    """
+    Labels goal minutes the way transfermarkt shows them, e.g. "64" or "45+2". The labels are created once
+    per distinct minute instead of once per row, and ordered by minute and added time.
+
+    Args:
+        goal_minute: Series of goal minutes.
+        added_time: Series of minutes played in added time, 0 for goals in regular time.
+
+    Returns:
+        labels: Ordered categorical series of minute labels.
+    """
+    minute = np.asarray(goal_minute, dtype="int64")
+    added = np.asarray(added_time, dtype="int64")
+    codes, keys = pd.factorize(minute * 1000 + added, sort=True)
+    labels = [f"{key // 1000}+{key % 1000}" if key % 1000 > 0 else str(key // 1000) for key in keys]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=labels, ordered=True), index=getattr(goal_minute, "index", None))
+
+
+def match_phase(goal_minute, added_time):
+    """
+    Assigns goal minutes to the phases of a game: regular time, added time of the first or second half and extra time.
+
+    Args:
+        goal_minute: Series of goal minutes.
+        added_time: Series of minutes played in added time, 0 for goals in regular time.
+
+    Returns:
+        phases: Ordered categorical series of MATCH_PHASES.
+    """
+    minute = np.asarray(goal_minute)
+    added = np.asarray(added_time) > 0
+    codes = np.select([minute > 90, added & (minute <= 45), added], [3, 1, 2], default=0)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=MATCH_PHASES, ordered=True), index=getattr(goal_minute, "index", None))
+
+
+def select(cube, seasons=None, source=None, venue=None, competition=None):
+    """
+    Returns the rows of a cube matching the filters of the page. The source and venue filters only apply to
+    cubes with such a column, rows with an unknown venue ("") are kept by the venue filter.
+
+    Args:
+        cube: Dataframe of a cube.
+        seasons: Inclusive range of start years, e.g. (2009, 2014), None for all seasons.
+        source: "Club" or "International", None for both.
+        venue: "H" for home or "A" for away games, None for both.
+        competition: Name of a competition, None for all competitions.
+
+    Returns:
+        cube: Filtered cube, the cube itself without filters.
+    """
+    mask = True
+    if seasons is not None:
+        mask = cube["season"].between(*seasons)
+    if source is not None and "source" in cube.columns:
+        mask = mask & (cube["source"] == source)
+    if venue is not None and "venue" in cube.columns:
+        # two comparisons of the category codes, faster than isin()
+        mask = mask & ((cube["venue"] == venue) | (cube["venue"] == ""))
+    if competition is not None:
+        mask = mask & (cube["competition"] == competition)
+    return cube if mask is True else cube[mask]
+
+
+def title_groups(names):
+    """
+    Assigns titles to the groups counted in the title totals.
+
+    Args:
+        names: Index or series of title names as text.
+
+    Returns:
+        groups: Dictionary of total name and boolean mask of the titles counted in it.
+    """
+    return {
+        "world_champion": names == "Weltmeister",
+        "continental_champion": names.isin(CONTINENTAL_TITLES),
+        "champions_league": names.str.contains("Champions-League"),
+        "ballon_dor": names.str.contains("Ballon"),
+    }
+
+
+def derive_totals(name, totals):
+    """
+    Adds the totals of a discipline that are computed from its summed totals, e.g. the scoring rate of the penalties.
+
+    Args:
+        name: Name of the discipline, see DISCIPLINES.
+        totals: Dataframe of the summed totals indexed by player_name.
+
+    Returns:
+        totals: The same dataframe with the derived columns.
+    """
+    if name == "goals":
+        totals["total_goals"] = totals["club_goals"] + totals["international_goals"]
+    elif name == "penalties":
+        totals["missed"] = totals["total"] - totals["scored"]
+        totals["scoring_rate"] = totals["scored"] / totals["total"]
+        totals["per_season"] = totals["total"] / totals["seasons"]
+    elif name == "assists":
+        totals["total_assists"] = totals["club_assists"] + totals["international_assists"]
+    elif name == "fair_play":
+        totals["games_per_yellow"] = totals["games"] / (totals["yellow"] + totals["yellow_red"])
+        totals["games_per_red"] = totals["games"] / (totals["red"] + totals["yellow_red"])
+    return totals
+
+
+def _sum(cube, keys, measure, name=None):
+    return cube.groupby(["player_name"] + keys, observed=True)[measure].sum().rename(name or measure)
+
+
+def _source(performances, source):
+    return performances[performances["source"] == source]
+
+
+def goal_metrics(goal_types, goal_positions, goal_minutes, performances):
+    """
+    Computes the goal metrics of all players.
+
+    Args:
+        goal_types: Cube of the club goals per goal type.
+        goal_positions: Cube of the club goals per player position.
+        goal_minutes: Cube of the club goals per minute.
+        performances: Cube of the club and international performances.
+
+    Returns:
+        goals: Dictionary of metric name and result.
+    """
+    totals = pd.DataFrame({
+        "club_goals": goal_types.groupby("player_name", observed=True)["goals"].sum(),
+        "international_goals": _source(performances, "International").groupby("player_name", observed=True)["goals"].sum(),
+    }).fillna(0).astype(int)
+    minutes = _sum(goal_minutes, ["goal_minute", "added_time"], "goals", "goal_count")
+    # the phases are summed from the goals per minute, a few hundred rows instead of the whole cube
+    per_minute = minutes.reset_index()
+    per_minute["phase"] = match_phase(per_minute["goal_minute"], per_minute["added_time"])
+    return {
+        "types": _sum(goal_types, ["goal_type"], "goals", "count"),
+        "positions": _sum(goal_positions, ["player_position"], "goals", "count"),
+        "minutes": minutes,
+        "phases": _sum(per_minute, ["phase"], "goal_count"),
+        "totals": derive_totals("goals", totals),
+    }
+
+
+def penalty_metrics(penalties):
+    """
+    Computes the penalty metrics of all players.
+
+    Args:
+        penalties: Cube of the penalties taken.
+
+    Returns:
+        penalties: Dictionary of metric name and result.
+    """
+    per_competition = penalties.groupby(["player_name", "competition"], observed=True)[["taken", "scored"]].sum()
+    per_competition.columns = ["count", "scored"]
+    per_competition["accuracy"] = (per_competition["scored"] / per_competition["count"] * 100).round(2)
+
+    grouped = penalties.groupby("player_name", observed=True)
+    totals = pd.DataFrame({
+        "total": grouped["taken"].sum(),
+        "scored": grouped["scored"].sum(),
+        "seasons": grouped["saison"].nunique(),
+    })
+    return {
+        "per_saison": _sum(penalties, ["saison"], "taken", "count"),
+        "per_competition": per_competition,
+        "totals": derive_totals("penalties", totals),
+    }
+
+
+def assist_metrics(performances):
+    """
+    Computes the assist metrics of all players.
+
+    Args:
+        performances: Cube of the club and international performances.
+
+    Returns:
+        assists: Dictionary of metric name and result.
+    """
+    club = _sum(_source(performances, "Club"), ["competition"], "assists")
+    international = _sum(_source(performances, "International"), ["competition"], "assists")
+    per_tournament = pd.concat([international, club]).to_frame()
+
+    totals = pd.DataFrame({
+        "club_assists": club.groupby(level=0, observed=True).sum(),
+        "international_assists": international.groupby(level=0, observed=True).sum(),
+    }).fillna(0).astype(int)
+    return {
+        "per_tournament": per_tournament,
+        "totals": derive_totals("assists", totals),
+    }
+
+
+def fair_play_metrics(performances):
+    """
+    Computes the card metrics of all players.
+
+    Args:
+        performances: Cube of the club and international performances.
+
+    Returns:
+        fair_play: Dictionary of metric name and result.
+    """
+    club_performances = _source(performances, "Club")
+    club = club_performances.groupby(["player_name", "competition_type"], observed=True)[CARD_COLUMNS].sum()
+    # international games are grouped by tournament
+    international = _source(performances, "International").groupby(["player_name", "competition"], observed=True)[CARD_COLUMNS].sum()
+    international.index = international.index.set_names(["player_name", "competition_type"])
+    per_competition = pd.concat([club, international])
+
+    club_grouped = club_performances.groupby("player_name", observed=True)
+    totals = per_competition.groupby(level=0, observed=True).sum()
+    totals.columns = ["yellow", "yellow_red", "red"]
+    # games are counted as club games played plus one per row of the club performance table
+    totals["games"] = club_grouped["games"].sum() + club_grouped["entries"].sum()
+    return {
+        "per_competition": per_competition,
+        "totals": derive_totals("fair_play", totals),
+    }
+
+
+def title_metrics(titles):
+    """
+    Computes the title metrics of all players.
+
+    Args:
+        titles: Cube of the titles won.
+
+    Returns:
+        titles: Dictionary of metric name and result.
+    """
+    per_title = _sum(titles, ["title"], "titles", "count").to_frame()
+    per_title = per_title.sort_values(["player_name", "count"], ascending=[True, False], kind="stable")
+
+    counts = per_title["count"]
+    names = counts.index.get_level_values("title").astype(str)
+    totals = pd.DataFrame({
+        **{group: counts[mask].groupby(level=0, observed=True).sum() for group, mask in title_groups(names).items()},
+        "total": counts.groupby(level=0, observed=True).sum(),
+    }).fillna(0).astype(int)
+    return {
+        "per_title": per_title,
+        "totals": totals,
+    }
+
+
+def title_overlap(per_title, player, players):
+    """
+    Splits the titles of a player into titles also won by one of the other players and titles only he won.
+
+    Args:
+        per_title: Title counts of all players, as returned by title_metrics().
+        player: Name of the player.
+        players: Names of all compared players.
+
+    Returns:
+        shared: Titles of the player that were also won by another player.
+        unique: Titles of the player that were not won by any other player.
+    """
+    own = for_player(per_title, player)
+    others = set()
+    for other in players:
+        if other != player:
+            others.update(for_player(per_title, other).index)
+    mask = own.index.isin(list(others))
+    return own[mask], own[~mask]
+
+
+# name of the discipline -> (cubes the metrics are computed from, function computing the metrics)
+DISCIPLINES = {
+    "goals": (["goal_types", "goal_positions", "goal_minutes", "performances"], goal_metrics),
+    "penalties": (["penalties"], penalty_metrics),
+    "assists": (["performances"], assist_metrics),
+    "fair_play": (["performances"], fair_play_metrics),
+    "titles": (["titles"], title_metrics),
+}
+
+# discipline name -> (cubes the metrics were computed from, metrics)
+_computed = {}
+_computed_lock = threading.Lock()
+
+
+def _freeze(frame):
+    # marks the arrays holding the values of a frame or series as not writeable, pandas then raises on
+    # setting a value in place instead of changing the frame of every session
+    for block in frame._mgr.blocks:
+        values = block.values
+        if isinstance(values, pd.Categorical):
+            values = values._codes
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return frame
+
+
+def read_only(metrics):
+    """
+    Returns the metrics of a discipline as read-only mapping, shared by all sessions without copying.
+    The frames are not copied either, but their values are read-only: setting a value in place, e.g. with
+    loc[] or iloc[], raises a ValueError. Pandas copies on write, so a frame derived from a shared frame,
+    e.g. by for_player() or reset_index(), can be changed and get new columns without changing the shared
+    one. Adding, replacing or dropping whole columns of a shared frame itself is not prevented by pandas
+    and must not be done.
+
+    Args:
+        metrics: Dictionary of metric name and result.
+
+    Returns:
+        metrics: Read-only view of the dictionary.
+    """
+    for value in metrics.values():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            _freeze(value)
+    return MappingProxyType(metrics)
+
+
+def discipline_metrics(name):
+    """
+    Returns the metrics of a single discipline. Only the cubes of the discipline are loaded and the metrics are
+    computed once per process, they are computed again only if one of the cubes was rebuilt.
+
+    Args:
+        name: Name of the discipline, see DISCIPLINES.
+
+    Returns:
+        metrics: Read-only mapping of metric name and result, see read_only().
+    """
+    sources, compute = DISCIPLINES[name]
+    cubes = [load_cube(source) for source in sources]
+    with _computed_lock:
+        computed = _computed.get(name)
+        # the cache returns the same frame objects as long as a cube is unchanged
+        if computed is not None and all(old is new for old, new in zip(computed[0], cubes)):
+            return computed[1]
+
+    with span(f"compute/{name}"):
+        metrics = read_only(compute(*cubes))
+    with _computed_lock:
+        _computed[name] = (cubes, metrics)
+    return metrics
+
+
+def compute_metrics(cubes):
+    """
+    Computes the metrics of all five disciplines for all players.
+
+    Args:
+        cubes: Dictionary of cube name and dataframe, as returned by load_cubes().
+
+    Returns:
+        metrics: Dictionary of discipline name and its metrics.
+    """
+    return {
+        name: compute(*[cubes[source] for source in sources])
+        for name, (sources, compute) in DISCIPLINES.items()
+    }
@@ -0,0 +1,234 @@
+"""
+Prefix sums of the season totals of every player, for the season, competition and venue filters of the page.
+
+For every combination of the source filter (club, international or both) and the venue filter (home, away or
+both) the totals of all five disciplines are summed per player and season and accumulated over a dense index
+of seasons. The totals of a season range are then the difference of two rows, independent of the amount of
+rows in the datasets and of the length of the range. The breakdowns shown next to the totals are computed
+from the filtered cubes, which are already aggregated per season.
+
+Venues are only known for the club goals and the international games, the filter keeps everything else
+(club performances, penalties and titles). The same holds for the source of the titles.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from analysis.instrument import span
+from analysis.loading import load_cube
+from analysis.metrics import DISCIPLINES, derive_totals, discipline_metrics, read_only, select, title_groups
+
+# discipline -> totals that are summed, the other totals are derived by derive_totals()
+SUMMED_TOTALS = {
+    "goals": ["club_goals", "international_goals"],
+    "penalties": ["total", "scored", "seasons"],
+    "assists": ["club_assists", "international_assists"],
+    "fair_play": ["yellow", "yellow_red", "red", "games"],
+    "titles": ["world_champion", "continental_champion", "champions_league", "ballon_dor", "total"],
+}
+
+# cubes the totals are read from
+INDEX_CUBES = ["goal_types", "penalties", "performances", "titles"]
+
+SOURCES = [None, "Club", "International"]
+VENUES = [None, "H", "A"]
+
+# measures are named "<discipline>.<total>", e.g. "penalties.total"
+MEASURES = [f"{name}.{total}" for name, totals in SUMMED_TOTALS.items() for total in totals]
+
+
+def _rows(cube, measures, source="", venue=""):
+    rows = pd.DataFrame({
+        "player_name": cube["player_name"].astype(str),
+        "season": cube["season"].astype("int64"),
+        "source": cube["source"].astype(str) if "source" in cube.columns else source,
+        "venue": cube["venue"].astype(str) if "venue" in cube.columns else venue,
+    })
+    for measure, values in measures.items():
+        rows[measure] = np.asarray(values, dtype="int64")
+    return rows
+
+
+def season_rows(cubes):
+    """
+    Collects the summed totals of all disciplines per player, season, source and venue.
+
+    Args:
+        cubes: Dictionary of cube name and dataframe, must contain INDEX_CUBES.
+
+    Returns:
+        rows: Dataframe with player_name, season, source, venue and one column per measure, "" marks an
+              unknown source or venue.
+    """
+    performances = cubes["performances"]
+    club = (performances["source"] == "Club").to_numpy()
+    international = ~club
+    penalties = cubes["penalties"]
+    titles = cubes["titles"]
+    groups = title_groups(titles["title"].astype(str))
+    rows = pd.concat([
+        _rows(cubes["goal_types"], {"goals.club_goals": cubes["goal_types"]["goals"]}),
+        _rows(performances, {
+            "goals.international_goals": performances["goals"] * international,
+            "assists.club_assists": performances["assists"] * club,
+            "assists.international_assists": performances["assists"] * international,
+            "fair_play.yellow": performances["yellow_cards"],
+            "fair_play.yellow_red": performances["yellow_red_cards"],
+            "fair_play.red": performances["red_cards"],
+            # games are counted as club games played plus one per row of the club performance table
+            "fair_play.games": (performances["games"] + performances["entries"]) * club,
+        }),
+        _rows(penalties, {"penalties.total": penalties["taken"], "penalties.scored": penalties["scored"]}),
+        _rows(titles, {
+            **{f"titles.{group}": titles["titles"] * mask.to_numpy() for group, mask in groups.items()},
+            "titles.total": titles["titles"],
+        }),
+    ], ignore_index=True)
+    rows = rows.reindex(columns=["player_name", "season", "source", "venue"] + MEASURES)
+    # every cube only has the measures of its own disciplines
+    rows[MEASURES] = rows[MEASURES].fillna(0).astype("int64")
+    return rows
+
+
+class SeasonIndex:
+    """
+    Prefix sums of the totals of every player over a dense index of seasons, one per filter combination.
+
+    Args:
+        cubes: Dictionary of cube name and dataframe, must contain INDEX_CUBES.
+    """
+
+    def __init__(self, cubes):
+        rows = season_rows(cubes)
+        self.players = sorted(rows["player_name"].unique())
+        self.first_season = int(rows["season"].min())
+        self.last_season = int(rows["season"].max())
+        player = pd.Categorical(rows["player_name"], categories=self.players).codes
+        season = (rows["season"] - self.first_season).to_numpy()
+        values = rows[MEASURES].to_numpy()
+        shape = (len(self.players), self.last_season - self.first_season + 1, len(MEASURES))
+        total, seasons = MEASURES.index("penalties.total"), MEASURES.index("penalties.seasons")
+
+        self._prefix = {}
+        for source in SOURCES:
+            for venue in VENUES:
+                # a filter only applies to rows with a known source or venue
+                mask = np.ones(len(rows), dtype=bool)
+                if source is not None:
+                    mask &= rows["source"].isin([source, ""]).to_numpy()
+                if venue is not None:
+                    mask &= rows["venue"].isin([venue, ""]).to_numpy()
+                per_season = np.zeros(shape, dtype="int64")
+                np.add.at(per_season, (player[mask], season[mask]), values[mask])
+                # seasons with at least one penalty, counted once per season
+                per_season[:, :, seasons] = per_season[:, :, total] > 0
+                prefix = np.zeros((shape[0], shape[1] + 1, shape[2]), dtype="int64")
+                np.cumsum(per_season, axis=1, out=prefix[:, 1:])
+                self._prefix[(source, venue)] = prefix
+
+    def sums(self, seasons=None, source=None, venue=None):
+        """
+        Returns the summed totals of all players within a season range.
+
+        Args:
+            seasons: Inclusive range of start years, None for all seasons.
+            source: "Club", "International" or None for both.
+            venue: "H", "A" or None for both.
+
+        Returns:
+            sums: Array of players x MEASURES.
+        """
+        prefix = self._prefix[(source, venue)]
+        first, last = seasons if seasons is not None else (self.first_season, self.last_season)
+        size = prefix.shape[1] - 1
+        start = min(max(first - self.first_season, 0), size)
+        stop = min(max(last - self.first_season + 1, start), size)
+        return prefix[:, stop] - prefix[:, start]
+
+    def totals(self, name, seasons=None, source=None, venue=None):
+        """
+        Returns the totals of a discipline within a season range, like the totals of its metrics.
+
+        Args:
+            name: Name of the discipline, see SUMMED_TOTALS.
+            seasons: Inclusive range of start years, None for all seasons.
+            source: "Club", "International" or None for both.
+            venue: "H", "A" or None for both.
+
+        Returns:
+            totals: Dataframe of totals indexed by player_name, players without data have zero totals.
+        """
+        columns = [MEASURES.index(f"{name}.{total}") for total in SUMMED_TOTALS[name]]
+        sums = self.sums(seasons, source, venue)[:, columns]
+        totals = pd.DataFrame(sums, index=pd.Index(self.players, name="player_name"), columns=SUMMED_TOTALS[name])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return derive_totals(name, totals)
+
+
+# (cubes the index was built from, index)
+_index = None
+_index_lock = threading.Lock()
+
+# (discipline, filters) -> (cubes the metrics were computed from, metrics), the most recently used filters
+_filtered = OrderedDict()
+_filtered_lock = threading.Lock()
+MAX_FILTERED = 64
+
+
+def season_index():
+    """
+    Returns the season index of the loaded cubes. It is built once per process and again only if one of
+    its cubes was rebuilt.
+
+    Returns:
+        index: SeasonIndex.
+    """
+    global _index
+    cubes = [load_cube(name) for name in INDEX_CUBES]
+    with _index_lock:
+        if _index is not None and all(old is new for old, new in zip(_index[0], cubes)):
+            return _index[1]
+    with span("compute/season index"):
+        index = SeasonIndex(dict(zip(INDEX_CUBES, cubes)))
+    with _index_lock:
+        _index = (cubes, index)
+    return index
+
+
+def filtered_metrics(name, seasons=None, source=None, venue=None):
+    """
+    Returns the metrics of a discipline within a season range, of a source and at a venue. Without filters
+    these are the metrics of discipline_metrics(). Otherwise the breakdowns are computed from the filtered
+    cubes and the totals are read from the season index.
+
+    Args:
+        name: Name of the discipline, see DISCIPLINES.
+        seasons: Inclusive range of start years, None for all seasons.
+        source: "Club", "International" or None for both.
+        venue: "H", "A" or None for both.
+
+    Returns:
+        metrics: Read-only mapping of metric name and result, see read_only().
+    """
+    if seasons is None and source is None and venue is None:
+        return discipline_metrics(name)
+    sources, compute = DISCIPLINES[name]
+    cubes = [load_cube(cube) for cube in sources]
+    key = (name, seasons, source, venue)
+    with _filtered_lock:
+        computed = _filtered.get(key)
+        if computed is not None and all(old is new for old, new in zip(computed[0], cubes)):
+            _filtered.move_to_end(key)
+            return computed[1]
+
+    with span(f"compute/{name} filtered"):
+        metrics = dict(compute(*[select(cube, seasons, source, venue) for cube in cubes]))
+        metrics["totals"] = season_index().totals(name, seasons, source, venue)
+        metrics = read_only(metrics)
+    with _filtered_lock:
+        _filtered[key] = (cubes, metrics)
+        while len(_filtered) > MAX_FILTERED:
+            _filtered.popitem(last=False)
+    return metrics
@@ -0,0 +1,245 @@
+"""
+Headless report of the five discipline comparison, independent of streamlit.
+
+The report contains the metrics of every discipline for any set of players, the winner of every
+discipline and the overall verdict. It is written as JSON and as a static HTML page, so it can be
+precomputed and served without a python process per viewer.
+
+Usage:
+    python -m analysis.report [--players "Lionel Messi" "Christiano Ronaldo"] [--output reports]
+"""
+import argparse
+import html
+import json
+import logging
+import math
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from analysis.loading import load_cubes
+from analysis.metrics import compute_metrics, for_player
+
+logger = logging.getLogger(__name__)
+
+# discipline -> (title shown in the report, column of the totals deciding the discipline)
+# the player with the highest value wins the discipline, players with the same value share the win
+SCORING = {
+    "goals": ("Tore", "total_goals"),
+    "penalties": ("Elfmeter", "scoring_rate"),
+    "assists": ("Assists", "total_assists"),
+    "fair_play": ("Fair Play", "games_per_yellow"),
+    "titles": ("Titel", "total"),
+}
+
+
+def available_players(cubes):
+    """
+    Returns the names of all players contained in the cubes.
+
+    Args:
+        cubes: Dictionary of cube name and dataframe, as returned by load_cubes().
+
+    Returns:
+        players: Sorted list of player names.
+    """
+    names = set()
+    for cube in cubes.values():
+        names.update(cube["player_name"].astype(str).unique())
+    return sorted(names)
+
+
+def _value(value):
+    # converts numpy scalars to python values, NaN and infinity are not valid JSON
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def json_records(df):
+    """
+    Converts the rows of a dataframe into JSON serializable records.
+
+    Args:
+        df: Dataframe, the index is not included.
+
+    Returns:
+        records: List of dictionaries of column name and python value, None for missing or infinite numbers.
+    """
+    return [{str(key): _value(value) for key, value in row.items()} for row in df.to_dict("records")]
+
+
+def discipline_winners(totals, column, players):
+    """
+    Returns the players with the highest value of a column of the totals.
+
+    Args:
+        totals: Totals of a discipline indexed by player_name.
+        column: Column deciding the discipline.
+        players: Names of the compared players.
+
+    Returns:
+        winners: Names of the winning players, empty if no player has a value.
+    """
+    values = totals[column].reindex(players).replace([math.inf, -math.inf], math.nan).dropna()
+    if values.empty:
+        return []
+    return [player for player in players if player in values.index and values[player] == values.max()]
+
+
+def build_report(players=None, cubes=None):
+    """
+    Computes the comparison of the players in all five disciplines.
+
+    Args:
+        players: Names of the compared players, all players in the data if not given.
+        cubes: Dictionary of cube name and dataframe, loaded from the shared cache if not given.
+
+    Returns:
+        report: Dictionary with the metrics and winners of every discipline, the points and the verdict.
+    """
+    cubes = cubes if cubes is not None else load_cubes()
+    known = available_players(cubes)
+    players = list(players) if players else known
+    unknown = [player for player in players if player not in known]
+    if unknown:
+        raise ValueError(f"Unknown players {unknown}, available players are {known}")
+
+    metrics = compute_metrics(cubes)
+    points = {player: 0 for player in players}
+    disciplines = {}
+    for name, (title, column) in SCORING.items():
+        discipline = metrics[name]
+        totals = discipline["totals"].reindex(players)
+        winners = discipline_winners(discipline["totals"], column, players)
+        for player in winners:
+            points[player] += 1
+
+        details = {}
+        for key, metric in discipline.items():
+            if key == "totals":
+                continue
+            details[key] = {player: json_records(for_player(metric, player).reset_index()) for player in players}
+        disciplines[name] = {
+            "title": title,
+            "decided_by": column,
+            "winners": winners,
+            "totals": {player: json_records(totals.loc[[player]])[0] for player in players},
+            "details": details,
+        }
+
+    best = max(points.values()) if points else 0
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "players": players,
+        "disciplines": disciplines,
+        "points": points,
+        "verdict": {
+            "winners": [player for player in players if points[player] == best],
+            "score": ":".join(str(points[player]) for player in players),
+        },
+    }
+
+
+def _table(rows, columns=None):
+    # renders a list of records as html table
+    rows = pd.DataFrame(rows, columns=columns)
+    return rows.to_html(index=False, border=0, classes="table", na_rep="-", float_format=lambda value: f"{value:.2f}")
+
+
+def render_html(report):
+    """
+    Renders a report as a static HTML page.
+
+    Args:
+        report: Report as returned by build_report().
+
+    Returns:
+        html: Text of the HTML page.
+    """
+    players = report["players"]
+    title = " vs ".join(players)
+    parts = [
+        "<!DOCTYPE html>",
+        '<html lang="de">',
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>{html.escape(title)}</title>",
+        "<style>body{font-family:sans-serif;max-width:960px;margin:auto;padding:1em}"
+        ".table{border-collapse:collapse;margin-bottom:1em}.table td,.table th{padding:2px 8px;border-bottom:1px solid #ddd}"
+        ".players{display:flex;gap:2em;flex-wrap:wrap}</style>",
+        "</head>",
+        "<body>",
+        f"<h1>{html.escape(title)}</h1>",
+        f"<p>Erstellt am {html.escape(report['generated_at'])}</p>",
+    ]
+
+    verdict = report["verdict"]
+    parts.append(f"<h2>Ergebnis: {html.escape(' und '.join(verdict['winners']))} ({html.escape(verdict['score'])})</h2>")
+    parts.append(_table([{"Spieler": player, "Punkte": report["points"][player]} for player in players]))
+
+    for discipline in report["disciplines"].values():
+        parts.append(f"<h2>{html.escape(discipline['title'])}</h2>")
+        winners = " und ".join(discipline["winners"]) or "-"
+        parts.append(f"<p>Sieger: <b>{html.escape(winners)}</b> (entschieden nach {html.escape(discipline['decided_by'])})</p>")
+        parts.append(_table([{"Spieler": player, **discipline["totals"][player]} for player in players]))
+        for key, values in discipline["details"].items():
+            parts.append(f"<h3>{html.escape(key)}</h3>")
+            parts.append('<div class="players">')
+            for player in players:
+                parts.append(f"<div><h4>{html.escape(player)}</h4>{_table(values[player])}</div>")
+            parts.append("</div>")
+
+    parts += ["</body>", "</html>"]
+    return "\n".join(parts)
+
+
+def write_report(report, output_dir):
+    """
+    Writes a report as report.json and report.html.
+
+    Args:
+        report: Report as returned by build_report().
+        output_dir: Folder the files are written to.
+
+    Returns:
+        paths: Paths of the JSON and HTML file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    json_path = os.path.join(output_dir, "report.json")
+    html_path = os.path.join(output_dir, "report.html")
+    with open(json_path, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    with open(html_path, "w", encoding="utf-8") as file:
+        file.write(render_html(report))
+    return json_path, html_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Computes the comparison of players in all five disciplines.")
+    parser.add_argument("--players", nargs="+", help="names of the compared players, all players in the data by default")
+    parser.add_argument("--output", default="reports", help="folder the report is written to")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        report = build_report(args.players)
+    except ValueError as e:
+        parser.error(str(e))
+    logger.info("Computed report in %.3f s", time.perf_counter() - start)
+
+    for path in write_report(report, args.output):
+        print(path)
+    verdict = report["verdict"]
+    print(f"{' und '.join(verdict['winners'])} ({verdict['score']})")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
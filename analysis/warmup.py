@@ -0,0 +1,64 @@
+"""
+Warm-up of a server process before it accepts traffic.
+
+The analysis modules are imported and with them pandas, numpy and pyarrow, the datasets and cubes are
+loaded (and ingested, if the typed files are missing), the metrics of all disciplines, the season index
+and the inverted indexes of the drill-downs are computed, the versions of analysis/dependencies.py are
+initialized and matplotlib draws a first figure. All of them are cached per process, so the first session
+of the app or the first request to the API only runs its page or query. See serve.py and the --warm-up
+option of analysis/api.py.
+
+Usage:
+    python -m analysis.warmup
+"""
+import logging
+import time
+
+from analysis.instrument import span
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up(charts=True):
+    """
+    Loads and computes everything the pages share, in the current process.
+
+    Args:
+        charts: Whether matplotlib is imported and draws a first figure as well.
+
+    Returns:
+        seconds: Dictionary of step and seconds.
+    """
+    # pandas, numpy and pyarrow are imported with the analysis modules
+    start = time.perf_counter()
+    from analysis.charts import HAS_MATPLOTLIB, warm_up_charts
+    from analysis.dependencies import refresh
+    from analysis.loading import load_cubes, load_datasets
+    from analysis.lookup import DRILL_DOWNS, inverted_index
+    from analysis.metrics import DISCIPLINES, discipline_metrics
+    from analysis.ranges import season_index
+
+    seconds = {"imports": time.perf_counter() - start}
+    steps = {
+        "load": lambda: (load_datasets(), load_cubes()),
+        "metrics": lambda: [discipline_metrics(name) for name in DISCIPLINES],
+        "season index": season_index,
+        "indexes": lambda: [inverted_index(dataset, column) for dataset, column, _ in DRILL_DOWNS.values()],
+        # only checks the csv files, everything else is cached by the steps before
+        "dependencies": refresh,
+    }
+    if charts and HAS_MATPLOTLIB:
+        steps["charts"] = warm_up_charts
+    with span("warmup"):
+        for step, function in steps.items():
+            start = time.perf_counter()
+            function()
+            seconds[step] = time.perf_counter() - start
+    logger.info("Warmed up in %.2f s (%s)", sum(seconds.values()),
+                ", ".join(f"{step} {value:.2f} s" for step, value in seconds.items()))
+    return seconds
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    warm_up()
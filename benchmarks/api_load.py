@@ -0,0 +1,113 @@
+"""
+Load test of the query service, reporting p50/p99 latency and requests per second.
+
+A fixed mix of queries (every player, discipline, breakdown and a few season ranges) is requested by
+several clients at the same time, every client over its own keep-alive connection. Without --url the
+service is started in this process, once without and once with the result cache.
+
+Usage:
+    python -m benchmarks.api_load [--url http://127.0.0.1:8600] [--clients 8] [--requests 2000]
+"""
+import argparse
+import random
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+import requests
+
+from analysis.api import BREAKDOWNS, QueryServer, ResultCache
+
+SEASONS = [None, "2004-2008", "2009-2013", "2014-2018", "2019-2024"]
+
+
+def query_mix(base_url):
+    """
+    Returns the urls of all queries of the mix.
+
+    Args:
+        base_url: Scheme, host and port of the service.
+
+    Returns:
+        urls: List of urls.
+    """
+    players = requests.get(base_url + "/players", timeout=30).json()["players"]
+    urls = []
+    for player in players:
+        for season in SEASONS:
+            query = f"season={season}" if season else ""
+            urls.append(f"{base_url}/players/{quote(player)}?{query}")
+            for discipline, breakdowns in BREAKDOWNS.items():
+                urls.append(f"{base_url}/players/{quote(player)}/{discipline}?{query}")
+                for by in breakdowns:
+                    urls.append(f"{base_url}/players/{quote(player)}/{discipline}?by={by}&{query}")
+    return urls
+
+
+def run(urls, clients, total, seed=0):
+    """
+    Requests random urls of the mix from several clients at the same time.
+
+    Args:
+        urls: Urls of the mix.
+        clients: Number of concurrent clients.
+        total: Number of requests of all clients together.
+        seed: Seed of the random order of the requests.
+
+    Returns:
+        elapsed: Seconds until all requests were answered.
+        latencies: Seconds every request took.
+        errors: Number of answers that were no success.
+    """
+    rng = random.Random(seed)
+    plans = [[rng.choice(urls) for _ in range(total // clients)] for _ in range(clients)]
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+
+    def client(index):
+        with requests.Session() as session:
+            for url in plans[index]:
+                start = time.perf_counter()
+                response = session.get(url, timeout=30)
+                latencies[index].append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors[index] += 1
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, [latency for own in latencies for latency in own], sum(errors)
+
+
+def report(name, elapsed, latencies, errors, stats=None):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    hits = f"{stats['hits'] / max(stats['hits'] + stats['misses'], 1):.0%}" if stats else "-"
+    print(f"{name:<14} {len(latencies):>9} {errors:>7} {len(latencies) / elapsed:>8.0f} {p50:>9.2f} {p99:>9.2f} {hits:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="url of a running service, started in this process if not given")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=2000, help="requests of all clients together")
+    args = parser.parse_args()
+
+    print(f"{'variant':<14} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 [ms]':>9} {'p99 [ms]':>9} {'cache hits':>10}")
+    if args.url:
+        urls = query_mix(args.url.rstrip("/"))
+        report("service", *run(urls, args.clients, args.requests))
+        return
+
+    for name, cache in [("no cache", ResultCache(max_entries=0)), ("result cache", ResultCache())]:
+        with QueryServer(cache=cache) as server:
+            urls = query_mix(server.base_url)
+            report(name, *run(urls, args.clients, args.requests), cache.stats())
+    print(f"{len(urls)} distinct queries, {args.clients} clients")
+
+
+if __name__ == "__main__":
+    main()
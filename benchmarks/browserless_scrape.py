@@ -0,0 +1,94 @@
+"""
+Measures the browserless penalty and injury scrapers against the local transfermarkt stand-in.
+
+The penalty and injury pages of both players are built from the datasets in the data folder and
+served with a fixed latency per response. The scraped dataframes are compared with the datasets,
+so the benchmark also checks that following the pager gives the same rows as clicking through it.
+
+Usage:
+    python -m benchmarks.browserless_scrape [--latency 0.05] [--requests-per-second N]
+"""
+import argparse
+import io
+import tempfile
+import time
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from benchmarks.transfermarkt_pages import injury_pages, penalty_pages
+from scraping import injuries, penalties
+from scraping.fetch import Fetcher
+from scraping.standin import FixtureServer, save_fixture
+
+# seconds the selenium scrapers sleep after every page
+BROWSER_SLEEP = {"penalties": 4, "injuries": 2}
+
+
+def dataset(name):
+    return pd.read_csv(f"{DATA_DIR}/{DATASETS[name]}")
+
+
+def same_rows(scraped, expected):
+    """
+    Compares a scraped dataframe with a dataset, independent of the row order.
+
+    Args:
+        scraped: Dataframe returned by a scraper.
+        expected: Dataset as stored in the data folder.
+
+    Returns:
+        same: True if both contain the same rows.
+    """
+    # store and read the scraped data like storeData() does, so the types match
+    scraped = pd.read_csv(io.StringIO(scraped.to_csv(index=False)))
+    columns = list(expected.columns)
+    if list(scraped.columns) != columns:
+        return False
+    scraped = scraped.sort_values(columns).reset_index(drop=True)
+    expected = expected.sort_values(columns).reset_index(drop=True)
+    return scraped.equals(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every response is delayed")
+    parser.add_argument("--requests-per-second", type=float, default=None, help="rate limit of the fetcher")
+    args = parser.parse_args()
+
+    scrapers = {
+        "penalties": (penalties, penalty_pages, dataset("penalties")),
+        "injuries": (injuries, injury_pages, dataset("injuries")),
+    }
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        page_count = {}
+        for name, (module, build_pages, data) in scrapers.items():
+            page_count[name] = 0
+            for player_name, page in module.PAGES.items():
+                rows = data[data["player_name"] == player_name].drop(columns="player_name")
+                for url, content in build_pages(rows, page).items():
+                    save_fixture(url, content, fixture_dir)
+                    page_count[name] += 1
+
+        print(f"{args.latency * 1000:.0f} ms latency, rate limit {args.requests_per_second or 'off'}")
+        print(f"{'dataset':<10} {'pages':>6} {'total [s]':>10} {'per player [s]':>15} {'same rows':>10} {'browser sleeps [s]':>19}")
+        with FixtureServer(fixture_dir, latency=args.latency) as server:
+            for name, (module, _, data) in scrapers.items():
+                fetcher = Fetcher(requests_per_second=args.requests_per_second, base_url=server.base_url)
+                start = time.perf_counter()
+                df = module.scrape(fetcher=fetcher)
+                elapsed = time.perf_counter() - start
+                fetcher.close()
+                players = len(module.PAGES)
+                # the selenium scrapers open the penalty page twice, once per box
+                sleeps = page_count[name] * BROWSER_SLEEP[name]
+                if name == "penalties":
+                    sleeps += players * BROWSER_SLEEP[name]
+                print(
+                    f"{name:<10} {page_count[name]:>6} {elapsed:>10.3f} {elapsed / players:>15.3f}"
+                    f" {str(same_rows(df, data)):>10} {sleeps:>19}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Measures the data the bar charts of the pages send to the browser for different binnings.
+
+Every page with bar charts is run with the streamlit test runner once per binning of the sidebar. For every
+chart the points and the bytes of the Arrow data of its Vega-Lite element are read from the sent messages,
+together with the time of the rerun of the page. "fein" shows every minute, season and competition, the
+others bin them on the server, see analysis/binning.py. Run it with DASHBOARD_DATA_DIR set to the synthetic
+datasets of benchmarks/synthetic.py to see the payloads of larger data.
+
+Usage:
+    python -m benchmarks.chart_payload [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import pyarrow as pa
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.scaling import APP
+
+# pages with bar charts
+PAGES = ["sections/goals.py", "sections/penalties.py", "sections/fair_play.py"]
+
+# binning -> values of the widgets of the sidebar
+BINNINGS = {
+    "fein": {"minute_bin": 1, "season_group": 1, "top_competitions": 0},
+    "standard": {"minute_bin": 5, "season_group": 1, "top_competitions": 10},
+    "grob": {"minute_bin": 15, "season_group": 5, "top_competitions": 5},
+}
+
+
+def chart_payloads(app):
+    """
+    Returns the points and bytes of the data of every chart of a run page.
+
+    Args:
+        app: Test runner after the run of the page.
+
+    Returns:
+        payloads: List of (points, bytes) in the order of the charts.
+    """
+    payloads = []
+    for chart in app.get("vega_lite_chart"):
+        points = size = 0
+        for dataset in chart.proto.datasets:
+            size += len(dataset.data.data)
+            points += pa.ipc.open_stream(dataset.data.data).read_all().num_rows
+        payloads.append((points, size))
+    return payloads
+
+
+def run_page(page, binning, repeat):
+    """
+    Runs a page with a binning.
+
+    Args:
+        page: Script of the page.
+        binning: Values of the widgets of the sidebar.
+        repeat: Reruns of the page, the median of their time is returned.
+
+    Returns:
+        payloads: Result of chart_payloads().
+        seconds: Median time of a rerun of the page.
+    """
+    app = AppTest.from_file(APP, default_timeout=600).run()
+    app.switch_page(page).run()
+    for key, value in binning.items():
+        app.select_slider(key=key).set_value(value).run()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        times.append(time.perf_counter() - start)
+    if app.exception:
+        raise RuntimeError(f"{page} failed: {app.exception[0].message}")
+    return chart_payloads(app), float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="reruns of every page and binning")
+    args = parser.parse_args()
+
+    print(f"{'page':<24} {'chart':>5} " + " ".join(f"{name + ' points':>16} {name + ' KB':>12}" for name in BINNINGS))
+    totals = {name: [0, 0, 0.0] for name in BINNINGS}
+    for page in PAGES:
+        results = {name: run_page(page, binning, args.repeat) for name, binning in BINNINGS.items()}
+        for number, charts in enumerate(zip(*(payloads for payloads, _ in results.values()))):
+            print(f"{page:<24} {number:>5} " + " ".join(f"{points:>16} {size / 1024:>12.2f}" for points, size in charts))
+        for name, (payloads, seconds) in results.items():
+            totals[name][0] += sum(points for points, _ in payloads)
+            totals[name][1] += sum(size for _, size in payloads)
+            totals[name][2] += seconds
+    print()
+    for name, (points, size, seconds) in totals.items():
+        print(f"{name:<9} {points:>6} points {size / 1024:>9.1f} KB, rerun of the pages {seconds * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Measures the cold start of the app and checks it against the budget in benchmarks/cold_start_budget.json.
+
+Every measurement runs in a fresh python process, with the typed files already built like in the image of
+a container:
+- import: python -X importtime of the modules app.py imports. Streamlit itself is imported before the server
+  accepts sessions and is not counted. No module of "forbidden_imports" may be imported by them, e.g.
+  matplotlib is only imported when the first chart is drawn.
+- first response: the overview page and then the goals page are run for the first time with the streamlit
+  test runner, once in a cold process and once after warm_up() of analysis/warmup.py, as done by serve.py.
+The medians of --repeat processes are compared with the budget; with --check the benchmark exits with 1 if
+one of them is exceeded, which is what CI runs.
+
+Usage:
+    python -m benchmarks.cold_start [--repeat 3] [--check] [--budget benchmarks/cold_start_budget.json]
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+BUDGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cold_start_budget.json")
+
+# pages run for the first time, None is the overview
+PAGES = [None, "sections/goals.py"]
+
+
+def app_imports():
+    """
+    Returns the modules imported by app.py, without streamlit.
+
+    Returns:
+        modules: Module names in the order of the imports.
+    """
+    with open(APP, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules.append(node.module)
+    return [module for module in modules if module.split(".")[0] != "streamlit"]
+
+
+def import_times():
+    """
+    Imports streamlit and the modules of app.py with -X importtime in a fresh process.
+
+    Returns:
+        milliseconds: Cumulative import time of the modules of app.py.
+        modules: Names of all modules imported after streamlit.
+    """
+    code = "import streamlit\nimport " + ", ".join(app_imports())
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                             cwd=ROOT, check=True)
+    lines = [line for line in process.stderr.splitlines() if line.startswith("import time:") and "|" in line]
+    entries = []
+    for line in lines[1:]:
+        _, cumulative, name = line.split("|")
+        # nested imports are indented by two spaces after the separating space
+        entries.append((int(cumulative), name[1:].rstrip()))
+    # the modules of the import statement of the app follow the last top level module of streamlit
+    last_streamlit = max(number for number, (_, name) in enumerate(entries) if name == "streamlit")
+    app = entries[last_streamlit + 1:]
+    microseconds = sum(cumulative for cumulative, name in app if not name.startswith(" "))
+    return microseconds / 1000, [name.strip() for _, name in app]
+
+
+def first_response(warm):
+    """
+    Runs the pages of PAGES for the first time in the current process.
+
+    Args:
+        warm: Whether the process is warmed up before.
+
+    Returns:
+        milliseconds: Dictionary of step and milliseconds, "warm-up" and one entry per page.
+    """
+    # imported before the server accepts sessions
+    from streamlit.testing.v1 import AppTest
+
+    milliseconds = {}
+    if warm:
+        from analysis.warmup import warm_up
+
+        start = time.perf_counter()
+        warm_up()
+        milliseconds["warm-up"] = (time.perf_counter() - start) * 1000
+    for page in PAGES:
+        start = time.perf_counter()
+        app = AppTest.from_file(APP, default_timeout=300).run()
+        if page is not None:
+            app.switch_page(page).run()
+        if app.exception:
+            raise RuntimeError(f"{page or 'overview'} failed: {app.exception[0].message}")
+        milliseconds[page or "overview"] = (time.perf_counter() - start) * 1000
+    return milliseconds
+
+
+def measure_process(warm):
+    # the first responses of a fresh process, see first_response()
+    command = [sys.executable, "-m", "benchmarks.cold_start", "--measure", "warm" if warm else "cold"]
+    process = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def median(runs):
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def measure(repeat):
+    """
+    Measures the imports and the first responses in fresh processes.
+
+    Args:
+        repeat: Number of processes per measurement.
+
+    Returns:
+        results: Dictionary with the medians in milliseconds and the imported modules.
+    """
+    subprocess.run([sys.executable, "-m", "analysis.ingest"], capture_output=True, cwd=ROOT, check=True)
+    imports = [import_times() for _ in range(repeat)]
+    return {
+        "import_ms": statistics.median(milliseconds for milliseconds, _ in imports),
+        "imported_modules": imports[0][1],
+        "cold_ms": median([measure_process(False) for _ in range(repeat)]),
+        "warm_ms": median([measure_process(True) for _ in range(repeat)]),
+    }
+
+
+def check(results, budget):
+    """
+    Compares the results with the budget.
+
+    Args:
+        results: Result of measure().
+        budget: Dictionary of import_ms, cold_ms and warm_ms (both per page) and forbidden_imports.
+
+    Returns:
+        violations: Descriptions of the exceeded budgets, empty if none is exceeded.
+    """
+    violations = []
+    if results["import_ms"] > budget["import_ms"]:
+        violations.append(f"imports of app.py took {results['import_ms']:.0f} ms, budget {budget['import_ms']} ms")
+    for name in budget["forbidden_imports"]:
+        if any(module == name or module.startswith(name + ".") for module in results["imported_modules"]):
+            violations.append(f"app.py imports {name}")
+    for variant in ["cold_ms", "warm_ms"]:
+        for page, limit in budget[variant].items():
+            if results[variant][page] > limit:
+                violations.append(f"{variant[:-3]} first response of {page} took {results[variant][page]:.0f} ms, "
+                                  f"budget {limit} ms")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per measurement")
+    parser.add_argument("--budget", default=BUDGET, help="JSON file of the budget")
+    parser.add_argument("--check", action="store_true", help="exit with 1 if a budget is exceeded")
+    parser.add_argument("--measure", choices=["cold", "warm"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(first_response(args.measure == "warm")))
+        return
+
+    with open(args.budget, encoding="utf-8") as file:
+        budget = json.load(file)
+    results = measure(args.repeat)
+    print(f"{'step':<32} {'median [ms]':>12} {'budget [ms]':>12}")
+    print(f"{'import app.py':<32} {results['import_ms']:>12.0f} {budget['import_ms']:>12}")
+    for variant in ["cold_ms", "warm_ms"]:
+        for step, milliseconds in results[variant].items():
+            limit = budget[variant].get(step, "")
+            print(f"{variant[:-3] + ' ' + step:<32} {milliseconds:>12.0f} {limit:>12}")
+    violations = check(results, budget)
+    for violation in violations:
+        print(f"budget exceeded: {violation}")
+    if args.check and violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
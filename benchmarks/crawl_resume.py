@@ -0,0 +1,180 @@
+"""
+Kills a crawl of a synthetic player registry halfway and checks that the next crawl resumes it.
+
+Every synthetic player gets the pages of Messi or Ronaldo under its own transfermarkt id, served by
+the local stand-in. The crawl runs as a subprocess, which is killed once half of its jobs are logged
+as done. The second crawl has to skip those jobs, and the combined datasets have to contain the rows
+of the source player for every synthetic player.
+
+Usage:
+    python -m benchmarks.crawl_resume [--players 40] [--workers 8] [--latency 0.02]
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from benchmarks import transfermarkt_pages
+from scraping import crawl
+from scraping.players import load_players, player_page
+from scraping.standin import FixtureServer, save_fixture
+
+# dataset -> page builder
+BUILDERS = {
+    "achievements": transfermarkt_pages.achievement_pages,
+    "club_goals": transfermarkt_pages.goal_pages,
+    "club_performances": transfermarkt_pages.club_performance_pages,
+    "injuries": transfermarkt_pages.injury_pages,
+    "international_performances": transfermarkt_pages.international_pages,
+    "penalties": transfermarkt_pages.penalty_pages,
+}
+
+TOP_SCORERS = {
+    "la_liga_top_scorer": transfermarkt_pages.la_liga_top_scorer_pages,
+    "cl_top_scorer": transfermarkt_pages.cl_top_scorer_pages,
+}
+
+
+def create_registry(path, n):
+    """
+    Writes a registry of synthetic players, alternately copies of the registered players.
+
+    Args:
+        path: Path of the registry file.
+        n: Number of players.
+
+    Returns:
+        sources: Dictionary of synthetic player name and name of the player it copies.
+    """
+    registered = list(load_players().values())
+    entries, sources = [], {}
+    for i in range(n):
+        source = registered[i % len(registered)]
+        name = f"Spieler {i:03d}"
+        entries.append({**source, "name": name, "slug": f"spieler-{i}", "transfermarkt_id": 900000 + i})
+        sources[name] = source["name"]
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(entries, file, ensure_ascii=False, indent=1)
+    return sources
+
+
+def save_pages(players, sources, fixture_dir):
+    """
+    Saves the pages of every synthetic player and the top scorer lists as fixtures.
+    Pages without pager are built once per source player and saved under the url of every copy.
+
+    Args:
+        players: Registry entries of the synthetic players.
+        sources: Dictionary of synthetic player name and source player name.
+        fixture_dir: Folder of the fixtures.
+    """
+    for dataset, build_pages in BUILDERS.items():
+        data = pd.read_csv(os.path.join(DATA_DIR, DATASETS[dataset]))
+        built = {}
+        for name, player in players.items():
+            page = player_page(player, dataset)
+            rows = data[data["player_name"] == sources[name]].drop(columns="player_name")
+            if dataset in ["penalties", "injuries"]:
+                # the links of the pager contain the url of the player
+                for url, content in build_pages(rows, page).items():
+                    save_fixture(url, content, fixture_dir)
+                continue
+            if sources[name] not in built:
+                built[sources[name]] = next(iter(build_pages(rows, page).values()))
+            save_fixture(page, built[sources[name]], fixture_dir)
+    for dataset, build_pages in TOP_SCORERS.items():
+        data = pd.read_csv(os.path.join(DATA_DIR, DATASETS[dataset]))
+        for url, content in build_pages(data, crawl.KINDS[dataset][0].PAGE).items():
+            save_fixture(url, content, fixture_dir)
+
+
+def expected_rows(dataset, sources):
+    """
+    Returns the rows a complete crawl stores for a dataset.
+
+    Args:
+        dataset: Name of the dataset.
+        sources: Dictionary of synthetic player name and source player name.
+
+    Returns:
+        df: Dataset as text.
+    """
+    data = pd.read_csv(os.path.join(DATA_DIR, DATASETS[dataset]), dtype=str, keep_default_na=False)
+    if dataset in TOP_SCORERS:
+        return data
+    return pd.concat(
+        [data[data["player_name"] == source].assign(player_name=name) for name, source in sources.items()],
+        ignore_index=True,
+    )
+
+
+def sort_rows(df):
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def logged(log_path, status="done"):
+    if not os.path.exists(log_path):
+        return 0
+    with open(log_path, encoding="utf-8") as file:
+        return sum(1 for line in file if f'"status": "{status}"' in line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds every response is delayed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = os.path.join(tmp, "players.json")
+        fixture_dir, out_dir, data_dir = (os.path.join(tmp, name) for name in ["fixtures", "crawl", "data"])
+        sources = create_registry(registry, args.players)
+        players = load_players(registry)
+        save_pages(players, sources, fixture_dir)
+        jobs = len(crawl.expand(players))
+        log_path = os.path.join(out_dir, "jobs.log")
+
+        with FixtureServer(fixture_dir, latency=args.latency) as server:
+            command = [
+                sys.executable, "-m", "scraping.crawl", "--registry", registry, "--out", out_dir,
+                "--workers", str(args.workers), "--base-url", server.base_url,
+            ]
+            print(f"{args.players} players, {jobs} jobs, {args.workers} workers, {args.latency * 1000:.0f} ms latency")
+            print(f"{'run':<22} {'time [s]':>9} {'requests':>9} {'jobs done':>10} {'logged':>7}")
+
+            start, requests_before = time.perf_counter(), server.requests
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+            while logged(log_path) < jobs // 2 and process.poll() is None:
+                time.sleep(0.05)
+            process.send_signal(signal.SIGKILL)
+            process.wait()
+            first = logged(log_path)
+            print(f"{'killed halfway':<22} {time.perf_counter() - start:>9.2f} {server.requests - requests_before:>9} {first:>10} {first:>7}")
+
+            start, requests_before = time.perf_counter(), server.requests
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            second = logged(log_path) - first
+            print(f"{'resumed':<22} {time.perf_counter() - start:>9.2f} {server.requests - requests_before:>9} {second:>10} {logged(log_path):>7}")
+            print(output.strip().splitlines()[-1])
+
+        # combined into a temporary data folder, the datasets of the repository are kept
+        crawl.combine(players, out_dir=out_dir, data_dir=data_dir)
+        print(f"{'dataset':<28} {'rows':>7} {'same rows':>10}")
+        for dataset in crawl.KINDS:
+            df = pd.read_csv(os.path.join(data_dir, DATASETS[dataset]), dtype=str, keep_default_na=False)
+            # rows of the same game can be scraped in another order than stored
+            same = sort_rows(df).equals(sort_rows(expected_rows(dataset, sources)))
+            print(f"{dataset:<28} {len(df):>7} {str(same):>10}")
+        print(f"jobs run twice: {first + second - jobs}, failed: {logged(log_path, 'failed')}")
+
+
+if __name__ == "__main__":
+    main()
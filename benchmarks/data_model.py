@@ -0,0 +1,124 @@
+"""
+Compares memory and filter, groupby and join times of the datasets as text, with categories per dataset and with shared vocabularies.
+
+The csv files are read as text like the notebooks did, then normalized with categories built per dataset,
+and finally normalized with the shared vocabularies of analysis/ingest.py, as the app loads them. The rows
+of every dataset are repeated to make the timings measurable. Every operation has to return the same
+values for all models.
+
+Usage:
+    python -m benchmarks.data_model [--scale 100] [--repeat 5]
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from analysis import ingest
+from analysis.config import DATA_DIR, DATASETS
+from sections.common import cr
+
+MODELS = ["text", "per dataset", "shared"]
+
+
+def load_models(scale):
+    """
+    Reads the player datasets in the three models.
+
+    Args:
+        scale: Number of times the rows of every dataset are repeated.
+
+    Returns:
+        models: Dictionary of model name and dictionary of dataset name and dataframe.
+    """
+    raw = {name: pd.read_csv(os.path.join(DATA_DIR, DATASETS[name])) for name in ingest.VOCABULARY_SOURCES}
+    vocabularies = ingest.build_vocabularies(raw)
+    models = {
+        "text": raw,
+        "per dataset": {name: ingest.normalize(name, df) for name, df in raw.items()},
+        "shared": {name: ingest.normalize(name, df, vocabularies) for name, df in raw.items()},
+    }
+    return {
+        model: {name: pd.concat([df] * scale, ignore_index=True) for name, df in data.items()}
+        for model, data in models.items()
+    }
+
+
+def filter_player(data):
+    club_goals = data["club_goals"]
+    return club_goals.loc[club_goals["player_name"] == cr, ["game_id", "opponent"]]
+
+
+def group_opponents(data):
+    return data["club_goals"].groupby(["player_name", "opponent"], observed=True).size()
+
+
+def join_opponents(data):
+    # goals and penalties against every opponent, joined on player and opponent
+    goals = data["club_goals"].groupby(["player_name", "opponent"], observed=True).size().rename("goals").reset_index()
+    penalties = data["penalties"].groupby(["player_name", "opponent"], observed=True).size().rename("penalties").reset_index()
+    return goals.merge(penalties, on=["player_name", "opponent"])
+
+
+def concat_competitions(data):
+    # club and international games in one table, like the performances cube
+    club = data["club_performances"][["player_name", "competition"]]
+    international = data["international_performances"][["player_name", "tournament"]].rename(columns={"tournament": "competition"})
+    rows = pd.concat([club, international], ignore_index=True)
+    return rows.groupby(["player_name", "competition"], observed=True).size()
+
+
+OPERATIONS = {
+    "filter player": filter_player,
+    "groupby opponent": group_opponents,
+    "join opponents": join_opponents,
+    "concat + groupby": concat_competitions,
+}
+
+
+def as_text(result):
+    # result of an operation as sorted text rows, so the models can be compared, the raw text is not stripped
+    df = result.reset_index() if isinstance(result, pd.Series) else result
+    return sorted(str([value.strip() for value in row]) for row in df.astype(str).values.tolist())
+
+
+def best_time(function, data, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(data)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="times the rows of every dataset are repeated")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of every operation, the fastest is shown")
+    args = parser.parse_args()
+
+    models = load_models(args.scale)
+    print(f"rows repeated {args.scale} times")
+    print(f"{'dataset':<28} {'rows':>9} " + " ".join(f"{model + ' [MB]':>16}" for model in MODELS))
+    totals = dict.fromkeys(MODELS, 0)
+    for name in ingest.VOCABULARY_SOURCES:
+        sizes = {model: models[model][name].memory_usage(deep=True).sum() / 1e6 for model in MODELS}
+        for model in MODELS:
+            totals[model] += sizes[model]
+        print(f"{name:<28} {len(models['text'][name]):>9} " + " ".join(f"{sizes[model]:>16.2f}" for model in MODELS))
+    print(f"{'total':<28} {'':>9} " + " ".join(f"{totals[model]:>16.2f}" for model in MODELS))
+
+    print()
+    print(f"{'operation':<28} " + " ".join(f"{model + ' [ms]':>16}" for model in MODELS) + f" {'same':>5}")
+    for operation, function in OPERATIONS.items():
+        times, results = {}, {}
+        for model in MODELS:
+            times[model], result = best_time(function, models[model], args.repeat)
+            results[model] = as_text(result)
+        same = all(results[model] == results["text"] for model in MODELS)
+        print(f"{operation:<28} " + " ".join(f"{times[model] * 1000:>16.2f}" for model in MODELS) + f" {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
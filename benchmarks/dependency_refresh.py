@@ -0,0 +1,119 @@
+"""
+Compares the recomputation after a changed dataset with a full recomputation by a restarted process.
+
+The csv files are copied to a temporary data folder and ingested, a fresh process with DASHBOARD_DATA_DIR
+pointing to that folder is warmed up with analysis/warmup.py. Then one dataset after the other is appended
+by a copy of its last row and refresh() of analysis/dependencies.py recomputes the nodes downstream of it,
+as done by the watcher of a running server. For every dataset the recomputed nodes, the pages rerun in the
+open sessions and the time of the refresh are printed. The full recomputation is measured in another fresh
+process without the typed files, which ingests and computes everything again like a restart after a
+change would have to.
+
+Usage:
+    python -m benchmarks.dependency_refresh [--datasets penalties most_assists]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.dependencies import NODES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def append_last_row(path):
+    # some scraped files do not end with a line break
+    with open(path, encoding="utf-8") as file:
+        content = file.read()
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(("" if content.endswith("\n") else "\n") + content.splitlines()[-1] + "\n")
+
+
+def measure_full():
+    """
+    Ingests and computes everything in the current process, after removing the typed files.
+
+    Returns:
+        seconds: Seconds without the imports.
+    """
+    from analysis.config import TYPED_DIR
+    from analysis.warmup import warm_up
+
+    shutil.rmtree(TYPED_DIR, ignore_errors=True)
+    seconds = warm_up(charts=False)
+    return sum(value for step, value in seconds.items() if step != "imports")
+
+
+def measure_incremental(names):
+    """
+    Warms up the current process and appends the datasets one after the other.
+
+    Args:
+        names: Names of the datasets to append.
+
+    Returns:
+        results: Dictionary of dataset and its changed nodes, the rerun pages and the seconds of the refresh.
+    """
+    from analysis.config import DATA_DIR as data_dir
+    from analysis.dependencies import refresh
+    from analysis.warmup import warm_up
+    from sections.common import dependencies
+
+    warm_up(charts=False)
+    results = {}
+    for name in names:
+        append_last_row(os.path.join(data_dir, DATASETS[name]))
+        start = time.perf_counter()
+        changed = refresh()
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "seconds": elapsed,
+            "nodes": sorted(node for node in changed if not node.startswith("csv:")),
+            "pages": [script for script, nodes in dependencies.items() if changed.intersection(["season_range", *nodes])],
+        }
+    return results
+
+
+def measure_process(args, env):
+    # a fresh process with the temporary data folder, see measure_incremental() and measure_full()
+    command = [sys.executable, "-m", "benchmarks.dependency_refresh", "--measure", *args]
+    process = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, env=env)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS), default=list(DATASETS),
+                        help="datasets appended one after the other")
+    parser.add_argument("--measure", choices=["incremental", "full"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_incremental(args.datasets) if args.measure == "incremental" else measure_full()))
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        for file_name in DATASETS.values():
+            shutil.copy(os.path.join(DATA_DIR, file_name), data_dir)
+        env = dict(os.environ, DASHBOARD_DATA_DIR=data_dir, DATA_WATCH_SECONDS="0")
+        subprocess.run([sys.executable, "-m", "analysis.ingest"], capture_output=True, cwd=ROOT, env=env, check=True)
+        results = measure_process(["incremental", "--datasets", *args.datasets], env)
+        full = measure_process(["full"], env)
+
+    print(f"{'dataset':<28} {'refresh [ms]':>12} {'nodes':>6}  pages")
+    for name, result in results.items():
+        pages = ", ".join(os.path.basename(script)[:-3] for script in result["pages"]) or "-"
+        print(f"{name:<28} {result['seconds'] * 1000:>12.0f} {len(result['nodes']):>6}  {pages}")
+    print(f"{'full recomputation':<28} {full * 1000:>12.0f} {len(NODES) - len(DATASETS):>6}  all")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares the drill-down queries of the inverted indexes with full scans on datasets with millions of rows.
+
+The rows of every dataset of a drill-down are drawn at random from the typed dataset until it has --rows rows,
+keeping the columns shown by the drill-down, and spread over --players synthetic players. For random players
+and value sets the matching rows are taken once through the InvertedIndex of analysis/lookup.py and once by
+comparing every row, and both have to be the same rows. The time of the index is split into finding the
+positions and taking the rows.
+
+Usage:
+    python -m benchmarks.drilldown [--rows 5000000] [--players 100] [--queries 50]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis.loading import load_dataset
+from analysis.lookup import DRILL_DOWNS, InvertedIndex
+
+
+def synthetic_dataset(name, columns, rows, players, seed=0):
+    """
+    Draws random rows of a typed dataset and assigns them to random synthetic players.
+
+    Args:
+        name: Name of the dataset.
+        columns: Columns of the drawn rows, without player_name.
+        rows: Number of rows.
+        players: Number of synthetic players.
+        seed: Seed of the drawn rows.
+
+    Returns:
+        df: Dataframe with player_name and the columns.
+    """
+    rng = np.random.default_rng(seed)
+    df = load_dataset(name)[columns]
+    df = df.take(rng.integers(0, len(df), rows)).reset_index(drop=True)
+    names = [f"Spieler {i + 1:03d}" for i in range(players)]
+    player_name = pd.Categorical.from_codes(rng.integers(0, players, rows), categories=names)
+    return df.assign(player_name=player_name)[["player_name"] + columns]
+
+
+def scan(df, column, values, player):
+    # the matching rows found by comparing every row of the dataset
+    return df[(df["player_name"] == player) & df[column].isin(values)]
+
+
+def queries(index, count, seed=0):
+    """
+    Returns random drill-down queries, one to four values of the column for one of the players.
+
+    Args:
+        index: InvertedIndex of the dataset.
+        count: Number of queries.
+        seed: Seed of the queries.
+
+    Returns:
+        queries: List of (values, player).
+    """
+    rng = random.Random(seed)
+    values = index.counts().index.tolist()
+    players = list(index.players)
+    return [(rng.sample(values, min(len(values), rng.randint(1, 4))), rng.choice(players)) for _ in range(count)]
+
+
+def milliseconds(times):
+    p50, p95 = np.percentile(times, [50, 95]) * 1000
+    return f"{p50:>9.3f} {p95:>9.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5_000_000, help="rows of every synthetic dataset")
+    parser.add_argument("--players", type=int, default=100, help="synthetic players the rows are spread over")
+    parser.add_argument("--queries", type=int, default=50, help="random queries per drill-down")
+    args = parser.parse_args()
+
+    print(f"{'drill-down':<26} {'build [s]':>9} {'variant':<9} {'p50 [ms]':>9} {'p95 [ms]':>9} {'rows':>8}")
+    same = True
+    for name, (dataset, column, columns) in DRILL_DOWNS.items():
+        df = synthetic_dataset(dataset, [column] + [c for c in columns if c != column], args.rows, args.players)
+        start = time.perf_counter()
+        index = InvertedIndex(df, column)
+        build = time.perf_counter() - start
+
+        position_times, index_times, scan_times, rows = [], [], [], 0
+        for values, player in queries(index, args.queries):
+            start = time.perf_counter()
+            index.positions(values, player)
+            position_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            found = index.rows(values, player)
+            index_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            expected = scan(df, column, values, player)
+            scan_times.append(time.perf_counter() - start)
+            same = same and found.index.equals(expected.index)
+            rows += len(found)
+        print(f"{name:<26} {build:>9.2f} {'positions':<9} {milliseconds(position_times)} {rows // args.queries:>8}")
+        print(f"{'':<26} {'':>9} {'index':<9} {milliseconds(index_times)}")
+        print(f"{'':<26} {'':>9} {'scan':<9} {milliseconds(scan_times)}")
+    print(f"{args.queries} queries per drill-down, same rows as the scans: {same}")
+
+
+if __name__ == "__main__":
+    main()
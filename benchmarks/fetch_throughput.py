@@ -0,0 +1,99 @@
+"""
+Measures the pages per second of the fetch layer against the local transfermarkt stand-in.
+
+Synthetic pages are served with a fixed latency per response, like a remote server. The baseline
+requests every page on its own with requests.get, as the notebooks did; it is compared with the
+pooled Fetcher at different numbers of workers. Then the pages are fetched three times with the
+on-disk cache: the first run fills it, the second revalidates every page (304 Not Modified) and the
+third replays the pages offline.
+
+Usage:
+    python -m benchmarks.fetch_throughput [--pages 200] [--latency 0.05] [--workers 1 4 8 16]
+"""
+import argparse
+import tempfile
+import time
+
+import requests
+
+from scraping.cache import ResponseCache
+from scraping.fetch import HEADERS, Fetcher
+from scraping.standin import FixtureServer, save_fixture
+
+
+def create_pages(fixture_dir, n, size=100_000):
+    """
+    Stores synthetic pages of a given size as fixtures.
+
+    Args:
+        fixture_dir: Folder of the fixtures.
+        n: Number of pages.
+        size: Size of every page in bytes.
+
+    Returns:
+        urls: Transfermarkt urls of the pages.
+    """
+    urls = []
+    row = b"<tr class=\"odd\"><td>1</td><td>Spieler</td><td>42</td></tr>"
+    for i in range(n):
+        url = f"https://www.transfermarkt.at/benchmark/seite/{i}"
+        body = b"<html><body><table><tbody>" + row * (size // len(row)) + b"</tbody></table></body></html>"
+        save_fixture(url, body, fixture_dir)
+        urls.append(url)
+    return urls
+
+
+def fetch_naive(urls, base_url):
+    # one request and one connection per page, one page after the other
+    fetcher = Fetcher(base_url=base_url)
+    return [requests.get(fetcher.url(url), headers=HEADERS).content for url in urls]
+
+
+def fetch_pooled(urls, base_url, workers):
+    with Fetcher(max_workers=workers, requests_per_second=None, base_url=base_url) as fetcher:
+        return fetcher.fetch_many(urls)
+
+
+def fetch_cached(urls, base_url, workers, cache_dir, offline=False):
+    cache = ResponseCache(cache_dir)
+    with Fetcher(max_workers=workers, requests_per_second=None, base_url=base_url, cache=cache, offline=offline) as fetcher:
+        return fetcher.fetch_many(urls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every response is delayed")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as fixture_dir, tempfile.TemporaryDirectory() as cache_dir:
+        urls = create_pages(fixture_dir, args.pages)
+        with FixtureServer(fixture_dir, latency=args.latency) as server:
+            variants = [("requests.get", lambda: fetch_naive(urls, server.base_url))]
+            variants += [
+                (f"Fetcher, {workers} workers", lambda workers=workers: fetch_pooled(urls, server.base_url, workers))
+                for workers in args.workers
+            ]
+            workers = max(args.workers)
+            variants += [
+                (name, lambda offline=offline: fetch_cached(urls, server.base_url, workers, cache_dir, offline))
+                for name, offline in [("cache, first run", False), ("cache, revalidated", False), ("cache, offline", True)]
+            ]
+
+            print(f"{args.pages} pages, {args.latency * 1000:.0f} ms latency")
+            print(f"{'variant':<22} {'time [s]':>9} {'pages/s':>9}")
+            baseline = None
+            for name, function in variants:
+                start = time.perf_counter()
+                contents = function()
+                elapsed = time.perf_counter() - start
+                if baseline is None:
+                    baseline = contents
+                elif contents != baseline:
+                    raise AssertionError(f"{name} returned different pages")
+                print(f"{name:<22} {elapsed:>9.2f} {len(urls) / elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
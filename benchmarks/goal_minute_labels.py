@@ -0,0 +1,93 @@
+"""
+Compares the row wise labelling of goal minutes with DataFrame.apply against minute_labels().
+
+The goal rows are generated with the distribution of the club goal dataset: regular minutes 1 to 90,
+added time after the 45th and 90th minute and a few goals in extra time.
+
+Usage:
+    python -m benchmarks.goal_minute_labels [--sizes 10000 1000000 10000000] [--max-apply-rows N]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis.metrics import match_phase, minute_labels
+
+
+def goal_rows(n, seed=0):
+    """
+    Generates random goal minutes.
+
+    Args:
+        n: Number of goals.
+        seed: Seed of the random generator.
+
+    Returns:
+        goals: Dataframe with the columns goal_minute and added_time.
+    """
+    rng = np.random.default_rng(seed)
+    minute = rng.integers(1, 91, n)
+    # about 5% of the goals are scored in added time and 1% in extra time
+    phase = rng.random(n)
+    minute[phase < 0.02] = 45
+    minute[(phase >= 0.02) & (phase < 0.05)] = 90
+    extra = phase >= 0.99
+    minute[extra] = rng.integers(91, 121, extra.sum())
+    added = np.where(phase < 0.05, rng.integers(1, 11, n), 0)
+    return pd.DataFrame({"goal_minute": minute.astype("int16"), "added_time": added.astype("int16")})
+
+
+def label_apply(goals):
+    """
+    Row wise labelling as done in app.py before minute_labels() existed.
+    """
+    return goals.apply(
+        lambda row: f"{row['goal_minute']}+{row['added_time']}" if row['added_time'] > 0 else str(row['goal_minute']), axis=1
+    )
+
+
+def label_vectorized(goals):
+    """
+    Vectorized labelling and phase assignment.
+    """
+    labels = minute_labels(goals["goal_minute"], goals["added_time"])
+    match_phase(goals["goal_minute"], goals["added_time"])
+    return labels
+
+
+def measure(function, goals, repeat):
+    # returns the fastest of several runs and the result of the last run
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(goals)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--max-apply-rows", type=int, default=None, help="skip the apply variant above this number of rows")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'apply [s]':>12} {'vectorized [s]':>15} {'speedup':>9}")
+    for n in args.sizes:
+        goals = goal_rows(n)
+        vectorized, labels = measure(label_vectorized, goals, args.repeat)
+        if args.max_apply_rows is not None and n > args.max_apply_rows:
+            print(f"{n:>12} {'skipped':>12} {vectorized:>15.4f} {'':>9}")
+            continue
+        # the apply variant is run once, it takes minutes for millions of rows
+        applied, expected = measure(label_apply, goals, 1)
+        if not (labels.astype(str) == expected).all():
+            raise AssertionError(f"labels differ for {n} rows")
+        print(f"{n:>12} {applied:>12.4f} {vectorized:>15.4f} {applied / vectorized:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares a full scrape of the penalties and injuries with an incremental refresh against the local stand-in.
+
+The pages are built from the complete datasets. The refresh starts from a copy of the datasets without
+the newest rows of every player, as if those were played since the last run, and has to add them again.
+
+Usage:
+    python -m benchmarks.incremental_refresh [--new-rows 3] [--latency 0.05]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from benchmarks.transfermarkt_pages import injury_pages, penalty_pages
+from scraping import incremental
+from scraping.fetch import Fetcher
+from scraping.standin import FixtureServer, save_fixture
+from scraping.store import storeData
+
+PAGES = {"penalties": penalty_pages, "injuries": injury_pages}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--new-rows", type=int, default=3, help="newest rows of every player removed before the refresh")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds every response is delayed")
+    args = parser.parse_args()
+
+    print(f"{'dataset':<10} {'variant':<12} {'requests':>9} {'time [s]':>9} {'rows':>6} {'same rows':>10}")
+    with tempfile.TemporaryDirectory() as fixture_dir, tempfile.TemporaryDirectory() as data_dir:
+        for name, build_pages in PAGES.items():
+            module = incremental.INCREMENTAL[name][0]
+            data = incremental.read_dataset(name)
+            typed = pd.read_csv(os.path.join(DATA_DIR, DATASETS[name]))
+            for player_name, page in module.PAGES.items():
+                rows = typed[typed["player_name"] == player_name].drop(columns="player_name")
+                for url, content in build_pages(rows, page).items():
+                    save_fixture(url, content, fixture_dir)
+
+            # the stored rows are newest first, the newest rows of every player are dropped
+            older = data[data.groupby("player_name", sort=False).cumcount() >= args.new_rows]
+            storeData(older, DATASETS[name], data_dir)
+
+            with FixtureServer(fixture_dir, latency=args.latency) as server:
+                fetcher = Fetcher(requests_per_second=None, base_url=server.base_url)
+                for variant in ["full", "incremental"]:
+                    requests_before = server.requests
+                    start = time.perf_counter()
+                    if variant == "full":
+                        df = incremental.as_text(module.scrape(fetcher=fetcher))
+                    else:
+                        incremental.refresh(name, fetcher, data_dir)
+                        df = incremental.read_dataset(name, data_dir)
+                    elapsed = time.perf_counter() - start
+                    same = df.sort_values(list(df.columns)).reset_index(drop=True).equals(
+                        data.sort_values(list(data.columns)).reset_index(drop=True)
+                    )
+                    print(f"{name:<10} {variant:<12} {server.requests - requests_before:>9} {elapsed:>9.3f} {len(df):>6} {str(same):>10}")
+                fetcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures the overhead of the timing and memory spans of analysis/instrument.py.
+
+The metrics of all five disciplines are computed from the cubes, every discipline inside a span like on
+the page, once without recording, once recorded like the debug panel does and once with tracemalloc.
+The cost of a single span is measured on an empty block.
+
+Usage:
+    python -m benchmarks.instrumentation_overhead [--repeat 50] [--spans 200000]
+"""
+import argparse
+import contextlib
+import time
+
+import numpy as np
+
+from analysis import instrument
+from analysis.instrument import recording, span, trace_memory
+from analysis.loading import load_cubes
+from analysis.metrics import DISCIPLINES
+
+
+@contextlib.contextmanager
+def traced():
+    # recorded spans with the peak memory of tracemalloc
+    trace_memory(True)
+    try:
+        with recording() as recorder:
+            yield recorder
+    finally:
+        trace_memory(False)
+
+
+# name -> context the measured functions run in
+VARIANTS = {
+    "disabled": contextlib.nullcontext,
+    "recorded": recording,
+    "recorded + tracemalloc": traced,
+}
+
+
+def compute_all(cubes):
+    for name, (sources, compute) in DISCIPLINES.items():
+        with span(f"{name}/metrics"):
+            compute(*[cubes[source] for source in sources])
+
+
+def empty_spans(count):
+    for _ in range(count):
+        with span("empty"):
+            pass
+
+
+def median_ms(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="runs of the metrics of all disciplines")
+    parser.add_argument("--spans", type=int, default=200_000, help="empty spans for the cost of a single span")
+    args = parser.parse_args()
+
+    if instrument.ENABLED:
+        print("INSTRUMENTATION=1 is set, the disabled variant measures the spans as well")
+    cubes = load_cubes()
+    compute_all(cubes)
+    print(f"{'variant':<24} {'all disciplines [ms]':>21} {'one span [us]':>14}")
+    for name, context in VARIANTS.items():
+        with context():
+            metrics = median_ms(lambda: compute_all(cubes), args.repeat)
+            start = time.perf_counter()
+            empty_spans(args.spans)
+            single = (time.perf_counter() - start) / args.spans * 1e6
+        print(f"{name:<24} {metrics:>21.2f} {single:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Measures the rows parsed per second and core of the scrapers on saved transfermarkt pages.
+
+A page of every scraper and player is built from the datasets and saved as fixture, the penalty and
+injury tables on a single page each. The pages are parsed with the parse functions of the scraping
+package: first like the notebooks did, with html.parser and the complete page, then with lxml, then
+with lxml restricted to the target tables, and finally in a pool of processes. Every variant has to
+return the same rows as the first one.
+
+Usage:
+    python -m benchmarks.parse_throughput [--repeat 5] [--processes 2 4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from benchmarks import transfermarkt_pages
+from scraping import (achievements, cl_top_scorers, club_goals, club_performances, injuries,
+                      international_performances, la_liga_top_scorers, parse, penalties)
+from scraping.standin import fixture_name, save_fixture
+
+
+def parse_penalties(key, content):
+    return [
+        penalties.loadPenaltyDataForTable(table)
+        for box_index in [0, 1]
+        for table in penalties.getPenaltyTables(key, content, box_index)
+    ]
+
+
+def parse_injuries(key, content):
+    return [injuries.loadInjuryDataForPlayer(table) for table in injuries.getInjuryTables(key, content)]
+
+
+# scraper -> dataset, page builder, parse function, number of rows of a parse result
+SCRAPERS = {
+    "club_goals": ("club_goals", transfermarkt_pages.goal_pages,
+                   lambda key, content: club_goals.parsePlayerGoals(content),
+                   lambda games: sum(len(game["goals"]) for game in games)),
+    "club_performances": ("club_performances", transfermarkt_pages.club_performance_pages,
+                          lambda key, content: club_performances.parseClubPerformances(content), len),
+    "international": ("international_performances", transfermarkt_pages.international_pages,
+                      lambda key, content: international_performances.parseInternationalGames(
+                          content, international_performances.PLAYERS[key]["team"]), len),
+    "achievements": ("achievements", transfermarkt_pages.achievement_pages,
+                     lambda key, content: achievements.parseAchievements(content), len),
+    "penalties": ("penalties", lambda rows, page: transfermarkt_pages.penalty_pages(rows, page, per_page=len(rows)),
+                  parse_penalties, lambda tables: sum(map(len, tables))),
+    "injuries": ("injuries", lambda rows, page: transfermarkt_pages.injury_pages(rows, page, per_page=len(rows)),
+                 parse_injuries, lambda tables: sum(map(len, tables))),
+    "la_liga_top_scorers": ("la_liga_top_scorer", transfermarkt_pages.la_liga_top_scorer_pages,
+                            lambda key, content: la_liga_top_scorers.parseTopPlayers(content), len),
+    "cl_top_scorers": ("cl_top_scorer", transfermarkt_pages.cl_top_scorer_pages,
+                       lambda key, content: cl_top_scorers.parseTopPlayers(content), len),
+}
+
+PLAYER_PAGES = {
+    "club_goals": club_goals.PAGES,
+    "club_performances": club_performances.PAGES,
+    "international": {name: player["page"] for name, player in international_performances.PLAYERS.items()},
+    "achievements": achievements.PAGES,
+    "penalties": penalties.PAGES,
+    "injuries": injuries.PAGES,
+}
+
+TOP_SCORER_PAGES = {"la_liga_top_scorers": la_liga_top_scorers.PAGE, "cl_top_scorers": cl_top_scorers.PAGE}
+
+
+def save_pages(fixture_dir):
+    """
+    Builds a page of every scraper and player from the datasets and saves it as fixture.
+
+    Args:
+        fixture_dir: Folder of the fixtures.
+
+    Returns:
+        pages: List of scraper, key passed to the parse function and fixture file of every page.
+    """
+    pages = []
+    for scraper, (name, build_pages, _, _) in SCRAPERS.items():
+        data = pd.read_csv(os.path.join(DATA_DIR, DATASETS[name]))
+        if scraper in TOP_SCORER_PAGES:
+            targets = [(None, data, TOP_SCORER_PAGES[scraper])]
+        else:
+            targets = [
+                (player_name, data[data["player_name"] == player_name].drop(columns="player_name"), page)
+                for player_name, page in PLAYER_PAGES[scraper].items()
+            ]
+        for player_name, rows, page in targets:
+            for url, content in build_pages(rows, page).items():
+                save_fixture(url, content, fixture_dir)
+                # the international games are parsed with the national team of the player
+                key = player_name if scraper == "international" else page
+                pages.append((scraper, key, os.path.join(fixture_dir, fixture_name(url))))
+    return pages
+
+
+def parse_page(scraper, key, content):
+    """
+    Parses a saved page with the parse function of its scraper.
+
+    Args:
+        scraper: Name of the scraper, see SCRAPERS.
+        key: Url of the page, or player name for the international games.
+        content: Raw content of the page.
+
+    Returns:
+        rows: Number of rows parsed.
+        result: Result of the parse function, tables reduced to their rows.
+    """
+    _, _, function, count = SCRAPERS[scraper]
+    # some parse functions report their progress
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = function(key, content)
+    return count(result), result
+
+
+def run(tasks, parser, restrict, processes):
+    """
+    Parses all pages with the given settings.
+
+    Args:
+        tasks: List of scraper, key and content of every page.
+        parser: Parser used by BeautifulSoup.
+        restrict: If True, only the target elements of every page are parsed.
+        processes: Number of processes, the pages are parsed in this process if 1.
+
+    Returns:
+        elapsed: Seconds spent parsing.
+        results: Number of rows and result of every page.
+    """
+    parse.configure(parser, restrict)
+    start = time.perf_counter()
+    results = parse.parse_many(parse_page, *zip(*tasks), processes=processes)
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="times every page is parsed")
+    parser.add_argument("--processes", type=int, nargs="+", default=[2, 4], help="sizes of the process pool")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        pages = save_pages(fixture_dir)
+        tasks = []
+        for scraper, key, path in pages:
+            with open(path, "rb") as file:
+                tasks.append((scraper, key, file.read()))
+        tasks = tasks * args.repeat
+
+    variants = [
+        ("html.parser, full page", "html.parser", False, 1),
+        ("lxml, full page", "lxml", False, 1),
+        ("lxml, target tables", "lxml", True, 1),
+    ] + [(f"lxml, target tables, {n} processes", "lxml", True, n) for n in args.processes]
+
+    size = sum(len(content) for _, _, content in tasks)
+    print(f"{len(tasks)} pages, {size / 1e6:.1f} MB, {os.cpu_count()} cores")
+    print(f"{'variant':<36} {'time [s]':>9} {'rows':>7} {'rows/s':>9} {'rows/s/core':>12} {'same':>5}")
+    baseline = None
+    for name, parser_name, restrict, processes in variants:
+        elapsed, results = run(tasks, parser_name, restrict, processes)
+        rows = sum(count for count, _ in results)
+        if baseline is None:
+            baseline = results
+        same = results == baseline
+        # a pool cannot use more cores than the machine has
+        cores = min(processes, os.cpu_count() or 1)
+        print(f"{name:<36} {elapsed:>9.2f} {rows:>7} {rows / elapsed:>9.0f} {rows / elapsed / cores:>12.0f} {str(same):>5}")
+        if not same:
+            raise AssertionError(f"{name} parsed different rows")
+
+
+if __name__ == "__main__":
+    main()
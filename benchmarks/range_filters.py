@@ -0,0 +1,152 @@
+"""
+Measures the season, competition and venue filters of the sidebar on a synthetic dataset with 10 million rows.
+
+The synthetic rows are drawn column by column from the real datasets, so every combination of season,
+competition, venue, minute and goal type occurs and the cubes are as large as they can get for two players.
+For random slider positions the totals are read from the prefix sums of analysis/ranges.py and the breakdowns
+are computed from the filtered cubes, like a rerun of a discipline page; moving a slider reruns the opened
+page only. For comparison a few positions are also computed from the filtered rows. The totals of the
+prefix sums have to match the totals of the cubes.
+
+Usage:
+    python -m benchmarks.range_filters [--rows 10000000] [--moves 200]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis.cube import CUBES, build_cube
+from analysis.loading import load_dataset
+from analysis.metrics import DISCIPLINES, select
+from analysis.ranges import SOURCES, SUMMED_TOTALS, VENUES, SeasonIndex
+
+# columns of the datasets the cubes are built from
+COLUMNS = {
+    "club_goals": ["player_name", "saison", "league", "venue", "goal_type", "player_position", "goal_minute", "added_time"],
+    "penalties": ["player_name", "saison", "competition_type", "competition", "has_scored"],
+    "club_performances": ["player_name", "saison", "competition_type", "competition", "games_played", "goals",
+                          "assists", "yellow_cards", "yellow_red_cards", "red_cards"],
+    "international_performances": ["player_name", "date", "venue", "tournament", "goals", "assists_amount",
+                                   "yellow_card", "yellow_red_card", "red_card"],
+    "achievements": ["player_name", "year", "title"],
+}
+
+
+def synthetic_datasets(rows, seed=0):
+    """
+    Draws synthetic datasets from the typed datasets, every column independently of the others.
+
+    Args:
+        rows: Number of rows of all datasets together, split like the real datasets.
+        seed: Seed of the random rows.
+
+    Returns:
+        data: Dictionary of dataset name and dataframe with the columns of COLUMNS.
+    """
+    rng = np.random.default_rng(seed)
+    real = {name: load_dataset(name)[columns] for name, columns in COLUMNS.items()}
+    scale = rows / sum(len(df) for df in real.values())
+    data = {}
+    for name, df in real.items():
+        size = round(len(df) * scale)
+        data[name] = pd.DataFrame({
+            column: df[column].take(rng.integers(0, len(df), size)).reset_index(drop=True) for column in df.columns
+        })
+    return data
+
+
+def slider_moves(index, moves, seed=0):
+    """
+    Returns random filter settings, like a user dragging the season slider and switching the other filters.
+
+    Args:
+        index: SeasonIndex, its seasons are the range of the slider.
+        moves: Number of settings.
+        seed: Seed of the settings.
+
+    Returns:
+        settings: List of (seasons, source, venue).
+    """
+    rng = random.Random(seed)
+    settings = []
+    for _ in range(moves):
+        first, last = sorted(rng.randint(index.first_season, index.last_season) for _ in range(2))
+        settings.append(((first, last), rng.choice(SOURCES), rng.choice(VENUES)))
+    return settings
+
+
+def page_rerun(name, cubes, index, seasons, source, venue):
+    # metrics of a discipline for one filter setting, like filtered_metrics() without its memo
+    sources, compute = DISCIPLINES[name]
+    metrics = dict(compute(*[select(cubes[cube], seasons, source, venue) for cube in sources]))
+    metrics["totals"] = index.totals(name, seasons, source, venue)
+    return metrics
+
+
+def row_rerun(name, data, seasons, source, venue):
+    # the same metrics computed from the filtered rows instead of the cubes
+    sources, compute = DISCIPLINES[name]
+    return compute(*[select(build_cube(cube, data), seasons, source, venue) for cube in sources])
+
+
+def same_totals(name, cubes, index, seasons, source, venue):
+    # summed totals of the prefix sums compared to the totals computed from the filtered cubes
+    sources, compute = DISCIPLINES[name]
+    columns = SUMMED_TOTALS[name]
+    expected = compute(*[select(cubes[cube], seasons, source, venue) for cube in sources])["totals"]
+    expected = expected[columns].reindex(index.players).fillna(0).to_numpy(dtype=float)
+    return np.array_equal(expected, index.totals(name, seasons, source, venue)[columns].to_numpy(dtype=float))
+
+
+def milliseconds(times):
+    p50, p95 = np.percentile(times, [50, 95]) * 1000
+    return f"{p50:>9.2f} {p95:>9.2f} {max(times) * 1000:>9.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000, help="rows of all synthetic datasets together")
+    parser.add_argument("--moves", type=int, default=200, help="random filter settings")
+    parser.add_argument("--row-moves", type=int, default=3, help="settings also computed from the filtered rows")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data = synthetic_datasets(args.rows)
+    print(f"synthetic datasets: {sum(len(df) for df in data.values())} rows in {time.perf_counter() - start:.1f} s")
+    start = time.perf_counter()
+    cubes = {name: build_cube(name, data) for name in CUBES}
+    print(f"cubes: {sum(len(cube) for cube in cubes.values())} rows in {time.perf_counter() - start:.1f} s")
+    start = time.perf_counter()
+    index = SeasonIndex(cubes)
+    print(f"season index: {len(index.players)} players, seasons {index.first_season}-{index.last_season} "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    settings = slider_moves(index, args.moves)
+    print()
+    print(f"{'page':<12} {'variant':<22} {'p50 [ms]':>9} {'p95 [ms]':>9} {'max [ms]':>9}")
+    same = True
+    for name in DISCIPLINES:
+        totals_times, page_times, row_times = [], [], []
+        for seasons, source, venue in settings:
+            start = time.perf_counter()
+            index.totals(name, seasons, source, venue)
+            totals_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            page_rerun(name, cubes, index, seasons, source, venue)
+            page_times.append(time.perf_counter() - start)
+            same = same and same_totals(name, cubes, index, seasons, source, venue)
+        for seasons, source, venue in settings[:args.row_moves]:
+            start = time.perf_counter()
+            row_rerun(name, data, seasons, source, venue)
+            row_times.append(time.perf_counter() - start)
+        print(f"{name:<12} {'totals (prefix sums)':<22} {milliseconds(totals_times)}")
+        print(f"{'':<12} {'page (cubes + sums)':<22} {milliseconds(page_times)}")
+        print(f"{'':<12} {'page (filtered rows)':<22} {milliseconds(row_times)}")
+    print(f"{len(settings)} settings, totals of prefix sums and cubes the same: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Times loading, the aggregations of every discipline and the headless render at growing data volumes.
+
+For every scale the synthetic datasets of benchmarks/synthetic.py are written to a temporary data folder
+and measured in a process of its own, with DASHBOARD_DATA_DIR pointing to that folder, so every scale
+starts with cold caches and a scale running out of memory does not end the benchmark. The process
+measures ingesting the csv files, loading the typed files memory mapped, building every cube, the metrics
+of every discipline (median of --repeat runs), the headless report of analysis/report.py and every page
+of the app run with the streamlit test runner. The spans of analysis/instrument.py of the app pages are
+stored as well. The results are saved as JSON; with --compare the timings are compared to the results of
+another commit.
+
+Usage:
+    python -m benchmarks.scaling [--scales 1 100 10000] [--players 2] [--compare benchmarks/results/scaling-<commit>.json]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from analysis.config import DATA_DIR
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# folder of the results, one file per commit
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def timed(seconds, step, function, *args):
+    # the step is reported on stderr first, so the parent knows where a killed process stopped
+    print(f"step {step}", file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    result = function(*args)
+    seconds[step] = time.perf_counter() - start
+    return result
+
+
+def render_app(data_dir):
+    """
+    Runs every page of the app headless with the streamlit test runner.
+
+    Args:
+        data_dir: Data folder, has to be the DASHBOARD_DATA_DIR of the process.
+
+    Returns:
+        seconds: Dictionary of page script and seconds of its first run.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    from sections.common import sections
+
+    seconds = {}
+    for page in [None] + [page for _, page, _ in sections]:
+        start = time.perf_counter()
+        app = AppTest.from_file(APP, default_timeout=600).run()
+        if page is not None:
+            app.switch_page(page).run()
+        if app.exception:
+            raise RuntimeError(f"page {page or 'overview'} of {data_dir} failed: {app.exception[0].message}")
+        seconds[page or "sections/overview.py"] = time.perf_counter() - start
+    return seconds
+
+
+def measure(data_dir, source_dir, players, scale, repeat):
+    """
+    Writes the synthetic datasets and measures them, runs in the process of a single scale.
+
+    Args:
+        data_dir: Temporary data folder, has to be the DASHBOARD_DATA_DIR of the process.
+        source_dir: Folder containing the real csv files.
+        players: Number of synthetic players.
+        scale: Factor of the rows of every player.
+        repeat: Runs of the metrics of every discipline.
+
+    Returns:
+        result: Dictionary with rows, seconds per step, spans of the app pages and peak memory.
+    """
+    from analysis import instrument
+    from analysis.cube import CUBES
+    from analysis.loading import DatasetCache
+    from analysis.metrics import DISCIPLINES
+    from analysis.report import build_report, render_html
+    from benchmarks.synthetic import write_datasets
+
+    seconds = {}
+    rows = timed(seconds, "generate", write_datasets, data_dir, players, scale, 0, source_dir)
+    timed(seconds, "load/ingest", DatasetCache(data_dir).load_all)
+    cache = DatasetCache(data_dir)
+    timed(seconds, "load/typed", cache.load_all)
+    cubes = {name: timed(seconds, f"cube/{name}", cache.load_cube, name) for name in CUBES}
+    for name, (sources, compute) in DISCIPLINES.items():
+        runs = []
+        for _ in range(repeat):
+            timed(seconds, f"compute/{name}", compute, *[cubes[source] for source in sources])
+            runs.append(seconds[f"compute/{name}"])
+        seconds[f"compute/{name}"] = float(np.median(runs))
+    report = timed(seconds, "render/report", build_report, None, cubes)
+    timed(seconds, "render/report html", render_html, report)
+    before = instrument.span_totals()
+    print("step render/app", file=sys.stderr, flush=True)
+    for page, page_seconds in render_app(data_dir).items():
+        seconds[f"render/app {page}"] = page_seconds
+    spans = {
+        name: {"count": count - before.get(name, (0, 0.0))[0], "seconds": total - before.get(name, (0, 0.0))[1]}
+        for name, (count, total, _) in instrument.span_totals().items()
+        if count > before.get(name, (0,))[0]
+    }
+    return {
+        "players": players,
+        "scale": scale,
+        "rows": rows,
+        "cube_rows": {name: len(cube) for name, cube in cubes.items()},
+        "seconds": seconds,
+        "spans": spans,
+        # kilobytes on linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_scale(players, scale, repeat, timeout=None):
+    """
+    Measures a scale in a process of its own.
+
+    Args:
+        players: Number of synthetic players.
+        scale: Factor of the rows of every player.
+        repeat: Runs of the metrics of every discipline.
+        timeout: Seconds after which the process is stopped.
+
+    Returns:
+        result: Result of measure() or a dictionary with the error of the process.
+    """
+    with tempfile.TemporaryDirectory() as data_dir:
+        command = [sys.executable, "-m", "benchmarks.scaling", "--measure", data_dir, "--source", DATA_DIR,
+                   "--players", str(players), "--repeat", str(repeat), "--scales", str(scale)]
+        # the spans are measured for all threads, the test runner runs the pages in a thread of its own
+        env = {**os.environ, "DASHBOARD_DATA_DIR": data_dir, "INSTRUMENTATION": "1"}
+        try:
+            process = subprocess.run(command, capture_output=True, text=True, env=env, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {"players": players, "scale": scale, "error": f"stopped after {timeout} s"}
+    lines = process.stderr.strip().splitlines()
+    steps = [line[len("step "):] for line in lines if line.startswith("step ")]
+    failed = {"players": players, "scale": scale, "step": steps[-1] if steps else None}
+    if process.returncode < 0:
+        # the kernel kills a process that runs out of memory with SIGKILL
+        return {**failed, "error": f"killed by signal {-process.returncode}"}
+    if process.returncode != 0:
+        return {**failed, "error": lines[-1] if lines else f"exit code {process.returncode}"}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def environment():
+    """
+    Returns the commit and versions the results were measured with.
+
+    Returns:
+        environment: Dictionary of commit, python, pandas, cpu count and time.
+    """
+    import pandas as pd
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(APP), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "measured_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, previous):
+    """
+    Prints the timings next to the timings of previous results with the same players and scale.
+
+    Args:
+        results: Results of this run.
+        previous: Results of another run, e.g. of another commit.
+    """
+    before = {(result["players"], result["scale"]): result for result in previous["scales"]}
+    print(f"\ncompared to {previous['environment']['commit']}")
+    print(f"{'scale':>7} {'step':<36} {'before [s]':>11} {'now [s]':>11} {'ratio':>7}")
+    for result in results["scales"]:
+        old = before.get((result["players"], result["scale"]))
+        if old is None or "seconds" not in old or "seconds" not in result:
+            continue
+        for step, seconds in result["seconds"].items():
+            if step in old["seconds"]:
+                ratio = seconds / old["seconds"][step] if old["seconds"][step] else float("nan")
+                print(f"{result['scale']:>7g} {step:<36} {old['seconds'][step]:>11.4f} {seconds:>11.4f} {ratio:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 100, 10_000], help="factors of the rows of every player")
+    parser.add_argument("--players", type=int, default=2, help="number of synthetic players")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of the metrics of every discipline")
+    parser.add_argument("--timeout", type=float, help="seconds a scale may take")
+    parser.add_argument("--output", help="JSON file the results are written to, benchmarks/results/scaling-<commit>.json by default")
+    parser.add_argument("--compare", help="JSON file of previous results")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--source", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.source, args.players, args.scales[0], args.repeat)))
+        return
+
+    results = {"environment": environment(), "scales": []}
+    for scale in args.scales:
+        result = run_scale(args.players, scale, args.repeat, args.timeout)
+        results["scales"].append(result)
+        print(f"\n{args.players} players, scale {scale:g}")
+        if "error" in result:
+            print(f"  failed at {result['step']}: {result['error']}")
+            continue
+        print(f"  {sum(result['rows'].values())} rows, {sum(result['cube_rows'].values())} cube rows, "
+              f"peak memory {result['peak_rss_mb']:.0f} MB")
+        for step, seconds in result["seconds"].items():
+            print(f"  {step:<36} {seconds:>10.4f} s")
+    output = args.output or os.path.join(RESULTS_DIR, f"scaling-{results['environment']['commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=1)
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
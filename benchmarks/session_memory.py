@@ -0,0 +1,107 @@
+"""
+Measures the memory of the app process for 1 up to 200 concurrent sessions.
+
+Every session is a streamlit test runner of app.py with a session state of its own. The sessions open the
+pages in turn and every second session moves the season slider to a random range. All sessions are kept
+alive, so their state and elements stay in memory while the next ones are opened. The datasets, cubes and
+metrics are loaded and computed once per process and the same objects are handed to every session, so after
+a warm-up run of every page the shared cache must not load anything again and the memory per additional
+session has to stay flat, far below one copy of the loaded data per session. Run it with DASHBOARD_DATA_DIR
+set to the synthetic datasets of benchmarks/synthetic.py to see that the memory per session does not grow
+with the data.
+
+Usage:
+    python -m benchmarks.session_memory [--sessions 1 10 50 100 200]
+"""
+import argparse
+import gc
+import os
+import random
+import resource
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from analysis.loading import cache_stats, load_cubes, load_datasets
+from analysis.ranges import season_index
+from benchmarks.scaling import APP
+from sections.common import sections
+
+# pages opened by the sessions in turn, None is the overview
+PAGES = [None] + [page for _, page, _ in sections]
+
+
+def resident_mb():
+    """
+    Returns the resident memory of the process.
+
+    Returns:
+        mb: Resident memory in MB, the peak if the current value is not available.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def data_mb():
+    # memory of one copy of every loaded dataset and cube
+    frames = list(load_datasets().values()) + list(load_cubes().values())
+    return sum(df.memory_usage(deep=True).sum() for df in frames) / 2 ** 20
+
+
+def open_session(number, rng):
+    """
+    Opens a session of the app and runs one of the pages.
+
+    Args:
+        number: Number of the session, decides the page and whether the season slider is moved.
+        rng: Random generator of the season ranges.
+
+    Returns:
+        app: Test runner of the session.
+    """
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    page = PAGES[number % len(PAGES)]
+    if page is not None:
+        app.switch_page(page).run()
+    if number % 2:
+        index = season_index()
+        seasons = sorted(rng.randint(index.first_season, index.last_season) for _ in range(2))
+        app.select_slider(key="seasons").set_value(tuple(seasons)).run()
+    if app.exception:
+        raise RuntimeError(f"session {number} failed: {app.exception[0].message}")
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50, 100, 200],
+                        help="numbers of concurrent sessions the memory is measured at")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the season ranges")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    copy = data_mb()
+    # every page is opened once with and without filters before, the first runs import and compute for the process
+    for number in range(2 * len(PAGES)):
+        open_session(number, rng)
+    sessions = []
+    previous = None
+    print(f"one copy of the loaded datasets and cubes: {copy:.1f} MB")
+    print(f"{'sessions':>8} {'resident [MB]':>14} {'per added session [MB]':>23} {'cache misses':>13} {'open [s]':>9}")
+    for count in sorted(args.sessions):
+        start = time.perf_counter()
+        while len(sessions) < count:
+            sessions.append(open_session(len(sessions), rng))
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        memory, misses = resident_mb(), cache_stats()["misses"]
+        per_session = "" if previous is None else f"{(memory - previous[1]) / (count - previous[0]):.3f}"
+        print(f"{count:>8} {memory:>14.1f} {per_session:>23} {misses:>13} {elapsed:>9.1f}")
+        previous = (count, memory)
+
+
+if __name__ == "__main__":
+    main()
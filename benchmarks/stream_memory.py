@@ -0,0 +1,88 @@
+"""
+Compares the peak memory of storing a scraped dataset as a whole list and streamed in batches.
+
+A registry of synthetic players is served by the local stand-in, like in benchmarks.crawl_resume. The
+dataset is scraped for growing numbers of players: once with scrape() and storeData(), which keep all
+rows of all players in memory, and once with scrape_rows() and a BatchWriter, which only keep a window
+of players and a batch of rows. Both files have to be identical.
+
+Usage:
+    python -m benchmarks.stream_memory [--dataset club_goals] [--players 8 32 64] [--batch-size 5000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.crawl_resume import create_registry, save_pages
+from scraping import crawl, stream
+from scraping.fetch import Fetcher
+from scraping.players import international_players, load_players, pages
+from scraping.standin import FixtureServer
+from scraping.store import storeData
+
+
+def measure(function):
+    """
+    Runs a function and measures its time and the peak of the memory allocated meanwhile.
+
+    Returns:
+        elapsed: Seconds the function ran.
+        peak: Peak of the allocated memory in MB.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    # the scrapers report their progress, which is discarded instead of collected in memory
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dataset", default="club_goals", help="per player dataset that is scraped")
+    parser.add_argument("--players", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--batch-size", type=int, default=stream.BATCH_SIZE, help="rows written at once")
+    args = parser.parse_args()
+    if not crawl.KINDS.get(args.dataset, (None, False))[1]:
+        parser.error(f"{args.dataset} is not a per player dataset")
+    module = crawl.KINDS[args.dataset][0]
+
+    print(f"{args.dataset}, batches of {args.batch_size} rows, windows of {stream.WINDOW} players")
+    print(f"{'players':>7} {'variant':<10} {'rows':>8} {'time [s]':>9} {'peak [MB]':>10} {'same':>5}")
+    for n in args.players:
+        with tempfile.TemporaryDirectory() as tmp:
+            registry = os.path.join(tmp, "players.json")
+            fixture_dir = os.path.join(tmp, "fixtures")
+            sources = create_registry(registry, n)
+            players = load_players(registry)
+            with contextlib.redirect_stdout(io.StringIO()):
+                save_pages(players, sources, fixture_dir)
+            if args.dataset == "international_performances":
+                player_pages = international_players(players)
+            else:
+                player_pages = pages(args.dataset, players)
+
+            with FixtureServer(fixture_dir) as server:
+                fetcher = Fetcher(requests_per_second=None, base_url=server.base_url)
+                whole = measure(lambda: storeData(module.scrape(player_pages, fetcher), "whole.csv", tmp))
+                streamed = measure(lambda: stream.store_rows(
+                    stream.scrape_rows(module, player_pages, fetcher), "streamed.csv", tmp, args.batch_size))
+
+            with open(os.path.join(tmp, "whole.csv"), "rb") as file:
+                content = file.read()
+            with open(os.path.join(tmp, "streamed.csv"), "rb") as file:
+                same = file.read() == content
+            rows = content.count(b"\n") - 1
+            for variant, (elapsed, peak) in [("whole", whole), ("streamed", streamed)]:
+                print(f"{n:>7} {variant:<10} {rows:>8} {elapsed:>9.2f} {peak:>10.1f} {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
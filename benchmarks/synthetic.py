@@ -0,0 +1,193 @@
+"""
+Writes synthetic versions of the player datasets with any number of players and rows.
+
+Every synthetic player copies the rows of Messi or Ronaldo, alternately, so the files have the columns,
+raw text formats and value combinations of the scraped csv files, e.g. minutes played as "1.486'" and
+cards as the minute they were given. The first two players keep the real names, so the pages of the app
+show them as usual, the others are called "Spieler 003" and so on. At a scale of k every player gets k
+copies of the rows of its source player, a fractional scale draws the remaining rows at random. The game
+ids are shifted per player and copy, so the goals and penalties of one game still share their id, only the
+first copy of the real players keeps the real ids. The top scorer lists are copied unchanged.
+
+Usage:
+    python -m benchmarks.synthetic --output data/synthetic [--players 2] [--scale 100]
+"""
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.ingest import VOCABULARY_SOURCES
+
+# datasets with one row per player and goal, game, season or title, all other datasets are copied
+PLAYER_DATASETS = VOCABULARY_SOURCES
+
+# larger than every game id of transfermarkt, the ids of the copies do not overlap
+ID_STRIDE = 10_000_000
+
+# rows written to the csv file at once
+CHUNK_ROWS = 500_000
+
+
+def read_raw(name, data_dir=DATA_DIR):
+    """
+    Reads a csv file as text, so the values are written back exactly as scraped.
+
+    Args:
+        name: Name of the dataset.
+        data_dir: Folder containing the csv files.
+
+    Returns:
+        df: Dataset with every column as text, empty cells as "".
+    """
+    return pd.read_csv(os.path.join(data_dir, DATASETS[name]), dtype=str, keep_default_na=False)
+
+
+def player_names(real, players):
+    """
+    Returns the names of the synthetic players and the real player each of them copies.
+
+    Args:
+        real: Names of the real players.
+        players: Number of synthetic players.
+
+    Returns:
+        sources: Dictionary of synthetic player name and name of the real player.
+    """
+    sources = {}
+    for i in range(players):
+        name = real[i] if i < len(real) else f"Spieler {i + 1:03d}"
+        sources[name] = real[i % len(real)]
+    return sources
+
+
+def copies(rows, scale, rng):
+    """
+    Returns the rows of a player repeated for a scale.
+
+    Args:
+        rows: Number of rows of the source player.
+        scale: Factor of the rows, the fraction is drawn at random.
+        rng: Numpy random generator.
+
+    Returns:
+        positions: Positions of the rows of the source player.
+        copy: Number of the copy of every row.
+    """
+    whole, fraction = divmod(scale, 1)
+    whole = int(whole)
+    positions = [np.tile(np.arange(rows), whole)]
+    extra = round(rows * fraction)
+    if extra:
+        positions.append(np.sort(rng.choice(rows, extra, replace=False)))
+    return np.concatenate(positions), np.repeat(np.arange(whole + 1), [rows] * whole + [extra])
+
+
+def game_offsets(copy, number, players, real):
+    """
+    Returns the offsets of the game ids of a player, unique per player and copy.
+
+    Args:
+        copy: Number of the copy of every row.
+        number: Number of the synthetic player.
+        players: Number of synthetic players.
+        real: Whether the player keeps the name of its source player, its first copy keeps the real ids.
+
+    Returns:
+        offsets: Offset of the game id of every row.
+    """
+    offsets = (copy * players + number) * ID_STRIDE
+    if real:
+        offsets[copy == 0] = 0
+    return offsets
+
+
+def write_dataset(name, path, sources, scale, rng, data_dir=DATA_DIR):
+    """
+    Writes the synthetic csv file of a player dataset in chunks, the rows are never all in memory.
+
+    Args:
+        name: Name of the dataset.
+        path: Path of the csv file.
+        sources: Dictionary of synthetic player name and name of the real player.
+        scale: Factor of the rows of every player.
+        rng: Numpy random generator.
+        data_dir: Folder containing the real csv files.
+
+    Returns:
+        rows: Number of written rows.
+    """
+    real = read_raw(name, data_dir)
+    by_player = {player: rows.reset_index(drop=True) for player, rows in real.groupby("player_name", sort=False)}
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        real.head(0).to_csv(file, index=False)
+        for number, (player, source) in enumerate(sources.items()):
+            rows = by_player.get(source)
+            if rows is None:
+                continue
+            positions, copy = copies(len(rows), scale, rng)
+            for start in range(0, len(positions), CHUNK_ROWS):
+                chunk = rows.take(positions[start:start + CHUNK_ROWS]).assign(player_name=player)
+                if "game_id" in chunk.columns:
+                    chunk["game_id"] = (chunk["game_id"].astype("int64") + game_offsets(
+                        copy[start:start + CHUNK_ROWS], number, len(sources), player == source
+                    )).astype(str)
+                chunk.to_csv(file, header=False, index=False)
+                written += len(chunk)
+    return written
+
+
+def write_datasets(output_dir, players=2, scale=1, seed=0, data_dir=DATA_DIR):
+    """
+    Writes a data folder with synthetic player datasets and the real top scorer lists.
+
+    Args:
+        output_dir: Folder the csv files are written to, it can be used as DASHBOARD_DATA_DIR.
+        players: Number of synthetic players.
+        scale: Factor of the rows of every player, 1 are as many rows as the real player has.
+        seed: Seed of the randomly drawn rows of a fractional scale.
+        data_dir: Folder containing the real csv files.
+
+    Returns:
+        rows: Dictionary of dataset name and number of rows.
+    """
+    if os.path.abspath(output_dir) == os.path.abspath(data_dir):
+        raise ValueError(f"the synthetic datasets would replace the real datasets in {data_dir}")
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    real = read_raw("club_goals", data_dir)["player_name"].unique().tolist()
+    sources = player_names(real, players)
+    rows = {}
+    for name, filename in DATASETS.items():
+        path = os.path.join(output_dir, filename)
+        if name in PLAYER_DATASETS:
+            rows[name] = write_dataset(name, path, sources, scale, rng, data_dir)
+        else:
+            shutil.copyfile(os.path.join(data_dir, filename), path)
+            rows[name] = len(read_raw(name, data_dir))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", required=True, help="folder the csv files are written to")
+    parser.add_argument("--players", type=int, default=2, help="number of synthetic players")
+    parser.add_argument("--scale", type=float, default=1, help="factor of the rows of every player")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the randomly drawn rows")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = write_datasets(args.output, args.players, args.scale, args.seed)
+    for name, count in rows.items():
+        print(f"{name:<28} {count:>12}")
+    print(f"{sum(rows.values())} rows in {time.perf_counter() - start:.1f} s, "
+          f"use them with DASHBOARD_DATA_DIR={args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Builds transfermarkt like pages from the datasets, to be served as fixtures by scraping.standin.
+
+The pages contain the markup the parsers of the scraping package rely on, surrounded by navigation
+and script blocks like a real page, so most of a page is not part of the tables that are scraped.
+Paginated tables are split into pages of a fixed number of rows with a pager linking to the next page.
+"""
+import html
+import re
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+SCORE = re.compile(r"^\d+:\d+$")
+
+
+def _date(value):
+    # dates are stored as yyyy-mm-dd and shown as dd.mm.yyyy
+    return pd.Timestamp(value).strftime("%d.%m.%Y")
+
+
+def _swap(score):
+    x, y = score.split(":")
+    return y + ":" + x
+
+
+def _table(rows, header):
+    head = "".join(f"<th>{html.escape(column)}</th>" for column in header)
+    return f'<table class="items"><thead><tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+
+
+def _pager(next_href):
+    if next_href is None:
+        return '<div class="pager"><ul></ul></div>'
+    return f'<div class="pager"><ul><li><a title="Zur naechsten Seite" href="{html.escape(next_href)}"></a></li></ul></div>'
+
+
+def _chunks(rows, per_page):
+    return [rows[i:i + per_page] for i in range(0, len(rows), per_page)] or [[]]
+
+
+def _noise(seed, size):
+    # navigation, teaser and script markup without any of the elements the parsers look for
+    items = "".join(
+        f'<li class="nav-item"><a class="nav-link" href="/seite/{seed}/{i}">Navigation {i}</a>'
+        f'<div class="teaser"><p>Artikel {i} zum Thema {seed}</p></div></li>'
+        for i in range(size)
+    )
+    script = "var config = {" + ",".join(f'"key{i}": "{seed}-{i}"' for i in range(size)) + "};"
+    return f'<div class="navigation"><ul>{items}</ul></div><script>{script}</script>'
+
+
+def _page(body, noise=400):
+    return (
+        '<!DOCTYPE html><html lang="de"><head><meta charset="utf-8"><title>Transfermarkt</title>'
+        f'<script>{"window.dataLayer = [];" * 50}</script></head>'
+        f'<body><header>{_noise("kopf", noise)}</header><main>{body}</main><footer>{_noise("fuss", noise // 2)}</footer></body></html>'
+    ).encode("utf-8")
+
+
+def penalty_row(penalty, away):
+    """
+    Returns the table row of a penalty.
+
+    Args:
+        penalty: Row of the penalty dataset.
+        away: If True, the team of the player is shown as away team.
+
+    Returns:
+        row: Html of the row.
+    """
+    e = lambda value: html.escape(str(value))
+    flag = "flaggenrahmen" if penalty["competition_type"] == "International" else "tiny_wappen"
+    home, guest = (penalty["opponent"], penalty["team"]) if away else (penalty["team"], penalty["opponent"])
+    result = _swap(penalty["result"]) if away else penalty["result"]
+    score = _swap(penalty["score"]) if away else penalty["score"]
+    return (
+        f'<tr><td class="zentriert">{e(penalty["saison"])}</td>'
+        f'<td class="hauptlink"><a href="#">{e(penalty["competition"])}</a></td>'
+        f'<td class="zentriert"><a title="{e(penalty["team"])}" href="#"><img class="{flag}" src="#"></a></td>'
+        f'<td class="zentriert">{_date(penalty["date"])}</td>'
+        f'<td class="zentriert"><a title="{e(home)}" href="#"><img class="tiny_wappen" src="#"></a></td>'
+        f'<td class="zentriert"><a id="{e(penalty["game_id"])}" class="ergebnis-link" href="#">{e(result)}</a></td>'
+        f'<td class="zentriert"><a title="{e(guest)}" href="#"><img class="tiny_wappen" src="#"></a></td>'
+        f'<td class="zentriert">{e(penalty["minute"])}</td>'
+        f'<td class="zentriert">{e(score)}</td>'
+        f'<td class="hauptlink">{e(penalty["goalkeeper"])}</td></tr>'
+    )
+
+
+def penalty_pages(penalties, page, per_page=25):
+    """
+    Builds the penalty pages of a player, with a box for the successful and one for the missed penalties.
+
+    Args:
+        penalties: Penalty dataset of the player.
+        page: Url of the penalty page.
+        per_page: Number of rows per page.
+
+    Returns:
+        pages: Dictionary of url and content of every page.
+    """
+    header = ["Saison", "Wettbewerb", "Verein", "Datum", "Heim", "Ergebnis", "Gast", "Minute", "Spielstand", "Torwart"]
+    path = urlsplit(page).path
+    boxes = []
+    for has_scored, grid in [(True, "yw1"), (False, "yw2")]:
+        rows = [
+            # every second game is shown from the view of the away team, where the scores are swapped
+            penalty_row(penalty, away=i % 2 == 1 and SCORE.match(penalty["result"]) and SCORE.match(penalty["score"]))
+            for i, penalty in enumerate(penalties[penalties["has_scored"] == has_scored].to_dict("records"))
+        ]
+        chunks = _chunks(rows, per_page)
+        urls = [path] + [f"{path}?ajax={grid}&page={k}" for k in range(2, len(chunks) + 1)]
+        boxes.append((urls, [
+            f'<div class="box">{_table(chunk, header)}{_pager(urls[k + 1] if k + 1 < len(chunks) else None)}</div>'
+            for k, chunk in enumerate(chunks)
+        ]))
+
+    # the first page shows the first page of both boxes, a further page of one box the first page of the other
+    (urls_success, success), (urls_missed, missed) = boxes
+    pages = {path: _page(success[0] + missed[0])}
+    for url, box in zip(urls_success[1:], success[1:]):
+        pages[url] = _page(box + missed[0])
+    for url, box in zip(urls_missed[1:], missed[1:]):
+        pages[url] = _page(success[0] + box)
+    return pages
+
+
+def injury_row(injury):
+    """
+    Returns the table row of an injury.
+
+    Args:
+        injury: Row of the injury dataset.
+
+    Returns:
+        row: Html of the row.
+    """
+    e = lambda value: html.escape(str(value))
+    missed_games = "-" if injury["missed_games"] == 0 else f'<span>{injury["missed_games"]}</span>'
+    return (
+        f'<tr><td class="zentriert">{e(injury["saison"])}</td>'
+        f'<td class="hauptlink">{e(injury["injury_description"])}</td>'
+        f'<td class="zentriert">{_date(injury["start_date"])}</td>'
+        f'<td class="zentriert">{_date(injury["end_date"])}</td>'
+        f'<td class="rechts">{injury["days"]} Tage</td>'
+        f'<td class="rechts">{missed_games}</td></tr>'
+    )
+
+
+def injury_pages(injuries, page, per_page=15):
+    """
+    Builds the injury pages of a player.
+
+    Args:
+        injuries: Injury dataset of the player.
+        page: Url of the injury page.
+        per_page: Number of rows per page.
+
+    Returns:
+        pages: Dictionary of url and content of every page.
+    """
+    header = ["Saison", "Verletzung", "von", "bis", "Tage", "Verpasste Spiele"]
+    path = urlsplit(page).path
+    chunks = _chunks([injury_row(injury) for injury in injuries.to_dict("records")], per_page)
+    urls = [path] + [f"{path}/page/{k}" for k in range(2, len(chunks) + 1)]
+    return {
+        url: _page(f'<div class="box">{_table(chunk, header)}{_pager(urls[k + 1] if k + 1 < len(chunks) else None)}</div>')
+        for k, (url, chunk) in enumerate(zip(urls, chunks))
+    }
+
+
+def goal_pages(goals, page):
+    """
+    Builds the page listing all club goals of a player.
+    Consecutive goals in the same game are rows with the same class, the first row carries the game.
+
+    Args:
+        goals: Club goal dataset of the player.
+        page: Url of the club goal page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    rows = []
+    color = "even"
+    last_game = None
+    for goal in goals.to_dict("records"):
+        minute = f"{goal['goal_minute']}'" + (f"+{goal['added_time']}" if goal["added_time"] else "")
+        goal_cells = f'<td class="zentriert">{minute}</td><td class="zentriert">{e(goal["goal_score"])}</td><td>{e(goal["goal_type"])}</td>'
+        if goal["game_id"] == last_game:
+            rows.append(f'<tr class="{color}"><td colspan="9"></td>{goal_cells}</tr>')
+            continue
+        last_game = goal["game_id"]
+        color = "odd" if color == "even" else "even"
+        result = goal["result"]
+        if goal["venue"] == "A":
+            # the result is shown from the view of the home team
+            score, _, extension = result.partition(" ")
+            result = _swap(score) + ("  " + extension.strip() if extension else "")
+        team_position = f"({goal['team_table_position']:.0f}.)" if pd.notna(goal["team_table_position"]) else ""
+        opponent_position = f"({goal['opponent_table_position']:.0f}.)" if pd.notna(goal["opponent_table_position"]) else ""
+        rows.append(
+            f'<tr class="{color}">'
+            f'<td class="zentriert"><a href="/wettbewerb/saison_id/{e(goal["saison"])}/plus/1"><img alt="{e(goal["league"])}" src="#"></a></td>'
+            f'<td class="zentriert"><a href="#">{e(goal["gameday"])}</a></td>'
+            f'<td class="zentriert">{e(goal["venue"])}</td>'
+            f'<td class="zentriert"><a title="{e(goal["team"])}" href="#"><img alt="{e(goal["team"])}" src="#"></a></td>'
+            f'<td><a href="#">{e(goal["team"])}</a> {team_position}</td>'
+            f'<td class="zentriert"><a title="{e(goal["opponent"])}" href="#"><img alt="{e(goal["opponent"])}" src="#"></a></td>'
+            f'<td><a href="#">{e(goal["opponent"])}</a> <span>{opponent_position}</span></td>'
+            f'<td class="zentriert"><a id="{e(goal["game_id"])}" href="#">{e(result)}</a></td>'
+            f'<td class="zentriert"><a href="#">{"" if pd.isna(goal["player_position"]) else e(goal["player_position"])}</a></td>'
+            f'{goal_cells}</tr>'
+        )
+    header = ["Wettbewerb", "Spieltag", "Ort", "Verein", "", "Gegner", "", "Ergebnis", "Position", "Minute", "Spielstand", "Torart"]
+    return {urlsplit(page).path: _page(f'<div class="box">{_table(rows, header)}</div>')}
+
+
+def club_performance_pages(performances, page):
+    """
+    Builds the page with the detailed club performance data of a player, one table per competition type.
+
+    Args:
+        performances: Club performance dataset of the player.
+        page: Url of the performance page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    dash = lambda value: "-" if str(value) == "0" else e(value)
+    boxes = ['<h2 class="content-box-headline">Leistungsdaten</h2>']
+    for competition_type, rows in performances.groupby("competition_type", sort=False):
+        cells = [
+            f'<tr><td class="zentriert">{e(row["saison"])}</td>'
+            f'<td class="zentriert"><img title="{e(row["competition"])}" src="#"></td>'
+            f'<td class="zentriert"><a href="#"><img alt="{e(row["club"])}" src="#"></a></td>'
+            + "".join(f'<td class="zentriert">{dash(row[column])}</td>' for column in [
+                "games_played", "goals", "assists", "owngoals", "substitute_in", "substitute_out",
+                "yellow_cards", "yellow_red_cards", "red_cards", "penalties",
+            ])
+            + f'<td class="rechts">-</td><td class="rechts">{e(row["minutes_played"])}</td></tr>'
+            for row in rows.to_dict("records")
+        ]
+        # the first row of the body is the total of the competition type
+        cells.insert(0, '<tr><td colspan="15">Gesamt</td></tr>')
+        boxes.append(f'<div class="box"><h2 class="content-box-headline">{e(competition_type)}</h2>{_table(cells, ["Saison"])}</div>')
+    return {urlsplit(page).path: _page("".join(boxes))}
+
+
+def international_pages(games, page):
+    """
+    Builds the page with the international games of a player, grouped by tournament.
+
+    Args:
+        games: International performance dataset of the player.
+        page: Url of the international games page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    blank = lambda value: "" if pd.isna(value) else e(value)
+    rows = []
+    # a tournament header precedes every run of games of the same tournament
+    tournaments = games["tournament"].ne(games["tournament"].shift()).cumsum()
+    for _, tournament_games in games.groupby(tournaments, sort=False):
+        tournament = tournament_games["tournament"].iloc[0]
+        rows.append(
+            '<tr><td class="zentriert hauptlink no-border-rechts" colspan="2">'
+            f'<img title="{e(tournament)}" src="#"></td><td colspan="16">{e(tournament)}</td></tr>'
+        )
+        for game in tournament_games.to_dict("records"):
+            home, guest = (game["opponent"], game["team"]) if game["venue"] == "A" else (game["team"], game["opponent"])
+            score, _, extension = game["result"].partition(" ")
+            x, y = map(int, score.split(":"))
+            result_class = ' class="greentext"' if x > y else ' class="redtext"' if x < y else ""
+            shown = _swap(score) if game["venue"] == "A" else score
+            rows.append(
+                f'<tr class=""><td class="zentriert">{blank(game["gameday"])}</td>'
+                f'<td class="zentriert"><a title="{e(game["player_current_club"])}" href="#"><img alt="" src="#"></a></td>'
+                f'<td><img title="{e(game["venue_country"])}" src="#"> {blank(game["venue_city"])}</td>'
+                f'<td class="zentriert">{_date(game["date"])}</td>'
+                f'<td class="zentriert"><a href="#"><img title="{e(home)}" src="#"></a></td>'
+                f'<td class="zentriert"><a href="#"><img title="{e(guest)}" src="#"></a></td>'
+                f'<td class="zentriert"><a id="{e(game["game_id"])}" href="#"><span{result_class}>{e(shown)} {e(extension.strip())}</span></a></td>'
+                f'<td class="zentriert"><a href="#">{e(game["player_position"])}</a></td>'
+                f'<td class="zentriert">{"" if game["goals"] == 0 else game["goals"]}</td>'
+                f'<td class="zentriert">{"" if game["assists_amount"] == 0 else game["assists_amount"]}</td>'
+                f'<td class="zentriert">{"" if game["own_goals_amount"] == 0 else game["own_goals_amount"]}</td>'
+                f'<td class="zentriert">{blank(game["yellow_card"])}</td>'
+                f'<td class="zentriert">{blank(game["yellow_red_card"])}</td>'
+                f'<td class="zentriert">{blank(game["red_card"])}</td>'
+                f'<td class="zentriert">{blank(game["substitute_in"])}</td>'
+                f'<td class="zentriert">{blank(game["substitute_out"])}</td>'
+                f'<td class="rechts">{blank(game["minutes_played"])}</td></tr>'
+            )
+    profile = '<table><tr><th>Nationalmannschaft</th><td>Länderspiele</td></tr></table>'
+    games_table = f'<table><thead><tr><th>Spieltag</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+    return {urlsplit(page).path + ("?" + urlsplit(page).query if urlsplit(page).query else ""): _page(
+        f'<div class="box">{profile}</div><div class="box">{games_table}</div>'
+    )}
+
+
+def achievement_pages(achievements, page):
+    """
+    Builds the achievement page of a player, where every title is followed by the seasons it was won.
+
+    Args:
+        achievements: Achievement dataset of the player.
+        page: Url of the achievement page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    rows = []
+    titles = achievements["title"].ne(achievements["title"].shift()).cumsum()
+    for _, wins in achievements.groupby(titles, sort=False):
+        rows.append(f'<tr><td class="hauptlink" colspan="3">{len(wins)}x {e(wins["title"].iloc[0])}</td></tr>')
+        for win in wins.to_dict("records"):
+            if pd.isna(win["team"]):
+                rows.append(f'<tr><td class="zentriert">{e(win["year"])}</td></tr>')
+            else:
+                rows.append(
+                    f'<tr><td class="zentriert">{e(win["year"])}</td>'
+                    f'<td class="zentriert"><img alt="{e(win["team"])}" src="#"></td><td><a href="#">{e(win["team"])}</a></td></tr>'
+                )
+    body = f'<div class="box"><h2>\n                    Alle Titel                </h2><table><tbody>{"".join(rows)}</tbody></table></div>'
+    return {urlsplit(page).path: _page(body)}
+
+
+def _top_scorer_body(rows):
+    # rows are separated by line breaks, the parsers take every second node of the table body
+    return f'<div class="box"><table class="items"><thead><tr><th>#</th></tr></thead><tbody>\n{chr(10).join(rows)}\n</tbody></table></div>'
+
+
+def la_liga_top_scorer_pages(scorers, page):
+    """
+    Builds the page of the all time top scorers of la liga.
+
+    Args:
+        scorers: La liga top scorer dataset.
+        page: Url of the top scorer page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    rows = [
+        f'<tr><td class="zentriert">{rank}</td><td class="hauptlink"><a title="{e(scorer["name"])}" href="#">{e(scorer["name"])}</a></td>'
+        f'<td class="zentriert"><a title="Verein" href="#"><img src="#"></a></td>'
+        f'<td class="zentriert"><a href="#">{scorer["appearances"]}</a></td>'
+        f'<td class="rechts">{format(scorer["minutes_played"], ",").replace(",", ".")}</td>'
+        f'<td class="rechts">{scorer["minutes_played"] // max(scorer["goals"], 1)}</td><td class="zentriert">{scorer["goals"]}</td></tr>'
+        for rank, scorer in enumerate(scorers.to_dict("records"), 1)
+    ]
+    return {urlsplit(page).path: _page(_top_scorer_body(rows))}
+
+
+def cl_top_scorer_pages(scorers, page):
+    """
+    Builds the page of the all time top scorers of the champions league.
+
+    Args:
+        scorers: Champions league top scorer dataset.
+        page: Url of the top scorer page.
+
+    Returns:
+        pages: Dictionary of url and content of the page.
+    """
+    e = lambda value: html.escape(str(value))
+    rows = [
+        f'<tr><td class="zentriert">{rank}</td>'
+        '<td><table class="inline-table"><tr><td rowspan="2"><a href="#"><img src="#"></a></td>'
+        f'<td class="hauptlink"><a title="{e(scorer["name"])}" href="#">{e(scorer["name"])}</a></td></tr>'
+        '<tr><td>Mittelstürmer</td></tr></table></td>'
+        '<td class="zentriert"><img title="Nation" src="#"></td><td class="zentriert"><a href="#"><img src="#"></a></td>'
+        f'<td class="zentriert">35</td><td class="zentriert">{scorer["seasons"]}</td>'
+        f'<td class="zentriert">{scorer["appearances"]}</td><td class="zentriert">{scorer["goals"]}</td></tr>'
+        for rank, scorer in enumerate(scorers.to_dict("records"), 1)
+    ]
+    return {urlsplit(page).path: _page(_top_scorer_body(rows))}
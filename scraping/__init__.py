@@ -0,0 +1,6 @@
+"""
+Scrapers for the transfermarkt datasets in the data folder.
+
+Every module scrapes one dataset and can be run on its own, e.g. python -m scraping.achievements.
+The notebooks in scripts/ show the steps of every scraper and use the functions of these modules.
+"""
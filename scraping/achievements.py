@@ -0,0 +1,153 @@
+"""
+Scraper for the achievements of a player, see scripts/achievements_scraper.ipynb.
+
+Usage:
+    python -m scraping.achievements
+"""
+import re
+
+import pandas as pd
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup, parse_many
+from scraping.players import pages
+from scraping.store import combinePlayerData, storeData
+
+# achievement page of every player
+PAGES = pages("achievements")
+
+FILENAME = "player_achievements.csv"
+
+
+def getTitleData(table_row):
+    """
+    This function takes a row from the achievements table and returns a structured representation of the data.
+
+    Args:
+        table_row: Description of the parameter.
+
+    Returns:
+        title_data: Representation of the achievement data from the achievement row
+    """
+    title_data = { }
+
+    tds = table_row.find_all("td")
+    if (len(tds) == 1):
+        title_data["year"] = tds[0].text.strip()
+        title_data["team"] = None
+        return title_data
+    elif (len(tds) != 3):
+        print("Invalid length for table column amount within a row")
+        return title_data
+
+    # get year
+    year_tag = tds[0]
+    title_data["year"] = year_tag.text.strip()
+
+    # get team
+    team_tag = tds[1].find_next("img")
+    if (team_tag):
+        title_data["team"] = team_tag.get("alt", "No teamname available")
+    else:
+        title_data["team"] = "No teamname available"
+
+    return title_data
+
+
+def parseAchievements(content):
+    """
+    This function reads all rows from the achievements table of an achievements page.
+
+    Args:
+        content: Raw content of the achievements page.
+
+    Returns:
+        titleList: List of all rows of the achievments table.
+    """
+    pageSoup = page_soup(content, ["h2", "table"])
+    titleList = []
+    htwos = pageSoup.find_all("h2", string="\n                    Alle Titel                ")
+    if (len(htwos) < 1):
+        print("Could not find all trophies table")
+
+    rows = htwos[0].find_next("tbody").find_all("tr")
+
+    current_title_name = None # some tr elements represent table title names, there
+    # iterate over rows, but exclude first two rows that are the header and total sum
+    for row_id in range(len(rows)):
+        # if row is current table header, change current title name
+        if (rows[row_id].find_next("td").get("class", "no class available")[0] == "hauptlink"):
+            current_title_name = rows[row_id].find_next("td").text.strip()
+            current_title_name = re.sub(r'\d+x ', '', current_title_name)
+        else:
+            # in this case the row is a won title which is stored
+            title = getTitleData(rows[row_id])
+            title["title"] = current_title_name
+            titleList.append(title)
+
+    return titleList
+
+
+def getAllAchievements(page, fetcher=None):
+    """
+    This function opens an achievements page from transfermarkt.com and reads all rows from the achievements table
+
+    Args:
+        page: URL of the achievements page.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        titleList: List of all rows of the achievments table.
+    """
+    return parseAchievements((fetcher or default_fetcher()).fetch(page))
+
+
+def createDataFrameFromTitles(titleList):
+    """
+    Creates a dataframe using the specified data structure for each title of the player.
+
+    Args:
+        titleList:  List of all rows of the achievments table.
+
+    Returns:
+        df: dataframe for the achievements list.
+    """
+    rows = []
+    for title in titleList:
+        row = {
+            'year': title['year'],
+            'title': title['title'],
+            'team': title['team'],
+        }
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(pages=PAGES, fetcher=None):
+    """
+    Scrapes the achievements of all players.
+
+    Args:
+        pages: Dictionary of player name and url of the achievements page.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the achievements of all players.
+    """
+    contents = (fetcher or default_fetcher()).fetch_many(pages.values())
+    df = combinePlayerData({
+        player_name: createDataFrameFromTitles(titles)
+        for player_name, titles in zip(pages, parse_many(parseAchievements, contents))
+    })
+
+    # remove unwanted data
+    df = df[~df['title'].str.contains('Teilnehmer', na=False)]
+    df = df[~df['title'].str.contains('Finalist', na=False)]
+    return df
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
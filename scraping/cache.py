@@ -0,0 +1,174 @@
+"""
+On-disk cache for the pages fetched by the scrapers.
+
+The raw content of every page is stored once under the sha256 of its content (objects/), next to an
+index entry per url with the digest, the fetch time and the ETag/Last-Modified validators of the
+response (index/). Entries with validators are revalidated with a conditional request, entries
+without are reused until they are older than the ttl. The index ignores the end date of a url, e.g. of the
+international games until today, so the page of a new day is revalidated instead of fetched again. In offline mode pages are only replayed from
+the cache, so parsers can be re-run without any network.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+from analysis.config import DATA_DIR
+
+CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+
+# pages without validators are fetched again after one day
+DEFAULT_TTL = 24 * 60 * 60
+
+# end date of a page, see PAGE_PATHS of scraping/players.py
+_END_DATE = re.compile(r"/ende/\d{4}-\d{2}-\d{2}/")
+
+
+class CacheMiss(LookupError):
+    """
+    Raised in offline mode for pages that are not in the cache.
+    """
+
+
+def _write_atomic(path, content):
+    # write to a temporary file in the same folder and replace, so readers never see partial files
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ResponseCache:
+    """
+    Content addressed cache of fetched pages.
+
+    Args:
+        cache_dir: Folder of the cache.
+        ttl: Seconds a page without ETag/Last-Modified is reused before it is fetched again.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=DEFAULT_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _index_path(self, url):
+        key = _END_DATE.sub("/ende//", url)
+        return os.path.join(self.cache_dir, "index", hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _object_path(self, digest):
+        return os.path.join(self.cache_dir, "objects", digest[:2], digest)
+
+    def get(self, url):
+        """
+        Returns the index entry of a page.
+
+        Args:
+            url: Url of the page.
+
+        Returns:
+            entry: Dictionary with url, digest, fetched_at, etag and last_modified, None if not cached.
+        """
+        try:
+            with open(self._index_path(url), encoding="utf-8") as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not os.path.exists(self._object_path(entry["digest"])):
+            return None
+        return entry
+
+    def content(self, entry):
+        """
+        Returns the raw content of a cached page.
+
+        Args:
+            entry: Index entry of the page.
+
+        Returns:
+            content: Raw content of the page.
+        """
+        with open(self._object_path(entry["digest"]), "rb") as file:
+            return file.read()
+
+    def is_fresh(self, entry):
+        """
+        Checks if a page can be used without asking the server.
+
+        Args:
+            entry: Index entry of the page.
+
+        Returns:
+            fresh: True if the page has no validators and is younger than the ttl.
+        """
+        if entry["etag"] or entry["last_modified"]:
+            return False
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def conditional_headers(self, entry):
+        """
+        Returns the headers for revalidating a cached page.
+
+        Args:
+            entry: Index entry of the page.
+
+        Returns:
+            headers: If-None-Match and If-Modified-Since headers of the validators that are known.
+        """
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url, content, headers):
+        """
+        Stores a fetched page.
+
+        Args:
+            url: Url of the page.
+            content: Raw content of the page.
+            headers: Headers of the response.
+
+        Returns:
+            entry: Index entry of the page.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        if not os.path.exists(self._object_path(digest)):
+            _write_atomic(self._object_path(digest), content)
+        entry = {
+            "url": url,
+            "digest": digest,
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        _write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+        return entry
+
+    def touch(self, entry, headers):
+        """
+        Marks a cached page as revalidated now, after the server answered 304 Not Modified.
+
+        Args:
+            entry: Index entry of the page.
+            headers: Headers of the 304 response, which may carry new validators.
+
+        Returns:
+            entry: Updated index entry of the page.
+        """
+        entry = dict(
+            entry,
+            fetched_at=time.time(),
+            etag=headers.get("ETag", entry["etag"]),
+            last_modified=headers.get("Last-Modified", entry["last_modified"]),
+        )
+        _write_atomic(self._index_path(entry["url"]), json.dumps(entry).encode("utf-8"))
+        return entry
@@ -0,0 +1,150 @@
+"""
+Scraper for the all time top scorers of the UEFA Champions League, see scripts/cl_top_scorer_scraper.ipynb.
+
+Usage:
+    python -m scraping.cl_top_scorers
+"""
+import pandas as pd
+from bs4 import SoupStrainer
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup
+from scraping.store import storeData
+
+PAGE = "https://www.transfermarkt.com/uefa-champions-league/ewigetorschuetzenliste/pokalwettbewerb/CL/land_id/0/saisonIdVon/1955/saisonIdBis/2024"
+
+FILENAME = "cl_top_scorer.csv"
+
+
+def getRowData(row):
+    """
+    This function parses the data from a single row of the uefa cl top scorer table.
+
+    Args:
+        row: Table row
+
+    Returns:
+        player: Information about the player in the uefa cl top scorer list.
+    """
+    player = {}
+
+    #get player name
+    init_tag = row.find_next("a")
+    if (not init_tag):
+        return None
+
+    # get name tag
+    name_tag = init_tag.find_next("td").find_next("a")
+    if (name_tag):
+        player["name"] = name_tag.get("title", "No title available")
+
+
+    club_tag = name_tag.find_next("td").find_next("td").find_next("td") # only used to find appearances tag
+    if not club_tag:
+        return None
+    age_tag = club_tag.find_next("td") # only used to find appearances tag
+    if not age_tag:
+        return None
+
+    # get amount of played seasons
+    seasons_tag = age_tag.find_next("td")
+    if (seasons_tag):
+        player["seasons"] = int(seasons_tag.text.strip())
+
+
+    # get appearances
+    appearance_tag = seasons_tag.find_next("td")
+    if (appearance_tag):
+        player["appearances"] = int(appearance_tag.text.strip())
+
+    # get goal amount
+    goals_tag = appearance_tag.find_next("td")
+    if (goals_tag):
+        player["goals"] = int(goals_tag.text.strip())
+
+    return player
+
+
+def parseTopPlayers(content):
+    """
+    This function reads the rows of the top scorer table.
+
+    Args:
+        content: Raw content of the top scorer page.
+
+    Returns:
+        top_players: Information about the top scoring players.
+    """
+    pageSoup = page_soup(content, SoupStrainer("table", class_="items"))
+    top_players = []
+    table = pageSoup.find("table", class_="items")
+    if not table:
+        return None
+    tbody = table.find_next("tbody")
+    if not tbody:
+        return None
+
+    rows = tbody.contents
+
+    for row in rows[1::2]:  # No iterations because the slice is empty
+        player = getRowData(row)
+        top_players.append(player)
+
+    return top_players
+
+
+def getTopPlayers(page=PAGE, fetcher=None):
+    """
+    This function reads the information of the uefa cl top scorer table and returns each row.
+
+    Args:
+        page: Url of the top scorer page.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        title_data: List containing the all time top scorers of the UEFA Champions League.
+    """
+    return parseTopPlayers((fetcher or default_fetcher()).fetch(page))
+
+
+def createDataframe(list):
+    """
+    Creates a dataframe for the all time uefa cl top scorers list.
+
+    Args:
+        list: top scorer list
+
+    Returns:
+        df: converted dataframe.
+    """
+    rows = []
+    for player in list:
+        row = {
+            'name': player['name'],
+            'seasons': player['seasons'],
+            'appearances': player['appearances'],
+            'goals': player['goals']
+        }
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(page=PAGE, fetcher=None):
+    """
+    Scrapes the top scorer table.
+
+    Args:
+        page: Url of the top scorer page.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the top scorers.
+    """
+    return createDataframe(getTopPlayers(page, fetcher))
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
@@ -0,0 +1,296 @@
+"""
+Scraper for the club goals of a player, see scripts/club_goal_scraper.ipynb.
+
+Usage:
+    python -m scraping.club_goals
+"""
+import re
+
+import pandas as pd
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup, parse_many
+from scraping.players import pages
+from scraping.store import combinePlayerData, storeData
+
+# page listing all club goals of every player
+PAGES = pages("club_goals")
+
+FILENAME = "player_club_goals.csv"
+
+
+def getGoalData(game):
+    """
+    This function parses the club goal data from a single row
+
+    Args:
+        game: Row containing data for a game of football and goals scored.
+
+    Returns:
+        player: Scraped data from the row.
+    """
+    game_data = { }
+    goal_data = { }
+
+    # get saison
+    a_tag = game.find_next("a")
+    if a_tag:
+        h_ref = a_tag.get("href", "No href available")
+        parts = h_ref.split('/')
+        saison_id = parts[parts.index('saison_id') + 1]
+        game_data["saison"] = saison_id
+
+    # get liga
+    liga_tag = game.find("img")
+    if liga_tag:
+        game_data["league"] = liga_tag.get("alt", "No alt attribute found")
+    else:
+        print("Found second goal in the same game.")
+
+    # get gameday of the season
+    spieltag_tag = liga_tag.find_next().find("a")
+    if spieltag_tag:
+        game_data["gameday"] = spieltag_tag.text.strip()
+
+    # get venue where game was played
+    ort_tag = spieltag_tag.find_next()
+    if ort_tag:
+        game_data["venue"]  = ort_tag.text.strip()
+
+    # get team for which player played
+    team_tag = ort_tag.find_next("a")
+    if team_tag:
+        game_data["team"]  = team_tag.get("title", "No team found")
+
+    # get teams table position
+    team_pos_tag = team_tag.find_next("td")
+    found = False
+    # try to find team table position if exists
+    for child in team_pos_tag.children:
+        regex = r"\(([0-9]+)\.\)"
+        matches = re.findall(regex, child.text.strip())
+        if len(matches) > 0:
+            game_data["team_table_position"] = matches[0]
+            found = True
+    if not found:
+        # if not found, set none
+        game_data["team_table_position"] = None
+
+    # get opponent for game played
+    gegner_tag = team_tag.find_next().find_next("img")
+    if gegner_tag:
+        game_data["opponent"] = gegner_tag.get("alt", "No alt attribute found")
+
+    # get opponent table position
+    gegner_pos_tag = gegner_tag.find_next("span")
+    found = False
+    # try to find opponent table position if exists
+    for child in gegner_pos_tag.children:
+        regex = r"\(([0-9]+)\.\)"
+        matches = re.findall(regex, child.text.strip())
+        if len(matches) > 0:
+            game_data["opponent_table_position"] = matches[0]
+            found = True
+    if not found:
+        # if no table position, set none
+        game_data["opponent_table_position"] = None
+
+    # get end result of the game
+    ergebnis_tag = gegner_tag.find_next("a").find_next("a")
+    if ergebnis_tag:
+        game_data["result"] = ergebnis_tag.text.strip()
+        game_data["game_id"] = ergebnis_tag.get("id", "no id available")
+        if game_data["venue"] == "A":
+            scoreboard = ergebnis_tag.text.strip().split(" ")
+            x, y = map(int, scoreboard[0].split(":"))
+            if x < y:
+                 x, y = y, x
+            game_data["result"] = str(x) + ":" + str(y)
+            if len(scoreboard) > 2:
+                game_data["result"] = game_data["result"] + " " + scoreboard[2]
+
+    # get position played by player
+    position_tag = ergebnis_tag.find_next("a")
+    if position_tag:
+        game_data["player_position"] = position_tag.text.strip()
+
+    # get minute in which goal happened
+    tor_minute_tag = position_tag.find_next("td")
+    if tor_minute_tag:
+        goal_data["minute"] = tor_minute_tag.text.strip()
+
+    # get score after goal
+    spielstand_tag = tor_minute_tag.find_next()
+    if spielstand_tag:
+        goal_data["score"] = spielstand_tag.text.strip()
+
+    # get type of goal
+    torart_tag = spielstand_tag.find_next()
+    if torart_tag:
+        goal_data["goal_type"] = torart_tag.text.strip()
+
+    game_data["goals"] = []
+    game_data["goals"].append(goal_data)
+    return game_data
+
+
+def getConsecutiveGoalData(game):
+    """
+    This function reads a consecutive goal in a game already parsed.
+    It is needed because transfermarkt uses multiple lines for consecutive goals within the same game.
+
+    Args:
+        game: Row containing data for a game of football and goals scored.
+
+    Returns:
+        goal_data: Scraped data rom the row.
+    """
+    goal_data = { }
+
+    # get time where
+    time_tag = game.find("td").find_next()
+    if (time_tag):
+        goal_data["minute"] = time_tag.text.strip()
+
+    # get score after goal scored
+    score_tag = time_tag.find_next()
+    if (score_tag):
+        goal_data["score"] = score_tag.text.strip()
+
+    # get goal type
+    goal_type_tag = score_tag.find_next()
+    if (goal_type_tag):
+        goal_data["goal_type"] = goal_type_tag.text.strip()
+
+    return goal_data
+
+
+def parsePlayerGoals(content):
+    """
+    This function reads all rows from the goal data table of a transfermarkt page and parses the data for each row.
+
+    Args:
+        content: Raw content of the page containing the data to be scraped.
+
+    Returns:
+        gamesLIst: Scraped data containing all goals in a club career for a player.
+    """
+    pageSoup = page_soup(content, "table")
+    gamesList = []
+    # get all rows for the games
+    games = pageSoup.find_all("tr", class_=True)
+
+    # Init Variables to store previous row values from the table.
+    # because multiple goals can occur in a single game, we need to store the color values of the rows.
+    # if two consecutive rows have the same color, its the same game.
+    lastColor = None
+    lastGame = None
+
+    for i in range(len(games)):
+        game = games[i]
+        color = game.get("class", "No alt attribute found")
+        # if first game in list
+        if (lastColor == None or lastGame == None):
+            lastColor = color
+            gameData = getGoalData(game)
+            lastGame = gameData
+        # if new game
+        elif (lastColor != color):
+            gamesList.append(lastGame)
+            gameData = getGoalData(game)
+            lastColor = color
+            lastGame = gameData
+        # if row has goal in same game
+        elif (lastColor == color):
+            goalData = getConsecutiveGoalData(game)
+            if (lastGame != None):
+                lastGame["goals"].append(goalData)
+    # store last game from list.
+    gamesList.append(lastGame)
+    print("Games loaded.")
+    return gamesList
+
+
+def getAllPlayerGoals(page, fetcher=None):
+    """
+    This function reads all scrapes all rows from the goal data table of transfermarkt and parses the data for each row.
+
+    Args:
+        page: Page containing the data to be scraped.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        gamesLIst: Scraped data containing all goals in a club career for a player.
+    """
+    return parsePlayerGoals((fetcher or default_fetcher()).fetch(page))
+
+
+def createDataFrameFromGames(gamesList):
+    """
+    This function creates a dataframe from a list of goal data per game.
+
+    Args:
+        gamsList: List of games with details about the goals scored by the player.
+
+    Returns:
+        df: Converted dataframe.
+    """
+    # store goals list in dataframe
+    rows = []
+    for game in gamesList:
+        for goal in game['goals']:
+            row = {
+                'game_id': game['game_id'],
+                'saison': game['saison'],
+                'league': game['league'],
+                'gameday': game['gameday'],
+                'venue': game['venue'],
+                'team': game['team'],
+                'team_table_position': game['team_table_position'],
+                'opponent': game['opponent'],
+                'opponent_table_position': game['opponent_table_position'],
+                'result': game['result'],
+                'player_position': game['player_position'],
+                'goal_minute': goal['minute'],
+                'goal_score': goal['score'],
+                'goal_type': goal['goal_type']
+            }
+            rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(pages=PAGES, fetcher=None):
+    """
+    Scrapes the club goals of all players.
+
+    Args:
+        pages: Dictionary of player name and url of the page listing all club goals.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the club goals of all players.
+    """
+    contents = (fetcher or default_fetcher()).fetch_many(pages.values())
+    dataframes = {
+        player_name: createDataFrameFromGames(games)
+        for player_name, games in zip(pages, parse_many(parsePlayerGoals, contents))
+    }
+
+    # Messis data contains goals from the B Team of FC Barcelona, which does not count as professional football
+    # therefore, those goals have to be removed.
+    dataframes = {player_name: df[df["team"] != "FC Barcelona B"] for player_name, df in dataframes.items()}
+    df = combinePlayerData(dataframes)
+
+    # we also have to split the goal time into regular time and added time for better visualisation
+    # (the dataset keeps an unused goal_added_time column, which is always 0)
+    df["goal_added_time"] = 0
+    df["added_time"] = df["goal_minute"].str.extract(r"\+(\d+)")[0].fillna(0).astype(int)  # Extract added time
+    df["goal_minute"] = df["goal_minute"].str.split("'").str[0].astype(int)  # Extract main minute
+    return df
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
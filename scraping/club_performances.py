@@ -0,0 +1,224 @@
+"""
+Scraper for the club performance per season and competition of a player, see scripts/club_performance_scraper.ipynb.
+
+Usage:
+    python -m scraping.club_performances
+"""
+import pandas as pd
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup, parse_many
+from scraping.players import pages
+from scraping.store import combinePlayerData, storeData
+
+# detailed performance page of every player
+PAGES = pages("club_performances")
+
+FILENAME = "player_club_performance.csv"
+
+
+def getGameData(table_row):
+    """
+    this function takes a row from the seasons and competitions played and fetches all relevant game performance data.
+    Args:
+        table_row: Row containing data for a season in a single competition
+
+    Returns:
+        game_data: Scraped data from the row.
+    """
+    game_data = { }
+
+    # get saison if there is one
+    saison_tag = table_row.find_next("td")
+    if (saison_tag):
+        game_data["saison"] = saison_tag.text.strip()
+
+    # get competition where player played
+    competition_tag = saison_tag.find_next("img")
+    if (competition_tag):
+        game_data["competition"] = competition_tag.get("title", "No title available")
+
+
+    # get club where player played
+    club_tag = competition_tag.find_next("img")
+    if (club_tag):
+        game_data["club"] = club_tag.get("alt", "no alt available")
+
+    # get games played in competition in a season
+    games_tag = club_tag.find_next("td")
+    if (games_tag):
+        game_data["games_played"] = games_tag.text.strip()
+        if (game_data["games_played"] == "-"):
+            game_data["games_played"] = 0
+
+    # get goals in competition for row
+    goals_tag = games_tag.find_next("td")
+    if (goals_tag):
+        game_data["goals"] = goals_tag.text.strip()
+        if (game_data["goals"] == "-"):
+            game_data["goals"] = 0
+
+    # get assists by player
+    assists_tag = goals_tag.find_next("td")
+    if (assists_tag):
+        game_data["assists"] = assists_tag.text.strip()
+        if (game_data["assists"] == "-"):
+            game_data["assists"] = 0
+
+    # get owngoals in competition for row
+    owngoals_tag = assists_tag.find_next("td")
+    if (owngoals_tag):
+        game_data["owngoals"] = owngoals_tag.text.strip()
+        if (game_data["owngoals"] == "-"):
+            game_data["owngoals"] = 0
+
+    # get amount of substitute in for player
+    subst_in_tag = owngoals_tag.find_next("td")
+    if (subst_in_tag):
+        game_data["substitute_in"] = subst_in_tag.text.strip()
+        if (game_data["substitute_in"] == "-"):
+            game_data["substitute_in"] = 0
+
+    # get amount of substitute out for player
+    subst_out_tag = subst_in_tag.find_next("td")
+    if (subst_out_tag):
+        game_data["substitute_out"] = subst_out_tag.text.strip()
+        if (game_data["substitute_out"] == "-"):
+            game_data["substitute_out"] = 0
+
+    # get amount of yellow cards for player
+    yellow_tag = subst_out_tag.find_next("td")
+    if (yellow_tag):
+        game_data["yellow_cards"] = yellow_tag.text.strip()
+        if (game_data["yellow_cards"] == "-"):
+            game_data["yellow_cards"] = 0
+
+    # get amount of yellow red out for player
+    yellow_red_tag = yellow_tag.find_next("td")
+    if (yellow_red_tag):
+        game_data["yellow_red_cards"] = yellow_red_tag.text.strip()
+        if (game_data["yellow_red_cards"] == "-"):
+            game_data["yellow_red_cards"] = 0
+
+     # get amount of straight red cards for player
+    red_cards_tag = yellow_red_tag.find_next("td")
+    if (red_cards_tag):
+        game_data["red_cards"] = red_cards_tag.text.strip()
+        if (game_data["red_cards"] == "-"):
+            game_data["red_cards"] = 0
+
+    # get penalty amount
+    penalties_tag = red_cards_tag.find_next("td")
+    if (penalties_tag):
+        game_data["penalties"] = penalties_tag.text.strip()
+        if (game_data["penalties"] == "-"):
+            game_data["penalties"] = 0
+
+    # get minutes playded
+    minutes_tag = penalties_tag.find_next("td").find_next("td")
+    if (minutes_tag):
+        game_data["minutes_played"] = minutes_tag.text.strip()
+        if (game_data["minutes_played"] == "-"):
+            game_data["minutes_played"] = 0
+
+    return game_data
+
+
+def parseClubPerformances(content):
+    """
+    This function reads the club peformance data from a tranfermarkt page.
+    Args:
+        content: Raw content of the page containing the club performance data.
+
+    Returns:
+        gamesList: List of games played by competition and season with additional stats.
+    """
+    pageSoup = page_soup(content, ["table", "h2"])
+    gamesList = []
+    # get tables of national liga, national cup and international cup data.
+    tables = pageSoup.find_all("table")
+    # get competition type names
+    htwos = pageSoup.find_all("h2", class_="content-box-headline")
+    competition_type_names = [h2.text.strip() for h2 in htwos[1:]]
+
+
+    for table_id in range(len(tables)):
+        rows = tables[table_id].find_all("tr")
+        # iterate over rows, but exclude first two rows that are the header and total sum
+        for row_id in range(2, len(rows)):
+            game = getGameData(rows[row_id])
+            game["competition_type"] = competition_type_names[table_id]
+            gamesList.append(game)
+
+    return gamesList
+
+
+def getAllClubPerformances(page, fetcher=None):
+    """
+    This function scarpes a tranfermarkt page for club peformance data.
+    Args:
+        page: Row containing the club performance data.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        gamesList: List of games played by competition and season with additional stats.
+    """
+    return parseClubPerformances((fetcher or default_fetcher()).fetch(page))
+
+
+def createDataFrameFromGames(gamesList):
+    """
+    This function creates a dataframe for a given club performance games list.
+    Args:
+        gamesList: List containing club performances
+
+    Returns:
+        df: resulting dataframe
+    """
+    # store goals list in dataframe
+    rows = []
+    for game in gamesList:
+        row = {
+            'saison': game["saison"],
+            'competition_type': game['competition_type'],
+            'competition': game['competition'],
+            'club': game['club'],
+            'games_played': game['games_played'],
+            'goals': game['goals'],
+            'assists': game['assists'],
+            'owngoals': game['owngoals'],
+            'substitute_in': game['substitute_in'],
+            'substitute_out': game['substitute_out'],
+            'yellow_cards': game['yellow_cards'],
+            'yellow_red_cards': game['yellow_red_cards'],
+            'red_cards': game['red_cards'],
+            'penalties': game['penalties'],
+            'minutes_played': game['minutes_played']
+        }
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(pages=PAGES, fetcher=None):
+    """
+    Scrapes the club performances of all players.
+
+    Args:
+        pages: Dictionary of player name and url of the detailed performance page.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the club performances of all players.
+    """
+    contents = (fetcher or default_fetcher()).fetch_many(pages.values())
+    return combinePlayerData({
+        player_name: createDataFrameFromGames(games)
+        for player_name, games in zip(pages, parse_many(parseClubPerformances, contents))
+    })
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
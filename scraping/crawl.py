@@ -0,0 +1,253 @@
+"""
+Crawl of all datasets for every player of the registry (scraping/players.json).
+
+The registry is expanded into one job per player and per-player dataset, plus one job per top scorer
+list. The jobs run on a pool of worker threads sharing one Fetcher, so the rate limit holds for the
+whole crawl. Every job fetches and parses the pages of its player and stores the rows in a shard of
+its own, data/crawl/<dataset>/<player slug>.csv, so workers never write the same file.
+
+Finished jobs are appended to the job log data/crawl/jobs.log after their shard is stored. A crawl
+that is started again skips the jobs logged as done, so a crashed crawl continues where it stopped.
+Failed jobs are logged with their error and run again by the next crawl. With --combine the shards
+are streamed into the datasets of the data folder, in the order of the registry.
+
+Usage:
+    python -m scraping.crawl [--datasets club_goals penalties ...] [--workers 8] [--registry players.json] [--combine]
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from scraping import (achievements, cl_top_scorers, club_goals, club_performances, injuries,
+                      international_performances, la_liga_top_scorers, penalties)
+from scraping.fetch import Fetcher, default_fetcher
+from scraping.players import REGISTRY, international_players, load_players, pages
+from scraping.store import storeData
+from scraping.stream import BATCH_SIZE, BatchWriter
+
+CRAWL_DIR = os.path.join(DATA_DIR, "crawl")
+
+# dataset -> scraper module, True if the dataset has a page per player
+KINDS = {
+    "achievements": (achievements, True),
+    "club_goals": (club_goals, True),
+    "club_performances": (club_performances, True),
+    "injuries": (injuries, True),
+    "international_performances": (international_performances, True),
+    "penalties": (penalties, True),
+    "la_liga_top_scorer": (la_liga_top_scorers, False),
+    "cl_top_scorer": (cl_top_scorers, False),
+}
+
+
+class JobLog:
+    """
+    Append only log of the finished and failed jobs of a crawl, one json object per line.
+
+    Args:
+        path: Path of the log file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.status = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # the last line of a crashed crawl may be cut off
+                        continue
+                    self.status[entry["job"]] = entry["status"]
+
+    def is_done(self, job_id):
+        """
+        Returns True if the last entry of a job says it is done.
+        """
+        return self.status.get(job_id) == "done"
+
+    def record(self, job_id, status, **details):
+        """
+        Appends an entry for a job and writes it to disk before returning.
+
+        Args:
+            job_id: Id of the job.
+            status: "done" or "failed".
+            details: Further values stored with the entry, e.g. the number of rows.
+        """
+        entry = {"job": job_id, "status": status, "time": datetime.now().isoformat(timespec="seconds"), **details}
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            self.status[job_id] = status
+
+
+def expand(players, datasets=None):
+    """
+    Expands the registry into the jobs of a crawl.
+
+    Args:
+        players: Registry entries, see scraping.players.load_players().
+        datasets: Names of the datasets to crawl, all of KINDS if not given.
+
+    Returns:
+        jobs: List of dataset and player name of every job, the player name is None for the top scorer lists.
+    """
+    jobs = []
+    for dataset in datasets or KINDS:
+        if KINDS[dataset][1]:
+            jobs += [(dataset, player_name) for player_name in players]
+        else:
+            jobs.append((dataset, None))
+    return jobs
+
+
+def shard_name(job, players):
+    """
+    Returns the file of a job relative to the crawl folder, which is also the id of the job.
+
+    Args:
+        job: Dataset and player name of the job.
+        players: Registry entries.
+
+    Returns:
+        name: Path of the shard, e.g. club_goals/lionel-messi.csv.
+    """
+    dataset, player_name = job
+    return f"{dataset}/{players[player_name]['slug'] if player_name else dataset}.csv"
+
+
+def run_job(job, players, fetcher):
+    """
+    Scrapes the rows of a job.
+
+    Args:
+        job: Dataset and player name of the job.
+        players: Registry entries.
+        fetcher: Fetcher used to request the pages.
+
+    Returns:
+        df: Scraped rows.
+    """
+    dataset, player_name = job
+    module, per_player = KINDS[dataset]
+    if not per_player:
+        return module.scrape(fetcher=fetcher)
+    player = {player_name: players[player_name]}
+    if dataset == "international_performances":
+        return module.scrape(international_players(player), fetcher)
+    return module.scrape(pages(dataset, player), fetcher)
+
+
+def crawl(players=None, datasets=None, out_dir=CRAWL_DIR, workers=8, fetcher=None):
+    """
+    Runs all jobs of the registry that are not logged as done yet.
+
+    Args:
+        players: Registry entries, the registry file if not given.
+        datasets: Names of the datasets to crawl, all if not given.
+        out_dir: Folder of the shards and the job log.
+        workers: Number of jobs running at the same time.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+
+    Returns:
+        counts: Dictionary with the number of jobs, skipped, done and failed jobs.
+    """
+    players = load_players() if players is None else players
+    fetcher = fetcher or default_fetcher()
+    log = JobLog(os.path.join(out_dir, "jobs.log"))
+    jobs = expand(players, datasets)
+    pending = [
+        job for job in jobs
+        if not (log.is_done(shard_name(job, players)) and os.path.exists(os.path.join(out_dir, shard_name(job, players))))
+    ]
+    counts = {"jobs": len(jobs), "skipped": len(jobs) - len(pending), "done": 0, "failed": 0}
+
+    def run(job):
+        job_id = shard_name(job, players)
+        start = time.perf_counter()
+        df = run_job(job, players, fetcher)
+        folder, filename = os.path.split(os.path.join(out_dir, job_id))
+        storeData(df, filename, folder)
+        log.record(job_id, "done", rows=len(df), seconds=round(time.perf_counter() - start, 3))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run, job): job for job in pending}
+        for future in as_completed(futures):
+            job_id = shard_name(futures[future], players)
+            try:
+                future.result()
+                counts["done"] += 1
+            except Exception as error:
+                # the job is run again by the next crawl
+                log.record(job_id, "failed", error=f"{type(error).__name__}: {error}")
+                counts["failed"] += 1
+                print(f"Job {job_id} failed: {error}")
+    return counts
+
+
+def combine(players=None, datasets=None, out_dir=CRAWL_DIR, data_dir=DATA_DIR):
+    """
+    Merges the shards of every dataset into its file in the data folder.
+    A dataset is only stored if the shards of all its jobs exist.
+
+    Args:
+        players: Registry entries, the registry file if not given.
+        datasets: Names of the datasets to combine, all if not given.
+        out_dir: Folder of the shards.
+        data_dir: Folder of the datasets.
+
+    Returns:
+        rows: Dictionary of dataset and number of stored rows, None for incomplete datasets.
+    """
+    players = load_players() if players is None else players
+    rows = {}
+    for dataset in datasets or KINDS:
+        paths = [os.path.join(out_dir, shard_name(job, players)) for job in expand(players, [dataset])]
+        if not all(os.path.exists(path) for path in paths):
+            rows[dataset] = None
+            continue
+        # the shards are streamed as text, so the values are written back unchanged and only a
+        # batch of rows is in memory at a time
+        with BatchWriter(os.path.join(data_dir, DATASETS[dataset])) as writer:
+            for path in paths:
+                for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=BATCH_SIZE):
+                    writer.columns = writer.columns or list(chunk.columns)
+                    writer.write_rows(chunk.to_dict("records"))
+        rows[dataset] = writer.rows
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrapes all datasets for every player of the registry.")
+    parser.add_argument("--datasets", nargs="+", help=f"datasets to crawl, all of {', '.join(KINDS)} if not given")
+    parser.add_argument("--registry", default=REGISTRY, help="player registry file")
+    parser.add_argument("--workers", type=int, default=8, help="jobs running at the same time")
+    parser.add_argument("--out", default=CRAWL_DIR, help="folder of the shards and the job log")
+    parser.add_argument("--combine", action="store_true", help="merge the shards into the datasets of the data folder")
+    parser.add_argument("--base-url", help="scheme and host the pages are requested from, e.g. a scraping.standin server")
+    args = parser.parse_args()
+    unknown = [name for name in args.datasets or [] if name not in KINDS]
+    if unknown:
+        parser.error(f"unknown datasets {unknown}")
+
+    players = load_players(args.registry)
+    # a local stand-in is requested without rate limit
+    fetcher = Fetcher(max_workers=args.workers, requests_per_second=None, base_url=args.base_url) if args.base_url else None
+    counts = crawl(players, args.datasets, args.out, args.workers, fetcher)
+    print(f"{counts['jobs']} jobs: {counts['skipped']} already done, {counts['done']} done, {counts['failed']} failed")
+    if args.combine:
+        for dataset, rows in combine(players, args.datasets, args.out).items():
+            print(f"{dataset}: {'shards missing' if rows is None else f'{rows} rows stored'}")
@@ -0,0 +1,233 @@
+"""
+Shared fetch layer for the transfermarkt scrapers.
+
+All scrapers request their pages through a Fetcher. It keeps one pooled keep-alive session, fetches
+several pages at the same time with a bounded number of workers, limits the number of requests per
+second for every host and retries failed requests with exponential backoff. Pages are kept in the
+on-disk cache of scraping/cache.py, so unchanged pages are not downloaded again.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scraping.cache import CacheMiss, ResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Header used to perform http request data from web server.
+HEADERS = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64} AppleWebKit/537.36 (KHTML, like Gecko) Chrome/47.0.2526.106 Safari/537.36'}
+
+# status codes of responses that are worth another try
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """
+    Spaces the requests to every host by a fixed interval, independent of the number of workers.
+    """
+
+    def __init__(self, requests_per_second):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        """
+        Blocks until the next request to a host is allowed.
+
+        Args:
+            host: Host of the request.
+        """
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Fetcher:
+    """
+    Fetches pages over a pooled keep-alive session.
+
+    Args:
+        max_workers: Number of pages fetched at the same time.
+        requests_per_second: Maximal number of requests per second to a single host, None for no limit.
+        retries: Number of retries of a failed request.
+        backoff: Wait time in seconds before the first retry, doubled for every further retry.
+        timeout: Connect and read timeout in seconds.
+        base_url: If given, scheme and host of every url are replaced by it, e.g. to fetch from a local stand-in.
+        cache: ResponseCache the pages are stored in, None for no caching.
+        offline: If True, pages are only replayed from the cache and no request is made.
+    """
+
+    def __init__(self, max_workers=4, requests_per_second=2.0, retries=3, backoff=1.0, timeout=(5, 30), base_url=None,
+                 cache=None, offline=False):
+        if offline and cache is None:
+            raise ValueError("offline mode needs a cache")
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.base_url = base_url
+        self.cache = cache
+        self.offline = offline
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, url):
+        """
+        Returns the url that is actually requested for a page.
+
+        Args:
+            url: Url of the page on transfermarkt.
+
+        Returns:
+            url: Url with the host replaced by base_url, if set.
+        """
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+    def _delay(self, attempt, retry_after=None):
+        # honour the wait time requested by the server, otherwise exponential backoff with jitter
+        if retry_after is not None and retry_after.isdigit():
+            return int(retry_after)
+        return self.backoff * 2 ** attempt * (0.5 + random.random() / 2)
+
+    def _get(self, url, headers=None):
+        # request a page, retrying connection errors, timeouts and temporary server errors
+        host = urlsplit(url).netloc
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.wait(host)
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries:
+                    raise
+                logger.warning("Request to %s failed (%s), retrying", url, e)
+            else:
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    response.raise_for_status()
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                logger.warning("Request to %s returned %d, retrying", url, response.status_code)
+            time.sleep(self._delay(attempt, retry_after))
+
+    def fetch(self, url):
+        """
+        Fetches a single page, failed requests are retried.
+        With a cache, unchanged pages are taken from the cache.
+
+        Args:
+            url: Url of the page.
+
+        Returns:
+            content: Raw content of the page.
+
+        Raises:
+            requests.RequestException: If the page could not be fetched after all retries.
+            CacheMiss: If the page is not cached in offline mode.
+        """
+        if self.cache is None:
+            return self._get(self.url(url)).content
+
+        # the cache is keyed by the transfermarkt url, so it is shared with the stand-in
+        entry = self.cache.get(url)
+        if self.offline:
+            if entry is None:
+                raise CacheMiss(url)
+            return self.cache.content(entry)
+        # the page of another end date is never reused without asking the server
+        if entry is not None and entry["url"] == url and self.cache.is_fresh(entry):
+            return self.cache.content(entry)
+
+        headers = self.cache.conditional_headers(entry) if entry is not None else None
+        response = self._get(self.url(url), headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(dict(entry, url=url), response.headers)
+            return self.cache.content(entry)
+        self.cache.put(url, response.content, response.headers)
+        return response.content
+
+    def fetch_many(self, urls):
+        """
+        Fetches several pages at the same time.
+
+        Args:
+            urls: Urls of the pages.
+
+        Returns:
+            contents: Raw content of the pages, in the order of the urls.
+        """
+        urls = list(urls)
+        if len(urls) <= 1 or self.max_workers <= 1:
+            return [self.fetch(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            return list(pool.map(self.fetch, urls))
+
+    def close(self):
+        """
+        Closes the connections of the session.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def next_page_url(container, url):
+    """
+    Returns the url of the next page of a paginated transfermarkt table.
+
+    Args:
+        container: Soup of the element containing the table and its pager.
+        url: Url of the current page.
+
+    Returns:
+        url: Absolute url of the next page, None on the last page.
+    """
+    link = container.find("a", title="Zur naechsten Seite")
+    if link is None or not link.get("href"):
+        return None
+    return urljoin(url, link["href"])
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_fetcher():
+    """
+    Returns the fetcher shared by all scrapers of the process.
+
+    The pages are cached in data/http_cache. If the environment variable SCRAPING_OFFLINE is set to 1,
+    pages are only replayed from the cache.
+
+    Returns:
+        fetcher: Shared Fetcher.
+    """
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Fetcher(cache=ResponseCache(), offline=os.environ.get("SCRAPING_OFFLINE") == "1")
+        return _default
@@ -0,0 +1,177 @@
+"""
+Incremental refresh of the scraped datasets.
+
+The watermark of a player is the newest season or date of the player in the stored dataset. A refresh
+only reads the pages reaching back to the watermark, where the scraper supports it (penalties and
+injuries are paginated, the other datasets are a single page per player). Rows from the watermark on
+are replaced by the scraped rows, older rows are kept as they are. A player without any scraped row from
+the watermark on, e.g. after an empty page, keeps the stored rows. The scraped rows are deduplicated on
+the natural key of the dataset, rows whose key is already stored are skipped, and the file is replaced
+atomically.
+
+The top scorer lists are rankings without players of their own and the achievements have no natural
+key (the same title can be won twice in a season), those are always scraped completely.
+
+Usage:
+    python -m scraping.incremental [dataset ...]
+"""
+import argparse
+import inspect
+import logging
+import os
+
+import pandas as pd
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.cube import season_start
+from scraping import club_goals, club_performances, injuries, international_performances, penalties
+from scraping.store import as_text, storeData
+
+logger = logging.getLogger(__name__)
+
+# dataset -> scraper module, natural key of a row, watermark column, True if the newest rows are stored first
+INCREMENTAL = {
+    # two goals in the same minute differ in the added time
+    "club_goals": (club_goals, ["player_name", "game_id", "goal_minute", "added_time"], "saison", False),
+    "club_performances": (club_performances, ["player_name", "saison", "competition", "club"], "saison", True),
+    "injuries": (injuries, ["player_name", "start_date", "injury_description"], "start_date", True),
+    "international_performances": (international_performances, ["player_name", "game_id"], "date", False),
+    "penalties": (penalties, ["player_name", "game_id", "minute"], "date", True),
+}
+
+
+def read_dataset(name, data_dir=DATA_DIR):
+    """
+    Reads a stored dataset without converting any value, so it is written back unchanged.
+
+    Args:
+        name: Name of the dataset.
+        data_dir: Folder of the datasets.
+
+    Returns:
+        df: Dataset with every value as string, None if it does not exist yet.
+    """
+    path = os.path.join(data_dir, DATASETS[name])
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def watermark_values(df, column):
+    """
+    Returns the values of the watermark column in a comparable form.
+
+    Args:
+        df: Dataset as text.
+        column: Watermark column, a season or a date.
+
+    Returns:
+        values: Start year of the season or date of every row.
+    """
+    if column == "saison":
+        return season_start(df[column])
+    return pd.to_datetime(df[column], errors="coerce")
+
+
+def watermarks(df, column):
+    """
+    Returns the watermark of every player of a dataset.
+
+    Args:
+        df: Dataset as text.
+        column: Watermark column.
+
+    Returns:
+        watermarks: Dictionary of player name and newest season or date of the player.
+    """
+    return watermark_values(df, column).groupby(df["player_name"], sort=False).max().to_dict()
+
+
+def merge(existing, scraped, keys, column, newest_first):
+    """
+    Merges scraped rows into a dataset.
+
+    Args:
+        existing: Stored dataset as text.
+        scraped: Scraped rows as text.
+        keys: Natural key of a row.
+        column: Watermark column.
+        newest_first: True if the newest rows of a player are stored first.
+
+    Returns:
+        df: Merged dataset.
+        counts: Dictionary with the number of kept, replaced and added rows.
+    """
+    missing = [c for c in existing.columns if c not in scraped.columns]
+    if missing:
+        raise ValueError(f"scraped rows lack the columns {missing}")
+    scraped = scraped[existing.columns]
+
+    marks = watermarks(existing, column)
+    scraped_marks = scraped["player_name"].map(marks)
+    incoming = scraped[scraped_marks.isna() | (watermark_values(scraped, column) >= scraped_marks)]
+    incoming = incoming.drop_duplicates(keys)
+
+    # the window of a player is only replaced if rows of the window were scraped for the player,
+    # an empty page or a missed table must not delete the stored rows
+    missed = [player_name for player_name in marks if player_name not in set(incoming["player_name"])]
+    if missed:
+        logger.warning("No rows scraped from the watermark on for %s, their stored rows are kept", ", ".join(missed))
+    in_window = ((watermark_values(existing, column) >= existing["player_name"].map(marks))
+                 & existing["player_name"].isin(incoming["player_name"]))
+    kept = existing[~in_window]
+    incoming = incoming[~pd.MultiIndex.from_frame(incoming[keys]).isin(pd.MultiIndex.from_frame(kept[keys]))]
+
+    # keep the players in their order, the new rows of a player go before or after the stored ones
+    frames = []
+    players = list(dict.fromkeys(list(existing["player_name"]) + list(incoming["player_name"])))
+    for player_name in players:
+        player_kept = kept[kept["player_name"] == player_name]
+        player_new = incoming[incoming["player_name"] == player_name]
+        frames += [player_new, player_kept] if newest_first else [player_kept, player_new]
+    df = pd.concat(frames, ignore_index=True)
+
+    counts = {"kept": len(kept), "replaced": int(in_window.sum()), "added": len(incoming)}
+    return df, counts
+
+
+def refresh(name, fetcher=None, data_dir=DATA_DIR):
+    """
+    Scrapes the new rows of a dataset and merges them into the stored file.
+
+    Args:
+        name: Name of the dataset, see INCREMENTAL.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+        data_dir: Folder of the datasets.
+
+    Returns:
+        counts: Dictionary with the number of kept, replaced, added and stored rows.
+    """
+    module, keys, column, newest_first = INCREMENTAL[name]
+    existing = read_dataset(name, data_dir)
+
+    kwargs = {"fetcher": fetcher}
+    if existing is not None and "since" in inspect.signature(module.scrape).parameters:
+        # paginated tables are only read back to the watermark
+        kwargs["since"] = watermarks(existing, column)
+    scraped = as_text(module.scrape(**kwargs))
+
+    if existing is None:
+        df, counts = scraped, {"kept": 0, "replaced": 0, "added": len(scraped)}
+    else:
+        df, counts = merge(existing, scraped, keys, column, newest_first)
+    storeData(df, DATASETS[name], data_dir)
+    counts["rows"] = len(df)
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrapes the new rows of the datasets and merges them into the stored files.")
+    parser.add_argument("datasets", nargs="*", help=f"datasets to refresh, all of {', '.join(INCREMENTAL)} if not given")
+    args = parser.parse_args()
+    unknown = [name for name in args.datasets if name not in INCREMENTAL]
+    if unknown:
+        parser.error(f"unknown datasets {unknown}")
+    for name in args.datasets or INCREMENTAL:
+        counts = refresh(name)
+        print(f"{name}: {counts['added']} rows added, {counts['replaced']} replaced, {counts['rows']} rows stored")
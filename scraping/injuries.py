@@ -0,0 +1,285 @@
+"""
+Scraper for the injuries of a player, see scripts/injuries_scraper.ipynb.
+
+The injury table is split into several pages. The pages are requested directly by following the
+links of the pager. Navigating the pages with selenium is kept as fallback, it needs Chrome and is
+only imported then.
+
+Usage:
+    python -m scraping.injuries [--browser]
+"""
+import argparse
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from scraping.fetch import default_fetcher, next_page_url
+from scraping.parse import page_soup
+from scraping.players import pages
+from scraping.store import combinePlayerData, storeData
+
+# injury page of every player
+PAGES = pages("injuries")
+
+FILENAME = "player_injuries.csv"
+
+
+def getInjuryTables(page, content, fetcher=None, since=None):
+    """
+    This function reads the injuries table from all pages, by following the pager of the table.
+
+    Args:
+        page: Url of the injury page.
+        content: Raw content of the injury page.
+        fetcher: Fetcher used to request the further pages, the shared fetcher if not given.
+        since: If given, no further pages are read once a table reaches back to this date.
+            The table lists the newest injuries first.
+
+    Returns:
+        injury_tables: Table of every page.
+    """
+    fetcher = fetcher or default_fetcher()
+    injury_tables = []
+    visited = {page}
+    while True:
+        # the table and the links of the pager
+        pageSoup = page_soup(content, ["table", "a"])
+        table = pageSoup.find_all("table")
+        injury_tables.append(table[0])
+        if since is not None and isOlderThan(table[0], since):
+            return injury_tables
+
+        # if there is no link to the next page, its the last page
+        page = next_page_url(pageSoup, page)
+        if page is None or page in visited:
+            return injury_tables
+        visited.add(page)
+        content = fetcher.fetch(page)
+
+
+def isOlderThan(table, date):
+    """
+    Checks if an injuries table contains an injury that started before a date.
+
+    Args:
+        table: Injury table.
+        date: Date to compare with.
+
+    Returns:
+        older: True if the oldest injury of the table started before the date.
+    """
+    dates = [pd.to_datetime(injury["start_date"], format="%d.%m.%Y") for injury in loadInjuryDataForPlayer(table)]
+    return len(dates) > 0 and min(dates) < date
+
+
+def getInjuryDataForPlayer(page, since=None):
+    """
+    This function opens a transfermarkt page and reads the data from an injuries table.
+    The table is split into multiple pages, which are clicked through using selenium.
+    Args:
+        page: Page contianing the injury data.
+        since: If given, no further pages are read once a table reaches back to this date.
+
+    Returns:
+        injury_table: List containing all rows from the injuries table for a player.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = webdriver.Chrome()
+    driver.get(page)
+    initial_source = driver.page_source
+
+    # check for correct iframe
+    iframes = driver.find_elements(By.TAG_NAME, "iframe")
+    print(f"Number of iframes found: {len(iframes)}")
+    driver.switch_to.frame(iframes[1])
+
+    # get cookies button and accept
+    try:
+        buttons = driver.find_elements(By.XPATH, "//button[@title='Zustimmen & weiter']")
+        # go through all buttons (should be only 1) and click
+        for button in buttons:
+            button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable(buttons[0])  # Assuming you want the first button
+            )
+            print("title Name:", button.get_attribute("title"))  # Prints the button's class
+            button.click()
+    except Exception as e:
+        print("Failed to click the button:", (e))
+
+
+    WebDriverWait(driver, 4)
+
+    # init data
+    injury_tables = []
+    notLastPage = True
+    while(notLastPage):
+        # get new source (i dont know but when this is removed the program does not work)
+        new_source  = driver.page_source
+        if initial_source != new_source:
+            print("Dynamic content was loaded.")
+
+        # load table using soup
+        html = new_source
+        pageSoup = BeautifulSoup(html, "html.parser")
+        table = pageSoup.find_all("table")
+        injury_tables.append(table[0])
+        if since is not None and isOlderThan(table[0], since):
+            return injury_tables
+        # try to get nexdt button and click
+        # if no button available, then its the last page
+        try:
+            elements = driver.find_elements(By.XPATH, "//a[@title='Zur naechsten Seite']")
+            print(f"Found {len(elements)} <a> tags.")
+            for e in elements:
+                e.click()
+            if (len(elements) == 0):
+                notLastPage = False
+        except:
+            # stop the loop
+            notLastPage = False
+
+        # needed for timing reasons
+        time.sleep(2)
+    return injury_tables
+
+
+def getInjuryRow(row):
+    """
+    This function reads the data from a single row of an injuries table.
+    Args:
+        row: Row of the injuries table.
+
+    Returns:
+        injury: Data representation of the row.
+    """
+    injury = {}
+
+    # get saison
+    saison_tag = row.find_next("td")
+    if saison_tag:
+        injury["saison"] = saison_tag.text.strip()
+
+    # get injury description
+    injury_tag = saison_tag.find_next()
+    if injury_tag:
+        # exclude running injuries
+        if (injury_tag.get("class", "No alt attribute found") != ['hauptlink', 'bg_rot_20']):
+            injury["injury_description"] = injury_tag.text.strip()
+
+    # get start date of injury
+    start_tag = injury_tag.find_next()
+    if start_tag:
+        injury["start_date"] = start_tag.text.strip()
+
+    # get end date of injury
+    end_tag = start_tag.find_next()
+    if end_tag:
+        injury["end_date"] = end_tag.text.strip()
+
+    # get day amount of injury
+    days_tag = end_tag.find_next()
+    if days_tag:
+        injury["days"] = int(days_tag.text.strip().replace(" Tage", ""))
+
+    # get amount of missed games
+    missed_games_tag = days_tag.find_next()
+    if missed_games_tag:
+        span_tag = missed_games_tag.find("span")
+        if (span_tag == None): # span could not exist
+            injury["missed_games"] = missed_games_tag.text.strip()
+        else:
+            injury["missed_games"] = span_tag.text.strip()
+    if (injury["missed_games"] == "-"):
+        injury["missed_games"] = 0
+    else:
+        injury["missed_games"] = int(injury["missed_games"])
+
+    return injury
+
+
+def loadInjuryDataForPlayer(table):
+    """
+    Lodas the injury data from the table into a list.
+    Args:
+        table: Injury table.
+
+    Returns:
+        injury: complete list of Data representation of the table.
+    """
+    rows = table.find_all("tr")
+    injury_data = []
+    for i in range(1,len(rows)):
+        # exclude currently ongoing injuries
+        if (rows[i].find(class_="bg_rot_20")):
+            continue
+        injury_row = getInjuryRow(rows[i])
+        injury_data.append(injury_row)
+    return injury_data
+
+
+def createDataFrameForTables(tables):
+    """
+    Creates a dataframe from the injury table data.
+    Args:
+        tables: list of table data.
+
+    Returns:
+        df: dataframe of the data.
+    """
+    rows = []
+    for table in tables:
+        data = loadInjuryDataForPlayer(table)
+        for injury in data:
+            df_row = {
+                    'saison': injury['saison'],
+                    'injury_description': injury['injury_description'],
+                    'start_date': injury['start_date'],
+                    'end_date': injury['end_date'],
+                    'days': injury['days'],
+                    'missed_games': injury['missed_games']
+                }
+            rows.append(df_row)
+
+    df = pd.DataFrame(rows)
+    df["start_date"] = pd.to_datetime(df["start_date"], format="%d.%m.%Y")
+    df["end_date"] = pd.to_datetime(df["end_date"], format="%d.%m.%Y")
+    return df
+
+
+def scrape(pages=PAGES, fetcher=None, browser=False, since=None):
+    """
+    Scrapes the injuries of all players.
+
+    Args:
+        pages: Dictionary of player name and url of the injury page.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+        browser: If True, the pages are navigated with selenium instead.
+        since: Dictionary of player name and date, only the pages reaching back to the date are read.
+
+    Returns:
+        df: Dataframe of the injuries of all players.
+    """
+    if browser:
+        return combinePlayerData({
+            player_name: createDataFrameForTables(getInjuryDataForPlayer(page, (since or {}).get(player_name)))
+            for player_name, page in pages.items()
+        })
+
+    fetcher = fetcher or default_fetcher()
+    contents = fetcher.fetch_many(pages.values())
+    return combinePlayerData({
+        player_name: createDataFrameForTables(getInjuryTables(page, content, fetcher, (since or {}).get(player_name)))
+        for (player_name, page), content in zip(pages.items(), contents)
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrapes the injuries of all players.")
+    parser.add_argument("--browser", action="store_true", help="navigate the pages with selenium")
+    args = parser.parse_args()
+    storeData(scrape(browser=args.browser), FILENAME)
@@ -0,0 +1,335 @@
+"""
+Scraper for the international games of a player, see scripts/international_performance_scraper.ipynb.
+
+Usage:
+    python -m scraping.international_performances
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup, parse_many
+from scraping.players import international_players
+from scraping.store import combinePlayerData, storeData
+
+# page of the international games, national team and club history of every registered player.
+# transfermarkt has some missing current club data for some of the seasons of a players career,
+# which are filled using the club history.
+PLAYERS = international_players()
+
+FILENAME = "player_international_performance.csv"
+
+
+def getGameData(table_row, home_team):
+    """
+    this function takes a row from the seasons and competitions played and fetches all relevant game performance data.
+    home_team is used to check what team the player plays for, because the players team can be on the left or right side of the scoreboard.
+
+    Args:
+        table_row: Row containing data for a season in a single competition
+        home_team: Value indicating what team the player plays for.
+
+    Returns:
+        game_data: Scraped data from the row.
+    """
+    game_data = { }
+
+    # get gameday if there is one
+    gameday_tag = table_row.find_next(class_="zentriert")
+    if (gameday_tag):
+        game_data["gameday"] = gameday_tag.text.strip()
+        if (len(game_data["gameday"]) == 0):
+            game_data["gameday"] = None
+
+    # get club where player played during that time.
+    club_tag = gameday_tag.find_next(class_="zentriert")
+    if (club_tag):
+        game_data["player_current_club"] = club_tag.find_next("a").get("title", "No title available")
+
+    # get venue country and city, where game was played
+    venue_tag = club_tag.find_next("td")
+    if (venue_tag):
+        game_data["venue_country"] = venue_tag.find_next("img").get("title", "No country name available")
+        game_data["venue_city"] = venue_tag.text.strip()
+
+    # get date of game played
+    date_tag = venue_tag.find_next(class_="zentriert")
+    if (date_tag):
+        game_data["date"] = date_tag.text.strip()
+
+    # get home team during game
+    home_team_tag = date_tag.find_next(class_="zentriert")
+    if (home_team_tag):
+        game_data["home_team"] = home_team_tag.find_next("img").get("title", "No country name available")
+
+
+    # get guest team during game
+    guest_team_tag = home_team_tag.find_next(class_="zentriert")
+    if (guest_team_tag):
+        game_data["guest_team"] = guest_team_tag.find_next("img").get("title", "No country name available")
+
+    # if guest team is the players home team
+    if game_data["guest_team"]  == home_team:
+        game_data["opponent"] = game_data["home_team"]
+        game_data["team"] = game_data["guest_team"]
+        game_data["venue"] = "A"
+    else:
+        game_data["opponent"] = game_data["guest_team"]
+        game_data["team"] = game_data["home_team"]
+        game_data["venue"] = "H"
+
+    # get result and game id
+    result_tag = guest_team_tag.find_next(class_="zentriert")
+    if (result_tag):
+        game_data["game_id"] = result_tag.find_next("a").get("id", "No game id available")
+        result_span = result_tag.find_next("span")
+        #  if team won
+        if result_span.get("class", "no class available") == ['greentext']:
+            scoreboard = result_span.text.split()
+            x, y = map(int, scoreboard[0].split(":"))
+            if x < y:
+                 x, y = y, x
+
+            game_data["result"] = str(x) + ":" + str(y)
+            if len(scoreboard) > 1:
+                game_data["result"] = game_data["result"] + " " + scoreboard[1]
+        # if team lost
+        elif result_span.get("class", "no class available") == ['redtext']:
+            scoreboard = result_span.text.split()
+            x, y = map(int, scoreboard[0].split(":"))
+            if x > y:
+                x, y = y, x
+
+            game_data["result"] = str(x) + ":" + str(y)
+            if len(scoreboard) > 1:
+                game_data["result"] = game_data["result"] + " " + scoreboard[1]
+        # if game is a tie, just save
+        else:
+            game_data["result"] = result_span.text.split()[0]
+
+    # get player position during game
+    position_tag = result_tag.find_next(class_="zentriert")
+    if (position_tag):
+        game_data["player_position"] = position_tag.find_next("a").text.strip()
+
+    # get goal amounts in single game
+    goal_tag = position_tag.find_next(class_="zentriert")
+    if (goal_tag):
+        goal_amount = goal_tag.text.strip()
+        if (len(goal_amount) == 0):
+            game_data["goals"] = 0
+        else:
+            game_data["goals"] = int(goal_amount)
+
+    # get all assists per game
+    assists_tag = goal_tag.find_next(class_="zentriert")
+    if (assists_tag):
+        assists_amount = assists_tag.text.strip()
+        if (len(assists_amount) == 0):
+            game_data["assists_amount"] = 0
+        else:
+            game_data["assists_amount"] = int(assists_amount)
+
+    # get all own goals per game
+    own_goal_tag = assists_tag.find_next(class_="zentriert")
+    if (own_goal_tag):
+        own_goal_amount = own_goal_tag.text.strip()
+        if (len(own_goal_tag) == 0):
+            game_data["own_goals_amount"] = 0
+        else:
+            game_data["own_goals_amount"] = int(own_goal_amount)
+
+
+    # get yellow card if there was one given
+    yellow_card_tag = own_goal_tag.find_next(class_="zentriert")
+    if (yellow_card_tag):
+        yellow_card_text = yellow_card_tag.text.strip()
+        if (len(yellow_card_text) == 0):
+            game_data["yellow_card"] = None
+        else:
+            game_data["yellow_card"] = yellow_card_text
+
+    # get yellow red card if there was one given
+    yellow_red_card_tag = yellow_card_tag.find_next(class_="zentriert")
+    if (yellow_red_card_tag):
+        yellow_red_card_text = yellow_red_card_tag.text.strip()
+        if (len(yellow_red_card_text) == 0):
+            game_data["yellow_red_card"] = None
+        else:
+            game_data["yellow_red_card"] = yellow_red_card_text
+
+    # get red card if there was one given
+    red_card_tag = yellow_red_card_tag.find_next(class_="zentriert")
+    if (red_card_tag):
+        red_card_text = red_card_tag.text.strip()
+        if (len(red_card_text) == 0):
+            game_data["red_card"] = None
+        else:
+            game_data["red_card"] = red_card_text
+
+    # get substitution in
+    subst_in_tag = red_card_tag.find_next("td", class_="zentriert")
+    if (subst_in_tag):
+        game_data["substitute_in"] = subst_in_tag.text.strip()
+        if game_data["substitute_in"] == "":
+            game_data["substitute_in"] = None
+
+    # get substitution out
+    subst_out_tag = subst_in_tag.find_next("td", class_="zentriert")
+    if (subst_out_tag):
+        game_data["substitute_out"] = subst_out_tag.text.strip()
+        if game_data["substitute_out"] == "":
+            game_data["substitute_out"] = None
+
+    min_played_tag = subst_out_tag.find_next("td")
+    if (min_played_tag):
+        game_data["minutes_played"] = min_played_tag.text.strip()
+        if game_data["minutes_played"] == "":
+            game_data["minutes_played"] = 0
+    else:
+        print(game_data["game_id"])
+
+    return game_data
+
+
+def parseInternationalGames(content, home_team):
+    """
+    This function reads the international peformance data from a tranfermarkt page.
+    Args:
+        content: Raw content of the page containing the international performance data.
+        home_team: Home team string of the player.
+
+    Returns:
+        gamesList: List of games played by competition and season with additional stats.
+    """
+    pageSoup = page_soup(content, "table")
+
+    gamesList = []
+
+    table = pageSoup.find_all("table", class_=False)
+    table_data = table[1]
+    data = table_data.find_all("tr")
+    del data[0] # Remove unwanted item from table row list. first tr is outside of the actual table.
+
+    current_tournament = None
+
+    for i in range(len(data)):
+        table_row = data[i]
+        # check if current row is tournament name and not game played.
+        if ['zentriert', 'hauptlink', 'no-border-rechts'] == table_row.find_next("td").get('class'):
+            img_tag = table_row.find_next("img")
+            current_tournament = img_tag.get("title")
+        elif (table_row.get("class") == []):
+            # in this case, a row is a game played.
+            game = getGameData(table_row, home_team)
+            game["tournament"] = current_tournament
+            gamesList.append(game)
+
+    return gamesList
+
+
+def getAllInternationalGames(page, home_team, fetcher=None):
+    """
+    This function scarpes a tranfermarkt page for international peformance data.
+    Args:
+        page: Row containing the international performance data.
+        home_team: Home team string of the player.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        gamesList: List of games played by competition and season with additional stats.
+    """
+    return parseInternationalGames((fetcher or default_fetcher()).fetch(page), home_team)
+
+
+def fillMissingClubInfo(gameList, timespans):
+    """
+    Fills missing club data.
+    Args:
+        gamesList: List containing international performances
+        timespans: List of timespans for a players career at each club.
+
+    gameList:
+        df: corrected data.
+    """
+    for game in gameList:
+        if (game["player_current_club"] == "UnbekanntUnbekannt"):
+            date = datetime.strptime(game["date"], "%d.%m.%Y")
+            for timespan in timespans:
+                start_date = datetime.strptime(timespan[0], "%d.%m.%Y")
+                end_date = datetime.strptime(timespan[1], "%d.%m.%Y")
+                if (date >= start_date and date < end_date):
+                    game["player_current_club"] = timespan[2]
+
+
+def createDataFrameFromGames(gamesList):
+    """
+    Creates a dataframe using the specified data structure for each international game played by the player.
+    Args:
+        gamesList: List containing international performances
+
+    Returns:
+        df: resulting dataframe
+    """
+    # store goals list in dataframe
+    rows = []
+    for game in gamesList:
+        row = {
+            'game_id': game["game_id"],
+            'player_current_club': game['player_current_club'],
+            'tournament': game['tournament'],
+            'gameday': game['gameday'],
+            'venue_country': game['venue_country'],
+            'venue_city': game['venue_city'],
+            'venue': game['venue'],
+            'date': game['date'],
+            'team': game['team'],
+            'opponent': game['opponent'],
+            'result': game['result'],
+            'player_position': game['player_position'],
+            'goals': game['goals'],
+            'assists_amount': game['assists_amount'],
+            'own_goals_amount': game['own_goals_amount'],
+            'substitute_in': game['substitute_in'],
+            'substitute_out': game['substitute_out'],
+            'yellow_card': game['yellow_card'],
+            'yellow_red_card': game['yellow_red_card'],
+            'red_card': game['red_card'],
+            'minutes_played': game['minutes_played']
+        }
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    df["date"] = pd.to_datetime(df["date"], format="%d.%m.%Y")
+    df["goals"] = df["goals"].astype(int)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(players=PLAYERS, fetcher=None):
+    """
+    Scrapes the international games of all players.
+
+    Args:
+        players: Dictionary of player name and page, national team and club history of the player.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the international games of all players.
+    """
+    contents = (fetcher or default_fetcher()).fetch_many(player["page"] for player in players.values())
+    parsed = parse_many(parseInternationalGames, contents, [player["team"] for player in players.values()])
+    dataframes = {}
+    for (player_name, player), games in zip(players.items(), parsed):
+        fillMissingClubInfo(games, player["club_timespans"])
+        dataframes[player_name] = createDataFrameFromGames(games)
+    df = combinePlayerData(dataframes)
+
+    # Remove year from competition names
+    df['tournament'] = df['tournament'].str.replace(r'\b\d{4}\b', '', regex=True).str.strip()
+    return df
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
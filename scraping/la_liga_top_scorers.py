@@ -0,0 +1,142 @@
+"""
+Scraper for the all time top scorers of la liga, see scripts/la_liga_top_scorer_scraper.ipynb.
+
+Usage:
+    python -m scraping.la_liga_top_scorers
+"""
+import pandas as pd
+from bs4 import SoupStrainer
+
+from scraping.fetch import default_fetcher
+from scraping.parse import page_soup
+from scraping.store import storeData
+
+PAGE = "https://www.transfermarkt.at/laliga/ewigetorschuetzen/wettbewerb/ES1"
+
+FILENAME = "laliga_top_scorer.csv"
+
+
+def getRowData(row):
+    """
+    This function parses the data from a single row of the la liga top scorer table.
+
+    Args:
+        row: Table row
+
+    Returns:
+        player: Information about the player in the la liga top scorer list.
+    """
+    player = {}
+
+    #get player name
+    name_tag = row.find_next("a")
+    if (name_tag):
+        player["name"] = name_tag.get("title", "No title available")
+
+
+    club_tag = name_tag.find_next("a") # only used to find next tag
+
+    # get appearances
+    appearance_tag = club_tag.find_next("a")
+    if (appearance_tag):
+        player["appearances"] = int(appearance_tag.text.strip())
+
+    # get minutes played
+    minutes_tag = appearance_tag.find_next("td")
+    if (minutes_tag):
+        minutes = minutes_tag.text.strip().replace(".", "")
+        player["minutes_played"] = int(minutes)
+
+    # get goal amount
+    minutes_per_goal_tag = minutes_tag.find_next("td")
+    if (not minutes_per_goal_tag):
+        return
+    goals_tag = minutes_per_goal_tag.find_next("td")
+    if (goals_tag):
+        player["goals"] = int(goals_tag.text.strip())
+
+    return player
+
+
+def parseTopPlayers(content):
+    """
+    This function reads the rows of the top scorer table.
+
+    Args:
+        content: Raw content of the top scorer page.
+
+    Returns:
+        top_players: Information about the top scoring players.
+    """
+    pageSoup = page_soup(content, SoupStrainer("table", class_="items"))
+    top_players = []
+    table = pageSoup.find("table", class_="items")
+    if not table:
+        return None
+    tbody = table.find_next("tbody")
+    if not tbody:
+        return None
+
+    rows = tbody.contents
+
+    for row in rows[1::2]:  # No iterations because the slice is empty
+        player = getRowData(row)
+        top_players.append(player)
+
+    return top_players
+
+
+def getTopPlayers(page=PAGE, fetcher=None):
+    """
+    This function scrapes the table data from the la liga top screres page of transfermarkt.
+
+    Args:
+        page: Url of the top scorer page.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        top_players: Information about the top scoring players in la liga.
+    """
+    return parseTopPlayers((fetcher or default_fetcher()).fetch(page))
+
+
+def createDataframe(list):
+    """
+    Creates a dataframe from the la ligas top scrorer list.
+    Args:
+        gamesList: List representing the top scorers of la liga.
+
+    Returns:
+        df: dataframe containing the data.
+    """
+    rows = []
+    for player in list:
+        row = {
+            'name': player['name'],
+            'appearances': player['appearances'],
+            'minutes_played': player['minutes_played'],
+            'goals': player['goals']
+        }
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    print("Dataframes successfully created.")
+    return df
+
+
+def scrape(page=PAGE, fetcher=None):
+    """
+    Scrapes the top scorer table.
+
+    Args:
+        page: Url of the top scorer page.
+        fetcher: Fetcher used to request the page, the shared fetcher if not given.
+
+    Returns:
+        df: Dataframe of the top scorers.
+    """
+    return createDataframe(getTopPlayers(page, fetcher))
+
+
+if __name__ == "__main__":
+    storeData(scrape(), FILENAME)
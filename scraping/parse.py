@@ -0,0 +1,82 @@
+"""
+Shared parsing layer for the transfermarkt scrapers.
+
+Pages are parsed with lxml if it is installed, which is several times faster than the html.parser of the
+standard library and gives the same tree for the transfermarkt pages. Every parser only builds the
+elements it reads (the tables, their headlines or the boxes around them), the navigation, scripts and
+teasers making up most of a page are skipped while parsing.
+
+Parsing is cpu bound, so the pages fetched by the threads of the Fetcher are parsed in a pool of
+processes, one page per task.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# if False, pages are parsed completely, the parse_only argument of page_soup() is ignored
+RESTRICT = True
+
+# number of processes used by parse_many(), all cores if not set
+PROCESSES = int(os.environ["SCRAPING_PROCESSES"]) if os.environ.get("SCRAPING_PROCESSES") else None
+
+
+def configure(parser=None, restrict=None):
+    """
+    Sets the parser and whether parsing is restricted to the target elements, e.g. to compare with html.parser.
+
+    Args:
+        parser: Name of the parser used by BeautifulSoup, kept if not given.
+        restrict: If False, pages are parsed completely, kept if not given.
+    """
+    global PARSER, RESTRICT
+    if parser is not None:
+        PARSER = parser
+    if restrict is not None:
+        RESTRICT = restrict
+
+
+def page_soup(content, parse_only=None):
+    """
+    Parses the content of a page.
+
+    Args:
+        content: Raw content of the page.
+        parse_only: Name, list of names or SoupStrainer of the elements that are built, all if not given.
+
+    Returns:
+        pageSoup: Soup of the page.
+    """
+    if parse_only is None or not RESTRICT:
+        return BeautifulSoup(content, PARSER)
+    if not isinstance(parse_only, SoupStrainer):
+        parse_only = SoupStrainer(parse_only)
+    return BeautifulSoup(content, PARSER, parse_only=parse_only)
+
+
+def parse_many(function, *iterables, processes=None):
+    """
+    Calls a parse function for every page in a pool of processes, like map().
+    A single page is parsed in the calling process.
+
+    Args:
+        function: Module level function parsing the content of a page, its result has to be picklable.
+        iterables: Contents of the pages and further arguments of the function.
+        processes: Number of processes, PROCESSES if not given.
+
+    Returns:
+        results: Result of the function for every page, in the order of the pages.
+    """
+    arguments = list(zip(*iterables))
+    processes = min(processes or PROCESSES or os.cpu_count() or 1, len(arguments))
+    if processes <= 1:
+        return [function(*args) for args in arguments]
+    # the workers get the settings of this process, also when they are not forked
+    with ProcessPoolExecutor(processes, initializer=configure, initargs=(PARSER, RESTRICT)) as pool:
+        return list(pool.map(function, *zip(*arguments)))
@@ -0,0 +1,447 @@
+"""
+Scraper for the successful and missed penalties of a player, see scripts/penalty_scraper.ipynb.
+
+The penalty page has a box with the successful and a box with the missed penalties, both tables
+are split into several pages. The pages are requested directly by following the links of the pager.
+Navigating the pages with selenium is kept as fallback, it needs Chrome and is only imported then.
+
+Usage:
+    python -m scraping.penalties [--browser]
+"""
+import argparse
+import time
+
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scraping.fetch import default_fetcher, next_page_url
+from scraping.parse import page_soup
+from scraping.players import pages
+from scraping.store import combinePlayerData, storeData
+
+# penalty page of every player
+PAGES = pages("penalties")
+
+FILENAME = "player_penalties.csv"
+
+
+def getPenaltyTables(page, content, box_index, fetcher=None, since=None):
+    """
+    Reads the tables of a penalty box from all pages, by following the pager of the box.
+
+    Args:
+        page: Url of the penalty page.
+        content: Raw content of the penalty page.
+        box_index: Index of the box, 0 for the successful and 1 for the missed penalties.
+        fetcher: Fetcher used to request the further pages, the shared fetcher if not given.
+        since: If given, no further pages are read once a table reaches back to this date.
+            The tables list the newest penalties first.
+
+    Returns:
+        penalty_tables: Table of every page.
+    """
+    fetcher = fetcher or default_fetcher()
+    penalty_tables = []
+    visited = {page}
+    while True:
+        pageSoup = page_soup(content, SoupStrainer("div", class_="box"))
+        boxes = pageSoup.find_all('div', class_='box')
+        if (len(boxes) != 2):
+            raise ValueError("invalid size for div amount")
+        # check if there is only one table, there should not be any more than that.
+        table = boxes[box_index].find_all("table", class_="items")
+        if (len(table) == 1):
+            penalty_tables.append(table[0])
+            if since is not None and isOlderThan(table[0], since):
+                return penalty_tables
+
+        # if there is no link to the next page, its the last page
+        page = next_page_url(boxes[box_index], page)
+        if page is None or page in visited:
+            return penalty_tables
+        visited.add(page)
+        content = fetcher.fetch(page)
+
+
+def isOlderThan(table, date):
+    """
+    Checks if a penalty table contains a penalty before a date.
+
+    Args:
+        table: Table containing the penalty data.
+        date: Date to compare with.
+
+    Returns:
+        older: True if the oldest penalty of the table is before the date.
+    """
+    dates = [pd.to_datetime(penalty["date"], format="%d.%m.%Y") for penalty in loadPenaltyDataForTable(table)]
+    return len(dates) > 0 and min(dates) < date
+
+
+def getSuccessfullPenaltyData(page, since=None):
+    """
+    Reads the data from the successfull penalty table of transfermarkt with selenium.
+    Args:
+        page: Page containing the successful penalty data.
+        since: If given, no further pages are read once a table reaches back to this date.
+
+    Returns:
+        penalty_table: Table data stored as an entry for each table row.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = webdriver.Chrome()
+    driver.get(page)
+    initial_source = driver.page_source
+
+    # check for correct iframe
+    iframes = driver.find_elements(By.TAG_NAME, "iframe")
+    print(f"Number of iframes found: {len(iframes)}")
+    driver.switch_to.frame(iframes[1])
+
+    # get cookies button and accept
+    try:
+        buttons = driver.find_elements(By.XPATH, "//button[@title='Zustimmen & weiter']")
+        # go through all buttons (should be only 1) and click
+        for button in buttons:
+            button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable(buttons[0])  # Assuming you want the first button
+            )
+            print("title Name:", button.get_attribute("title"))  # Prints the button's class
+            button.click()
+    except Exception as e:
+        print("Failed to click the button:", (e))
+
+
+    WebDriverWait(driver, 4)
+
+    # init data
+    penalty_tables = []
+    notLastPage = True
+    count = 0
+    while(notLastPage):
+        print(f"count: {count}")
+        # get new source (i dont know but when this is removed the program does not work)
+        new_source  = driver.page_source
+        if initial_source != new_source:
+            print("Dynamic content was loaded.")
+
+        # load table using soup
+        html = new_source
+        pageSoup = BeautifulSoup(html, "html.parser")
+        # get successfull penaltie area to find table in it.
+        boxes = pageSoup.find_all('div', class_='box')
+        # get first table within successfull penalty box div
+        table = boxes[0].find_all("table", class_="items")
+        print(f"len table: {len(table)}")
+        # check if there is only one table, there should not be any more than that.
+        if (len(table) == 1):
+            penalty_tables.append(table[0])
+            if since is not None and isOlderThan(table[0], since):
+                return penalty_tables
+        # try to get next button and click
+        # if no button available, then its the last page
+        try:
+            elements = driver.find_elements(By.XPATH, "//div[@class='box'][1]//a[@title='Zur naechsten Seite']")
+            print(f"Found {len(elements)} <a> tags.")
+            elements[0].click()
+        except:
+            # stop the loop
+            notLastPage = False
+
+    # needed for timing reasons
+        time.sleep(4)
+        count = count + 1
+    return penalty_tables
+
+
+def geMissedPenaltyData(page, since=None):
+    """
+    Reads the data from the missed penalty table of transfermarkt with selenium.
+    Args:
+        page: Page containing the missed penalty data.
+        since: If given, no further pages are read once a table reaches back to this date.
+
+    Returns:
+        penalty_table: Table data stored as an entry for each table row.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    driver = webdriver.Chrome()
+    driver.get(page)
+    initial_source = driver.page_source
+
+    # check for correct iframe
+    iframes = driver.find_elements(By.TAG_NAME, "iframe")
+    print(f"Number of iframes found: {len(iframes)}")
+    driver.switch_to.frame(iframes[1])
+
+    # get cookies button and accept
+    try:
+        buttons = driver.find_elements(By.XPATH, "//button[@title='Zustimmen & weiter']")
+        # go through all buttons (should be only 1) and click
+        for button in buttons:
+            button = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable(buttons[0])  # Assuming you want the first button
+            )
+            print("title Name:", button.get_attribute("title"))  # Prints the button's class
+            button.click()
+    except Exception as e:
+        print("Failed to click the button:", (e))
+
+
+    WebDriverWait(driver, 4)
+
+    # init data
+    penalty_tables = []
+    notLastPage = True
+    count = 0
+    while(notLastPage):
+        print(f"count: {count}")
+        # get new source (i dont know but when this is removed the program does not work)
+        new_source  = driver.page_source
+        if initial_source != new_source:
+            print("Dynamic content was loaded.")
+
+        # load table using soup
+        html = new_source
+        pageSoup = BeautifulSoup(html, "html.parser")
+        # get missed penaltie area to find table in it.
+        boxes = pageSoup.find_all('div', class_='box')
+        if (len(boxes) != 2):
+            raise ValueError("invalid size for div amount")
+        # get first table within missed penalty box div
+        table = boxes[1].find_all("table", class_="items")
+        print(f"len table: {len(table)}")
+        # check if there is only one table, there should not be any more than that.
+        if (len(table) == 1):
+            penalty_tables.append(table[0])
+            if since is not None and isOlderThan(table[0], since):
+                return penalty_tables
+        # try to get next button and click
+        # if no button available, then its the last page
+        try:
+            elements = driver.find_elements(By.XPATH, "//div[@class='box'][2]//a[@title='Zur naechsten Seite']")
+            print(f"Found {len(elements)} <a> tags.")
+            elements[0].click()
+        except:
+            # stop the loop
+            notLastPage = False
+
+    # needed for timing reasons
+        time.sleep(4)
+        count = count + 1
+    return penalty_tables
+
+
+def getPenaltyRow(row):
+    """
+    Reads the penalty data for a single row of the transfermarkt page.
+    Args:
+        row: Row containing the penalty data.
+
+    Returns:
+        penalty: Data representation of the penalty.
+    """
+    penalty = {}
+
+    # get saison
+    saison_tag = row.find_next("td")
+    if saison_tag:
+        penalty["saison"] = saison_tag.text.strip()
+
+    # get competition description
+    competition_tag = saison_tag.find_next()
+    if competition_tag:
+        penalty["competition"] = competition_tag.text.strip()
+
+    # get team of player who took penalty
+    team_tag = competition_tag.find_next("td").find_next("a")
+    if team_tag:
+        penalty["team"] = team_tag.get("title", "no title available")
+        img = team_tag.find_next("img")
+        if (img):
+            img_class = img.get("class", "no class available")
+            if (img_class == ["flaggenrahmen"]):
+                penalty["competition_type"] = "International"
+            else:
+                penalty["competition_type"] = "Club"
+
+    # get date of game
+    date_tag = team_tag.find_next("td")
+    if date_tag:
+        penalty["date"] = date_tag.text.strip()
+
+    # get home team during game
+    home_team_tag = date_tag.find_next("td")
+    home_team = ""
+    if (home_team_tag):
+        home_team = home_team_tag.find_next("a").get("title", "no title available")
+    penalty["home"] = home_team
+
+    # get final result of game
+    result_tag = home_team_tag.find_next("td")
+    if result_tag:
+        penalty["result"] = result_tag.text.strip()
+        game_id_tag = result_tag.find_next("a")
+        if (game_id_tag):
+            penalty["game_id"] = game_id_tag.get("id", "no id available")
+
+    # get away team of game
+    away_team_tag = result_tag.find_next("td").find_next("a")
+    away_team = ""
+    if (away_team_tag):
+        away_team = away_team_tag.get("title", "no title available")
+    penalty["away"] = away_team
+
+    # if team is away team, swap scoreboard
+    if penalty["away"] == penalty["team"]:
+        penalty["opponent"] = penalty["home"]
+        x, y = map(int, penalty["result"].split(":"))
+        x, y = y, x
+        penalty["result"] = str(x) + ":" + str(y)
+    else:
+        penalty["opponent"] = penalty["away"]
+
+    # get minute of scored penalty
+    minute_tag = away_team_tag.find_next("td")
+    if minute_tag:
+        penalty["minute"] = minute_tag.text.strip()
+
+    # get score during after penalty
+    score_tag = minute_tag.find_next("td")
+    if score_tag:
+        penalty["score"] = score_tag.text.strip()
+
+    # if team is away team, swap current score
+    if penalty["away"] == penalty["team"]:
+        x, y = map(int, penalty["score"].split(":"))
+        x, y = y, x
+        penalty["score"] = str(x) + ":" + str(y)
+
+    # get goalkeeper who opposed penalty taker
+    goalkeeper_tag = score_tag.find_next("td")
+    if goalkeeper_tag:
+        penalty["goalkeeper"] = goalkeeper_tag.text.strip()
+
+    return penalty
+
+
+def loadPenaltyDataForTable(table):
+    """
+    Reads the penalty data for the whole penalty table.
+    Args:
+        table: Table containing the penalty data.
+
+    Returns:
+        penalty_data: Data representation of all penalties.
+    """
+    rows = table.find_all("tr")
+    penalty_data = []
+    for i in range(1,len(rows)):
+        penalty_row = getPenaltyRow(rows[i])
+        penalty_data.append(penalty_row)
+    return penalty_data
+
+
+def createPenaltyDataFrameForTables(tables_success, tables_missed):
+    """
+    Creates a dataframe for the successful and missed penalty data.
+    Args:
+        tables_success: Successful penalty data.
+        tables_missed: Missed penalty data.
+
+    Returns:
+        df: Dataframe containing the penalty data.
+    """
+    rows = []
+    for table in tables_success:
+        data = loadPenaltyDataForTable(table)
+        for penalty in data:
+            df_row = {
+                    'game_id': penalty['game_id'],
+                    'saison': penalty['saison'],
+                    'competition_type': penalty['competition_type'],
+                    'competition': penalty['competition'],
+                    'team': penalty['team'],
+                    'opponent': penalty['opponent'],
+                    'date': penalty['date'],
+                    'result': penalty['result'],
+                    'minute': penalty['minute'],
+                    'score': penalty['score'],
+                    'goalkeeper': penalty['goalkeeper'],
+                    'has_scored': True
+                }
+            rows.append(df_row)
+
+    for table in tables_missed:
+        data = loadPenaltyDataForTable(table)
+        for penalty in data:
+            df_row = {
+                    'game_id': penalty['game_id'],
+                    'saison': penalty['saison'],
+                    'competition_type': penalty['competition_type'],
+                    'competition': penalty['competition'],
+                    'team': penalty['team'],
+                    'opponent': penalty['opponent'],
+                    'date': penalty['date'],
+                    'result': penalty['result'],
+                    'minute': penalty['minute'],
+                    'score': penalty['score'],
+                    'goalkeeper': penalty['goalkeeper'],
+                    'has_scored': False
+                }
+            rows.append(df_row)
+
+    df = pd.DataFrame(rows)
+    df["date"] = pd.to_datetime(df["date"], format="%d.%m.%Y")
+    df = df.sort_values(by='date', ascending=False)
+    return df
+
+
+def scrape(pages=PAGES, fetcher=None, browser=False, since=None):
+    """
+    Scrapes the penalties of all players.
+
+    Args:
+        pages: Dictionary of player name and url of the penalty page.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+        browser: If True, the pages are navigated with selenium instead.
+        since: Dictionary of player name and date, only the pages reaching back to the date are read.
+
+    Returns:
+        df: Dataframe of the penalties of all players.
+    """
+    dataframes = {}
+    if browser:
+        for player_name, page in pages.items():
+            date = (since or {}).get(player_name)
+            dataframes[player_name] = createPenaltyDataFrameForTables(
+                getSuccessfullPenaltyData(page, date), geMissedPenaltyData(page, date)
+            )
+    else:
+        fetcher = fetcher or default_fetcher()
+        contents = fetcher.fetch_many(pages.values())
+        for (player_name, page), content in zip(pages.items(), contents):
+            date = (since or {}).get(player_name)
+            dataframes[player_name] = createPenaltyDataFrameForTables(
+                getPenaltyTables(page, content, 0, fetcher, date), getPenaltyTables(page, content, 1, fetcher, date)
+            )
+    df = combinePlayerData(dataframes)
+
+    # Remove year from competition names
+    df['competition'] = df['competition'].str.replace(r'\b\d{4}\b', '', regex=True).str.strip()
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrapes the penalties of all players.")
+    parser.add_argument("--browser", action="store_true", help="navigate the pages with selenium")
+    args = parser.parse_args()
+    storeData(scrape(browser=args.browser), FILENAME)
@@ -0,0 +1,108 @@
+"""
+Registry of the players that are scraped, stored in scraping/players.json.
+
+Every player has a name (as used in the datasets), the slug and id of the player on transfermarkt,
+the national team with its transfermarkt id and the start of the career. The club history is optional,
+it fills the club of international games that transfermarkt does not know. The urls of all pages of a
+player are built from the registry, so a player is added by adding an entry to the json file.
+"""
+import json
+import os
+from datetime import date
+
+REGISTRY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "players.json")
+
+BASE_URL = "https://www.transfermarkt.at"
+
+# last day of the international games, today if not set. SCRAPE_UNTIL=2024-12-26 fixes it for a
+# reproducible build of a past data date; the cache of scraping/cache.py ignores the day in the url.
+UNTIL = date.fromisoformat(os.environ["SCRAPE_UNTIL"]) if os.environ.get("SCRAPE_UNTIL") else None
+
+# dataset -> path of the page of a player, filled with the fields of the registry entry
+PAGE_PATHS = {
+    "achievements": "/{slug}/erfolge/spieler/{transfermarkt_id}",
+    "club_goals": "/{slug}/alletore/spieler/{transfermarkt_id}",
+    "club_performances": "/{slug}/detaillierteleistungsdaten/spieler/{transfermarkt_id}/plus/1",
+    "injuries": "/{slug}/verletzungen/spieler/{transfermarkt_id}/plus/1",
+    # only games the player played in, from the start of the career until UNTIL or today
+    "international_performances": "/{slug}/nationalmannschaft/spieler/{transfermarkt_id}/verein_id/{national_team_id}"
+                                  "/hauptwettbewerb//wettbewerb_id//start/{career_start}/ende/{until}/nurEinsatz/1/plus/1",
+    "penalties": "/{slug}/elfmetertore/spieler/{transfermarkt_id}/saison_id//wettbewerb_id//plus/1#tore",
+}
+
+FIELDS = ["name", "slug", "transfermarkt_id", "national_team", "national_team_id", "career_start"]
+
+
+def load_players(path=REGISTRY):
+    """
+    Reads the player registry.
+
+    Args:
+        path: Path of the registry file.
+
+    Returns:
+        players: Dictionary of player name and registry entry, in the order of the file.
+    """
+    with open(path, encoding="utf-8") as file:
+        entries = json.load(file)
+    players = {}
+    for entry in entries:
+        missing = [field for field in FIELDS if field not in entry]
+        if missing:
+            raise ValueError(f"registry entry {entry.get('name', entry)} lacks the fields {missing}")
+        if entry["name"] in players:
+            raise ValueError(f"player {entry['name']} is registered twice")
+        date.fromisoformat(entry["career_start"])
+        players[entry["name"]] = {"club_timespans": [], **entry}
+    return players
+
+
+def player_page(player, dataset, until=None):
+    """
+    Returns the url of the page of a player for a dataset.
+
+    Args:
+        player: Registry entry of the player.
+        dataset: Name of the dataset, see PAGE_PATHS.
+        until: Last day of the international games, UNTIL or today if not given.
+
+    Returns:
+        url: Url of the page.
+    """
+    return BASE_URL + PAGE_PATHS[dataset].format(until=(until or UNTIL or date.today()).isoformat(), **player)
+
+
+def pages(dataset, players=None):
+    """
+    Returns the page of every registered player for a dataset.
+
+    Args:
+        dataset: Name of the dataset, see PAGE_PATHS.
+        players: Registry entries, the registry file if not given.
+
+    Returns:
+        pages: Dictionary of player name and url of the page.
+    """
+    players = load_players() if players is None else players
+    return {name: player_page(player, dataset) for name, player in players.items()}
+
+
+def international_players(players=None):
+    """
+    Returns the arguments of the international games scraper for every registered player.
+
+    Args:
+        players: Registry entries, the registry file if not given.
+
+    Returns:
+        players: Dictionary of player name and page, national team and club history of the player.
+    """
+    players = load_players() if players is None else players
+    return {
+        name: {
+            "page": player_page(player, "international_performances"),
+            "team": player["national_team"],
+            "club_timespans": [tuple(timespan) for timespan in player["club_timespans"]],
+        }
+        for name, player in players.items()
+    }
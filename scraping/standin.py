@@ -0,0 +1,155 @@
+"""
+Local HTTP stand-in for transfermarkt, serving saved pages from a fixture folder.
+
+Every page is stored as a file named after the path and query of its url, see fixture_name().
+The scrapers run offline against the stand-in by passing Fetcher(base_url=server.base_url).
+
+Usage:
+    python -m scraping.standin <fixture folder> [--port 8000] [--latency 0.05]
+"""
+import argparse
+import hashlib
+import os
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, urlsplit
+
+
+def fixture_name(url):
+    """
+    Returns the file name of the saved page for a url.
+
+    Args:
+        url: Url of the page, only path and query are used.
+
+    Returns:
+        name: File name of the fixture.
+    """
+    parts = urlsplit(url)
+    path = parts.path + ("?" + parts.query if parts.query else "")
+    return quote(path, safe="") + ".html"
+
+
+def save_fixture(url, content, fixture_dir):
+    """
+    Stores the content of a page as fixture.
+
+    Args:
+        url: Url of the page.
+        content: Raw content of the page.
+        fixture_dir: Folder of the fixtures.
+
+    Returns:
+        path: Path of the fixture file.
+    """
+    os.makedirs(fixture_dir, exist_ok=True)
+    path = os.path.join(fixture_dir, fixture_name(url))
+    with open(path, "wb") as file:
+        file.write(content)
+    return path
+
+
+class FixtureServer:
+    """
+    Threaded HTTP server answering every request with the matching fixture or 404.
+
+    Args:
+        fixture_dir: Folder of the fixtures.
+        port: Port of the server, 0 for any free port.
+        latency: Seconds every response is delayed, to simulate the network.
+        validators: If True, responses carry ETag and Last-Modified and conditional requests are answered with 304.
+    """
+
+    def __init__(self, fixture_dir, port=0, latency=0.0, validators=True):
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.validators = validators
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep connections alive, like transfermarkt does
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                path = os.path.join(server.fixture_dir, fixture_name(self.path))
+                if not os.path.exists(path):
+                    self.send_error(404)
+                    return
+                with open(path, "rb") as file:
+                    content = file.read()
+                if server.validators:
+                    etag = '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+                    last_modified = formatdate(os.path.getmtime(path), usegmt=True)
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                self.send_response(200)
+                if server.validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", last_modified)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._httpd.daemon_threads = True
+        # clients that are killed reset their connections, which is no error of the stand-in
+        self._httpd.handle_error = lambda request, client_address: None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        Url of the server, to be used as base_url of a Fetcher.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Starts the server in a background thread.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the server.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serves saved transfermarkt pages.")
+    parser.add_argument("fixture_dir", help="folder of the saved pages")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds every response is delayed")
+    parser.add_argument("--no-validators", action="store_true", help="send no ETag/Last-Modified headers")
+    args = parser.parse_args()
+    server = FixtureServer(args.fixture_dir, args.port, args.latency, not args.no_validators)
+    print(f"Serving {args.fixture_dir} on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
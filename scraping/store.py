@@ -0,0 +1,72 @@
+"""
+Combining and storing the scraped data of several players.
+"""
+import io
+import os
+import tempfile
+
+import pandas as pd
+
+from analysis.config import DATA_DIR
+
+
+def combinePlayerData(dataframes):
+    """
+    Combines the dataframes of several players into a single one, with the player name as first column.
+
+    Args:
+        dataframes: Dictionary of player name and dataframe of the player.
+
+    Returns:
+        df: Combined dataframe.
+    """
+    frames = []
+    for player_name, df in dataframes.items():
+        df = df.copy()
+        df["player_name"] = player_name
+        frames.append(df)
+
+    # set player name as first column
+    df = pd.concat(frames, ignore_index=True)
+    columns = ['player_name'] + [col for col in df.columns if col != 'player_name']
+    return df[columns]
+
+
+def as_text(df):
+    """
+    Converts a dataframe into the text values it has when stored as csv.
+
+    Args:
+        df: Dataframe.
+
+    Returns:
+        df: Dataframe with every value as string, missing values as empty string.
+    """
+    return pd.read_csv(io.StringIO(df.to_csv(index=False)), dtype=str, keep_default_na=False)
+
+
+def storeData(df, filename, data_dir=DATA_DIR):
+    """
+    Stores a dataframe with a given name in the data folder.
+
+    Args:
+        df: Dataframe of the player data.
+        filename: file name of the resulting file.
+        data_dir: Folder the file is stored in.
+
+    Returns:
+        path: Path of the stored file.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, filename)
+    # write next to the dataset and replace it, so the app never reads a half written file
+    fd, tmp = tempfile.mkstemp(dir=data_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+            df.to_csv(file, index=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    print("Stored data in '" + path + "'.")
+    return path
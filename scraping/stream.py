@@ -0,0 +1,191 @@
+"""
+Streaming storage of scraped datasets with bounded memory.
+
+scrape_rows() yields the rows of a dataset while only a small window of players is scraped at a time,
+the pages of the window are fetched in parallel. A BatchWriter collects the rows in batches and appends
+every batch to a csv file, or writes it as a row group of a parquet file. Every batch is synced to disk,
+so the rows written before a crash are kept in the .part file next to the target; the target itself is
+only replaced once all rows are written, like storeData() does.
+
+Usage:
+    python -m scraping.stream <dataset> [--format csv|parquet] [--batch-size 5000]
+"""
+import argparse
+import gc
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from analysis.config import DATA_DIR, DATASETS
+from scraping.store import as_text
+
+# rows collected before they are written
+BATCH_SIZE = 5000
+
+# players scraped at the same time, as many as the shared fetcher requests in parallel
+WINDOW = 4
+
+
+def scrape_rows(module, pages=None, fetcher=None, window=WINDOW):
+    """
+    Yields the rows of a dataset, scraping a window of players at a time.
+
+    Args:
+        module: Scraper module of the dataset, e.g. scraping.club_goals.
+        pages: Players in the form of the PAGES (or PLAYERS) dictionary of the module, all if not given.
+        fetcher: Fetcher used to request the pages, the shared fetcher if not given.
+        window: Number of players scraped at the same time.
+
+    Yields:
+        row: Dictionary of column and value, the player name first.
+    """
+    if not hasattr(module, "PAGES") and not hasattr(module, "PLAYERS"):
+        # the top scorer lists are a single page
+        yield from module.scrape(fetcher=fetcher).to_dict("records")
+        return
+    pages = pages if pages is not None else getattr(module, "PAGES", None) or module.PLAYERS
+    names = list(pages)
+    for start in range(0, len(names), window):
+        df = module.scrape({name: pages[name] for name in names[start:start + window]}, fetcher)
+        # the parsed pages are reference cycles, they are freed before the next window is parsed
+        gc.collect()
+        yield from df.to_dict("records")
+
+
+class BatchWriter:
+    """
+    Writes rows in batches to a csv or parquet file, depending on the extension of the path.
+
+    Args:
+        path: Path of the file.
+        batch_size: Number of rows written at once.
+        columns: Columns of the file, the keys of the first row if not given.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE, columns=None):
+        self.path = path
+        self.part_path = path + ".part"
+        self.parquet = path.endswith(".parquet")
+        self.batch_size = batch_size
+        self.columns = columns
+        self.rows = 0
+        self._batch = []
+        self._file = None
+        self._writer = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def write(self, row):
+        """
+        Adds a row, the batch is written once it is full.
+        """
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def write_rows(self, rows):
+        """
+        Adds all rows of an iterable, e.g. of scrape_rows().
+
+        Returns:
+            rows: Number of rows written so far.
+        """
+        for row in rows:
+            self.write(row)
+        return self.rows
+
+    def flush(self):
+        """
+        Writes the collected rows and syncs them to disk.
+        """
+        if not self._batch:
+            return
+        if self.columns is None:
+            self.columns = list(self._batch[0])
+        self._write(pd.DataFrame(self._batch, columns=self.columns))
+        self.rows += len(self._batch)
+        self._batch = []
+
+    def _write(self, df):
+        if self.parquet:
+            # the raw datasets keep the text of the pages, typing is left to analysis.ingest
+            table = pa.Table.from_pandas(as_text(df), preserve_index=False)
+            table = table.cast(pa.schema([(column, pa.string()) for column in df.columns]))
+            if self._writer is None:
+                self._file = open(self.part_path, "wb")
+                self._writer = pq.ParquetWriter(self._file, table.schema)
+            self._writer.write_table(table)
+        elif self._file is None:
+            self._file = open(self.part_path, "w", encoding="utf-8", newline="")
+            df.to_csv(self._file, index=False)
+        else:
+            df.to_csv(self._file, index=False, header=False)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close_file(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """
+        Writes the remaining rows and replaces the file with the written one.
+
+        Returns:
+            path: Path of the written file.
+        """
+        self.flush()
+        if self._file is None:
+            # no rows at all, an empty file with the known columns
+            self._write(pd.DataFrame(columns=self.columns or []))
+        self._close_file()
+        os.replace(self.part_path, self.path)
+        print("Stored data in '" + self.path + "'.")
+        return self.path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # keep the rows written so far in the .part file
+            self.flush()
+            self._close_file()
+
+
+def store_rows(rows, filename, data_dir=DATA_DIR, batch_size=BATCH_SIZE):
+    """
+    Streams rows into a file of the data folder.
+
+    Args:
+        rows: Iterable of rows, e.g. of scrape_rows().
+        filename: Name of the file, csv or parquet.
+        data_dir: Folder the file is stored in.
+        batch_size: Number of rows written at once.
+
+    Returns:
+        rows: Number of stored rows.
+    """
+    with BatchWriter(os.path.join(data_dir, filename), batch_size) as writer:
+        writer.write_rows(rows)
+    return writer.rows
+
+
+if __name__ == "__main__":
+    from scraping.crawl import KINDS
+
+    parser = argparse.ArgumentParser(description="Scrapes a dataset and streams its rows into the data folder.")
+    parser.add_argument("dataset", choices=list(KINDS))
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows written at once")
+    args = parser.parse_args()
+    filename = os.path.splitext(DATASETS[args.dataset])[0] + "." + args.format
+    count = store_rows(scrape_rows(KINDS[args.dataset][0]), filename, batch_size=args.batch_size)
+    print(f"{args.dataset}: {count} rows stored")
@@ -0,0 +1,3 @@
+"""
+Pages of the Messi vs Ronaldo analysis, one page per discipline.
+"""
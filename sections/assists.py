@@ -0,0 +1,45 @@
+import streamlit as st
+
+from analysis.instrument import span
+from analysis.metrics import for_player, player_totals
+from analysis.ranges import filtered_metrics
+from sections.common import players, points, short_names
+from sections.filters import current
+
+###############################################################################
+################################ 3. Disziplin #################################
+###############################################################################
+
+with span("assists/metrics"):
+    assist_stats = filtered_metrics("assists", **current())
+
+# get assists per competition
+def assists_per_tournament(player):
+    assists = for_player(assist_stats["per_tournament"], player)
+    return assists.sort_values(by="assists", ascending=False)
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<< Display Data for Assists >>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+
+st.header("Disziplin 3 - Assists")
+st.write("Lionel Messi und Cristiano Ronaldo sind nicht nur herausragende Torschützen, sondern auch Meister im Vorbereiten von Toren. Assists zeigen ihre Fähigkeit, das Spiel zu lesen und Mitspieler in Szene zu setzen. Dieses Kapitel vergleicht die Assist-Statistiken der beiden Legenden, beleuchtet ihre unterschiedlichen Spielstile und fragt: Wer hat mehr zum Erfolg seiner Mitspieler beigetragen?")
+
+# display assists per tournament
+st.write("Zunächst werfen wir einen Blick auf die Verteilung der Assists in den verschiedenen Wettbewerben. Dabei wird deutlich, dass beide Spieler ihre größte Anzahl an Vorlagen in der La Liga verzeichnen. Lionel Messi sticht hier jedoch besonders hervor: Er liefert mehr als doppelt so viele Assists wie Cristiano Ronaldo. In der Champions League hingegen hat Ronaldo die Nase leicht vorn und übertrifft Messi knapp. Im spanischen Pokal, der Copa del Rey, zeigt Messi wiederum seine Überlegenheit und ist deutlich erfolgreicher als sein Konkurrent. Abschließend betrachten wir noch die internationalen Assists, hierbei können beide Fussballgiganten jedoch nicht wirklich überzeugen und erzielen vergleichsweise weniger Assists als im Clubsport.")
+with span("assists/render per tournament"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Assists per Tournament")
+            st.write(assists_per_tournament(player).head(10))
+
+# display total assist stats
+st.write("Und nun zur entscheidenden Frage dieser Kategorie: Wer ist der bessere Vorlagengeber? Die Zahlen sprechen eine klare Sprache: Lionel Messi hat über seine Karriere hinweg deutlich mehr Assists geliefert als Cristiano Ronaldo. Während Ronaldo durch seine physischen Fähigkeiten und seine Abschlussstärke glänzt, zeigt Messi seine außergewöhnliche Spielintelligenz und Präzision bei der Vorbereitung von Toren. Damit geht diese Runde eindeutig an Messi!")
+with span("assists/render totals"):
+    for col, player in zip(st.columns(len(players)), players):
+        totals = player_totals(assist_stats["totals"], player)
+        with col:
+            st.metric(label="Club Assists", value=f"{totals['club_assists']} Assists")
+            st.metric(label="International Assists", value=f"{totals['international_assists']} Assists")
+            st.metric(label="Total Assists", value=f"{totals['total_assists']} Assists")
+            st.write(points[player][2])
@@ -0,0 +1,97 @@
+"""
+Charts of the pages. The bar charts are limited to MAX_CHART_POINTS points before their data is sent to the
+browser. Pie charts and leaderboards are rendered as images with matplotlib if it is installed, otherwise
+they are shown as native charts.
+
+The size of the sent data of every native chart is shown in the debug panel and served with the span
+metrics, see record_payload() of analysis/instrument.py.
+"""
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from analysis.binning import MAX_CHART_POINTS, cap_points
+from analysis.charts import HAS_MATPLOTLIB, barh_chart as barh_image, label_color, pie_chart as pie_image
+from analysis.instrument import measured, record_payload
+
+
+def payload_bytes(values):
+    """
+    Returns the size of the data of a chart, serialized as Arrow IPC stream like streamlit sends it.
+
+    Args:
+        values: Series of the chart.
+
+    Returns:
+        size: Size in bytes.
+    """
+    table = pa.Table.from_pandas(values.reset_index(), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def bar_chart(name, values, ordered=True, sort=True, horizontal=False):
+    """
+    Shows a bar chart with at most MAX_CHART_POINTS bars.
+
+    Args:
+        name: Name of the chart for the debug panel, e.g. "goals/minutes Messi".
+        values: Series of the chart, already binned.
+        ordered: Whether the index is an ordered axis, see cap_points().
+        sort: Whether the bars are sorted by their label, otherwise they are shown in the order of the values.
+        horizontal: Whether the bars are drawn horizontally.
+    """
+    values = cap_points(values, MAX_CHART_POINTS, ordered)
+    if measured():
+        record_payload(name, len(values), payload_bytes(values))
+    st.bar_chart(values, sort=sort, horizontal=horizontal)
+
+
+def pie_chart(name, labels, values, title):
+    """
+    Shows a pie chart, the colours of the slices are taken from label_color().
+
+    Args:
+        name: Name of the chart for the debug panel.
+        labels: Labels of the slices.
+        values: Values of the slices.
+        title: Title of the chart.
+    """
+    if HAS_MATPLOTLIB:
+        st.image(pie_image(labels, values, title), width="stretch")
+        return
+    values = pd.Series([int(value) for value in values], index=[str(label) for label in labels], name="count")
+    if measured():
+        record_payload(name, len(values), payload_bytes(values.rename_axis("label")))
+    st.vega_lite_chart(values.rename_axis("label").reset_index(), {
+        "title": title,
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": "count", "type": "quantitative"},
+            "color": {"field": "label", "type": "nominal", "title": None,
+                      "scale": {"domain": list(values.index), "range": [label_color(label) for label in values.index]}},
+        },
+    })
+
+
+def barh_chart(name, names, values, xlabel, ylabel, title):
+    """
+    Shows a horizontal bar chart, the bars are drawn from bottom to top in the given order.
+
+    Args:
+        name: Name of the chart for the debug panel.
+        names: Labels of the bars.
+        values: Values of the bars.
+        xlabel: Label of the x axis.
+        ylabel: Label of the y axis.
+        title: Title of the chart.
+    """
+    if HAS_MATPLOTLIB:
+        st.image(barh_image(names, values, xlabel, ylabel, title), width="stretch")
+        return
+    # the native chart draws the bars from top to bottom
+    values = pd.Series([int(value) for value in values], index=[str(label) for label in names], name=xlabel)[::-1]
+    st.write(f"**{title}**")
+    bar_chart(name, values.rename_axis(ylabel), ordered=False, sort=False, horizontal=True)
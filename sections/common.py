@@ -0,0 +1,43 @@
+"""
+Settings shared by all pages.
+"""
+cr = "Christiano Ronaldo"
+lm = "Lionel Messi"
+
+# players compared on this page, each one is shown in its own column
+players = [lm, cr]
+short_names = {lm: "Messi", cr: "Ronaldo"}
+
+# running score shown below each discipline
+points = {
+    lm: ["🔴⚪⚪⚪⚪", "🔴🔴⚪⚪⚪", "🔴🔴🟢⚪⚪", "🔴🔴🟢🟢⚪", "🔴🔴🟢🟢🟢"],
+    cr: ["🟢⚪⚪⚪⚪", "🟢🟢⚪⚪⚪", "🟢🟢🔴⚪⚪", "🟢🟢🔴🔴⚪", "🟢🟢🔴🔴🔴"],
+}
+
+# pages of the navigation: [title, script, url path]
+sections = [
+    ["1. Disziplin - Tore", "sections/goals.py", "disziplin-1-tore"],
+    ["2. Disziplin - Elfmeter", "sections/penalties.py", "disziplin-2-elfmeter"],
+    ["3. Disziplin - Assists", "sections/assists.py", "disziplin-3-assists"],
+    ["4. Disziplin - Fair Play", "sections/fair_play.py", "disziplin-4-fair-play"],
+    ["5. Disziplin - Titel", "sections/titles.py", "disziplin-5-titel"],
+    ["Fazit", "sections/conclusion.py", "fazit"],
+    ["Detailsuche", "sections/drilldown.py", "detailsuche"],
+]
+
+# data shown by each page besides the season range of the filters, see analysis/dependencies.py; the
+# filtered metrics of a discipline follow the same cubes as its metrics. A page is rerun in the open
+# sessions once one of its nodes was recomputed, see sections/updates.py
+dependencies = {
+    "sections/overview.py": [],
+    "sections/goals.py": ["metrics:goals"],
+    "sections/penalties.py": ["metrics:penalties"],
+    "sections/assists.py": ["metrics:assists"],
+    "sections/fair_play.py": ["metrics:fair_play"],
+    "sections/titles.py": ["metrics:titles"],
+    "sections/conclusion.py": ["dataset:la_liga_top_scorer", "dataset:cl_top_scorer", "dataset:most_penalties",
+                               "dataset:most_assists"],
+    "sections/drilldown.py": ["index:penalties_by_goalkeeper", "index:penalties_by_opponent",
+                              "index:goals_by_opponent", "index:goals_by_table_position",
+                              "index:games_by_competition"],
+}
@@ -0,0 +1,71 @@
+import streamlit as st
+
+from analysis.loading import load_dataset
+from sections.charts import barh_chart
+
+###############################################################################
+################################### Fazit #####################################
+###############################################################################
+
+# leaderboards of other players, loaded once per process and shared between all sessions
+la_liga_top_scorer = load_dataset("la_liga_top_scorer")
+cl_top_scorer = load_dataset("cl_top_scorer")
+most_penalties = load_dataset("most_penalties")
+most_assists = load_dataset("most_assists")
+
+st.header("Fazit")
+st.write("**Und der Sieger ist... Lionel Messi** – mit 3:2 entscheidet er den Vergleich für sich und wird als der bessere Spieler gefeiert. *Oder etwa doch nicht?*")
+st.write("Seien wir ehrlich: Der Versuch, zwei Ausnahmefußballer wie Lionel Messi und Cristiano Ronaldo endgültig zu vergleichen, ist subjektiv und abhängig von den betrachteten Aspekten. Außerdem sind ihre individuellen Erfolge untrennbar mit der Qualität ihrer Mitspieler verbunden. Großartige Pässe, präzise Vorlagen und eine starke Teamleistung bilden oft die Grundlage für ihre herausragenden Momente. Ohne ihre Mitspieler, die sie unterstützen und Räume schaffen, wären viele ihrer Titel und Rekorde kaum möglich gewesen.")
+st.write("Man könnte unzählige weitere Metriken heranziehen und käme wohl doch nie zu einem klaren Ergebnis. Zum Beispiel könnte man sich natürlich noch unter anderem folgende Metriken genauer ansehen:")
+
+# display other metrics to show how many things we would have to compare
+other_metrics = ["Tore pro Spiel", "Erzielte Hattricks", "Tore in Finals", "Tore in Derbys", "Spielentscheidende Tore", "Tore außerhalb des Strafraums", "Tore innerhalb des Strafraums", "Abschlussquote", "Erwartete Tore (xG)", "Tore gegen Top-Teams", "Tore in Champions-League", "Vorlagen in Finals", "Erwartete Vorlagen (xA)", "Schlüsselpässe", "Pässe ins letzte Drittel", "Pässe in den Strafraum", "Angekommene Flanken", "Angekommene Steilpässe", "Angekommene lange Bälle", "Pre-Assists", "Passgenauigkeit", "Kreierte Großchancen", "Kreierte Chancen pro Spiel", "Erfolgreiche Dribblings", "Dribblingserfolgsquote", "Progressive Ballführungen", "Ballführungen in den Strafraum", "Zurückgelegte Distanz mit Ball", "1-gegen-1-Situationen","Gelungene Tunnel", "Getätigte Tacklings", "Gewonnene Tacklings", "Abgefangene Bälle", "Blocks", "Klärungsaktionen", "Gewonnene Kopfballduelle", "Erfolgsquote bei Kopfballduellen", "Ballrückeroberungen", "Angewandter Druck", "Erfolgreicher Druck", "Defensivaktionen pro Spiel", "Zurückgelegte Distanz pro Spiel", "Erreichte Höchstgeschwindigkeit", "Durchschnittliche Sprintdistanz", "Anzahl der Sprints pro Spiel", "Ausdauer", "Gewonnene Zweikämpfe", "Stärke in physischen Duellen", "Abwehrquote", "Weiße Westen", "Gegentore pro Spiel", "Erwartete Gegentore (xGA)", "Über-/Unterperformance bei xGA", "Aktionen außerhalb des Strafraums", "Verursachte Fouls", "Erhaltene Fouls", "Abseitsstellungen", "Platzverweise in entscheidenden Spielen", "Gespielte Spiele", "Gespielte Minuten", "Siegquote in gespielten Spielen", "Kapitänseinsätze", "Einfluss als Einwechselspieler", "Karriere-Länge", "Spiele pro Saison", "Beste Jahre", "Konstanz über mehrere Saisons", "Torbeteiligung pro 90 Minuten", "Anteil an Teamtoren", "Schussvorbereitende Aktionen", "Passvorbereitende Aktionen", "Offensive Added Value", "Defensive Added Value", "Fortschritt im Ballbesitz", "Beitrag im Spielaufbau", "Prozentualer Anteil an xG/xA des Teams", "Leistung in entscheidenden Spielen", "Führungsqualitäten", "Mentale Stärke in Drucksituationen", "Einfluss auf Teamkollegen", "Wahrnehmung bei Fans und Medien", "Anpassungsfähigkeit an verschiedene Ligen/Stile", "Widerstandsfähigkeit bei Verletzungen", "Transfergebühren", "Höchster Marktwert", "Sponsorenverträge und Werbedeals", "Trikotverkäufe"]
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    for metric in other_metrics[0::4]:
+        st.write(f"***{metric}***")
+
+with col2:
+    for metric in other_metrics[1::4]:
+        st.write(f"***{metric}***")
+
+with col3:
+    for metric in other_metrics[2::4]:
+        st.write(f"***{metric}***")
+    
+with col4:
+    for metric in other_metrics[3::4]:
+        st.write(f"***{metric}***")
+
+## display top scorer in la liga
+st.write("Natürlich könnten wir die Analyse noch weiter vertiefen und uns in unzähligen Details verlieren. Doch das würde nicht nur den Rahmen sprengen, sondern vermutlich auch nicht die entscheidenden Antworten liefern, die wir so dringend suchen. Ein sinnvoller Ansatz könnte stattdessen sein, die Daten von Messi und Ronaldo mit denen anderer erfolgreicher Spieler zu vergleichen, um ihre Leistungen in einen breiteren Kontext einzuordnen.")
+st.write("Betrachten wir zum Beispiel die Top-Torschützen der La Liga, jener Liga, in der beide während ihrer Prime brillierten. Ein Blick auf die Statistiken zeigt eindrucksvoll, dass Messi und Ronaldo nicht nur die Spitze der Tabelle dominieren, sondern dies mit einem beeindruckenden Vorsprung tun.") 
+la_liga_display = la_liga_top_scorer[["name", "goals"]].sort_values("goals", ascending=True)
+la_liga_display = la_liga_display.reset_index(drop=True)
+barh_chart("conclusion/la liga top scorer", la_liga_display["name"], la_liga_display["goals"], "Goals", "Player Name", "Top Scorers in La Liga")
+
+## display top scorer in UEFA champions league
+st.write("Neben der La Liga gibt es eine weitere Bühne, die sich perfekt für einen Vergleich der beiden Fußballlegenden eignet: die Champions League. Diese prestigeträchtige Liga haben Messi und Ronaldo über Jahre hinweg geprägt und mit Spannung erfüllt.")
+st.write("Auch hier wird ihre außergewöhnliche Klasse deutlich sichtbar. Während Ronaldo in diesem Wettbewerb die Nase leicht vorn hat, lassen beide Spieler die Konkurrenz weit hinter sich.")
+cl_display = cl_top_scorer[["name", "goals"]].sort_values("goals", ascending=True)
+cl_display = cl_display.reset_index(drop=True)
+barh_chart("conclusion/cl top scorer", cl_display["name"], cl_display["goals"], "Goals", "Player Name", "Top Scorers in UEFA Champions League")
+
+## display top penalty takers in 21st century
+st.write("Wir könnten zahlreiche weitere Torstatistiken analysieren und würden dabei immer wieder auf ein ähnliches Muster stoßen. Doch anstatt uns weiter auf die Tore zu konzentrieren, richten wir den Blick auf eine andere interessante Kategorie: die Elfmetertreffer. Werfen wir einen Blick auf die Statistik der erfolgreichsten Elfmeterschützen des 21. Jahrhunderts. Auch hier zeigt sich erneut die fussballtechnische Dominanz der beiden Spieler. Wobei Ronaldo hier seiner Konkurrenz doch ein paar Schritte voraus zu sein scheint.")
+
+pen_display = most_penalties[["player_name", "penalties_scored"]].sort_values("penalties_scored", ascending=True)
+pen_display = pen_display.reset_index(drop=True)
+barh_chart("conclusion/most penalties", pen_display["player_name"], pen_display["penalties_scored"], "Penalties", "Player Name", "Top Penalty Scorer in 21st Century")
+
+
+## display assist stats
+st.write("Nun sehen wir uns noch zuletzt die Daten zu den Spielern mit den meisten Assists im 21. Jahrhundert an. Wenig verwunderlich ist es, dass auch hier die Spitze von niemand anderem als Messi und Ronaldo angeführt wird.")
+assist_display = most_assists[["player_name", "assists"]].sort_values("assists", ascending=True)
+assist_display = assist_display.reset_index(drop=True)
+barh_chart("conclusion/most assists", assist_display["player_name"], assist_display["assists"], "Assists", "Player Name", "Players with Most Goal Assist in 21st Century")
+
+# Finish
+st.write("Man könnte diese Analyse noch unendlich fortsetzen, doch die wesentliche Erkenntnis sollte bereits klar sein: Eine endgültige Antwort darauf, wer von Messi und Ronaldo der Bessere ist, lässt sich nicht eindeutig geben.")
+st.write("Was jedoch unbestreitbar ist, ist ihr Status als absolute Ausnahmetalente, die die Fußballwelt über Jahre hinweg geprägt und Geschichte geschrieben haben. Spieler ihres Kalibers sind eine seltene Erscheinung, und es wird wohl noch lange dauern, bis wir erneut Talente erleben, die mit diesen beiden Legenden auf Augenhöhe stehen.")
@@ -0,0 +1,68 @@
+"""
+Debug panel in the sidebar with the timing and memory spans and the chart payloads of the last rerun, opened with ?debug=1.
+"""
+import contextlib
+
+import pandas as pd
+import streamlit as st
+
+from analysis.instrument import TRACE_MEMORY, recording
+
+
+def debug_enabled():
+    # the query parameter is lost when switching pages, so the panel stays enabled for the session
+    if st.query_params.get("debug") == "1":
+        st.session_state["debug"] = True
+    return st.session_state.get("debug", False)
+
+
+def show_spans(recorder):
+    """
+    Shows the recorded spans as a table in the sidebar.
+
+    Args:
+        recorder: Recorder of the rerun.
+    """
+    spans = pd.DataFrame({
+        "span": ["· " * span.depth + span.name for span in recorder.spans],
+        "ms": [round(span.seconds * 1000, 2) for span in recorder.spans],
+        "peak MB": [None if span.peak_bytes is None else round(span.peak_bytes / 2 ** 20, 2) for span in recorder.spans],
+    })
+    with st.sidebar:
+        total = sum(span.seconds for span in recorder.spans if span.depth == 0)
+        st.caption(f"{len(spans)} Spans, {total * 1000:.1f} ms")
+        st.dataframe(spans, hide_index=True)
+
+
+def show_payloads(recorder):
+    """
+    Shows the points and the size of the data sent for every chart as a table in the sidebar.
+
+    Args:
+        recorder: Recorder of the rerun.
+    """
+    if not recorder.payloads:
+        return
+    payloads = pd.DataFrame(recorder.payloads, columns=["chart", "points", "bytes"])
+    with st.sidebar:
+        st.caption(f"{len(payloads)} Diagramme, {payloads['bytes'].sum() / 1024:.1f} KB Daten")
+        st.dataframe(payloads.assign(KB=(payloads["bytes"] / 1024).round(2)).drop(columns="bytes"), hide_index=True)
+
+
+@contextlib.contextmanager
+def debug_panel():
+    """
+    Records the spans of the rerun while the debug panel is enabled and shows them in the sidebar afterwards.
+    """
+    if not debug_enabled():
+        yield
+        return
+    with recording() as recorder:
+        yield
+    with st.sidebar:
+        st.subheader("Debug")
+        if not TRACE_MEMORY:
+            # tracemalloc slows down every allocation of the process, a session cannot start it for all others
+            st.caption("Der Speicher wird nur gemessen, wenn der Server mit TRACE_MEMORY=1 gestartet wurde.")
+    show_spans(recorder)
+    show_payloads(recorder)
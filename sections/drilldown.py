@@ -0,0 +1,64 @@
+import streamlit as st
+
+from analysis.instrument import span
+from analysis.lookup import DRILL_DOWNS, inverted_index
+from sections.common import players, short_names
+
+###############################################################################
+################################ Detailsuche ##################################
+###############################################################################
+
+# label of the query -> (drill-down of analysis/lookup.py, label of the selection)
+queries = {
+    "Elfmeter gegen Torhüter": ("penalties_by_goalkeeper", "Torhüter"),
+    "Elfmeter gegen Gegner": ("penalties_by_opponent", "Gegner"),
+    "Tore gegen Gegner": ("goals_by_opponent", "Gegner"),
+    "Tore gegen Tabellenplätze": ("goals_by_table_position", "Tabellenplatz des Gegners"),
+    "Länderspiele pro Wettbewerb": ("games_by_competition", "Wettbewerb"),
+}
+
+# summary shown above the rows of a player
+def summary(name, rows):
+    if name.startswith("penalties"):
+        return "Verwandelt", f"{int(rows['has_scored'].sum())} von {len(rows)}"
+    if name.startswith("goals"):
+        return "Club Tore", f"{len(rows)} Goals"
+    return "Spiele", f"{len(rows)} ({int(rows['goals'].sum())} Tore, {int(rows['assists_amount'].sum())} Assists)"
+
+# selected values of the looked up column, the options are sorted by their number of rows
+def selection(name, label, counts):
+    if name == "goals_by_table_position":
+        positions = [int(position) for position in counts.index]
+        first, last = st.select_slider(label, options=positions, value=(positions[0], positions[min(3, len(positions) - 1)]),
+                                       key=f"drill_down_{name}")
+        return [position for position in positions if first <= position <= last]
+    options = counts.sort_values(ascending=False, kind="stable").index.tolist()
+    return st.multiselect(label, options, default=options[:1], format_func=lambda value: f"{value} ({counts[value]})",
+                          key=f"drill_down_{name}")
+
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<< Display the Drill-down >>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+st.header("Detailsuche")
+st.write("Hinter den Summen der Disziplinen stehen einzelne Tore, Elfmeter und Spiele. Hier können sie gezielt nachgeschlagen werden, z.B. alle Elfmeter gegen einen bestimmten Torhüter oder alle Tore gegen die ersten vier der Tabelle. Die Filter der Seitenleiste gelten hier nicht.")
+
+query = st.radio("Abfrage", list(queries), key="drill_down")
+name, label = queries[query]
+dataset, column, columns = DRILL_DOWNS[name]
+with span("drilldown/index"):
+    index = inverted_index(dataset, column)
+values = selection(name, label, index.counts())
+if name == "goals_by_table_position":
+    st.caption("Der Tabellenplatz des Gegners ist nur für Ligaspiele bekannt.")
+
+with span("drilldown/render rows"):
+    for col, player in zip(st.columns(len(players)), players):
+        rows = index.rows(values, player, columns)
+        with col:
+            metric_label, value = summary(name, rows)
+            st.metric(label=f"{short_names[player]} - {metric_label}", value=value)
+            if len(rows):
+                st.dataframe(rows, hide_index=True)
+            else:
+                st.write(f"Keine Einträge von {short_names[player]}")
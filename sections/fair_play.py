@@ -0,0 +1,52 @@
+import streamlit as st
+
+from analysis.binning import top_k
+from analysis.instrument import span
+from analysis.metrics import for_player, player_totals
+from analysis.ranges import filtered_metrics
+from sections.charts import bar_chart
+from sections.common import players, points, short_names
+from sections.filters import bins, current
+
+###############################################################################
+############################### 4. Fair Play ##################################
+###############################################################################
+
+with span("fair_play/metrics"):
+    fair_play = filtered_metrics("fair_play", **current())
+
+## get yellow cards per competition type, the smallest ones are combined to "Andere"
+def yellow_cards_per_competition(player):
+    cards = for_player(fair_play["per_competition"], player)
+    return top_k((cards["yellow_cards"] + cards["yellow_red_cards"]).rename("count"), bins()["top_competitions"])
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<< Display Data for Fair Play >>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+
+st.header("Disziplin 4 - Fair Play")
+st.write("Lionel Messi und Cristiano Ronaldo glänzen nicht nur durch ihre sportlichen Leistungen, sondern auch durch ihr Verhalten auf dem Spielfeld. Fair Play, gemessen an gelben und roten Karten, offenbart viel über ihre Disziplin, Selbstkontrolle und Spielweise. Dieses Kapitel vergleicht die Fair-Play-Statistiken der beiden Fußballlegenden, beleuchtet ihre Herangehensweise in schwierigen Spielsituationen und fragt: Wer zeigt die größere Disziplin, wenn es darauf ankommt?")
+
+# display yellow cards per game played
+st.write("Werfen wir zunächst einen Blick auf die Verteilung der gelben Karten in den verschiedenen Wettbewerben. Dabei fällt sofort eine Gemeinsamkeit zwischen den beiden Spielern auf: Sowohl Messi als auch Ronaldo erhielten die meisten ihrer gelben Karten in den nationalen Ligen, gefolgt von internationalen Pokalwettbewerben und nationalen Pokalturnieren. Dies lässt sich dadurch erklären, dass die meisten Spiele in diesen drei Wettbewerbsarten stattfinden.")
+st.write("Darüber hinaus nahmen beide Spieler an verschiedenen Wettbewerben teil, an denen der jeweils andere nicht beteiligt war. Aus diesem Grund lassen sich diese Daten nicht sinnvoll miteinander vergleichen.")
+with span("fair_play/render cards per competition"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Yellow Cards by Competition")
+            bar_chart(f"fair_play/cards per competition {short_names[player]}", yellow_cards_per_competition(player),
+                      ordered=False, sort=False)
+
+# display total assist stats
+st.write("Nun stellt sich die Frage: Wer von den beiden ist der fairere Spieler, zumindest wenn man die Anzahl der Karten betrachtet? Die Daten sprechen hier eine klare Sprache zugunsten von Lionel Messi, der deutlich weniger gelbe Karten als Cristiano Ronaldo erhalten hat. Bemerkenswert ist zudem, dass Messi in seiner gesamten Karriere keine einzige Gelb-Rote Karte kassiert hat und lediglich vier Rote Karten aufweist. Zum Vergleich: Ronaldo musste in seiner Laufbahn ganze zwölf Mal mit Rot vom Platz.")
+st.write("Diese Zahlen wirken sich auch auf die durchschnittliche Anzahl an Spielen aus, die bis zu einer gelben oder roten Karte vergeht. Auch hier hat Messi die Nase vorn und entscheidet damit die vierte Disziplin für sich. Es bleibt also bis zum Schluss spannend!")
+with span("fair_play/render totals"):
+    for col, player in zip(st.columns(len(players)), players):
+        totals = player_totals(fair_play["totals"], player)
+        with col:
+            st.metric(label="Yellow Cards", value=f"{totals['yellow']} Cards")
+            st.metric(label="Yellow Red Cards", value=f"{totals['yellow_red']} Cards")
+            st.metric(label="Red Cards", value=f"{totals['red']} Cards")
+            st.metric(label="Average Games per Yellow Card", value=f"{totals['games_per_yellow']:.2f}")
+            st.metric(label="Average Games per Red Card", value=f"{totals['games_per_red']:.2f}")
+            st.write(points[player][3])
@@ -0,0 +1,71 @@
+"""
+Season, competition and venue filters in the sidebar and the binning of the charts, shared by all discipline pages.
+"""
+import streamlit as st
+
+from analysis.ranges import season_index
+
+# label shown in the sidebar -> value of the filter
+SOURCES = {"Alle": None, "Verein": "Club", "International": "International"}
+VENUES = {"Alle": None, "Heim": "H", "Auswärts": "A"}
+
+# options of the binning of the charts, see analysis/binning.py
+MINUTE_BINS = [1, 5, 15]
+SEASON_GROUPS = [1, 2, 3, 5]
+# largest competitions of a chart, 0 for all competitions
+TOP_COMPETITIONS = [5, 10, 20, 0]
+
+# binning of the charts if the widgets were not shown yet
+DEFAULT_BINS = {"minute_bin": 5, "season_group": 1, "top_competitions": 10}
+
+
+def season_label(season):
+    return f"{season % 100:02d}/{(season + 1) % 100:02d}"
+
+
+def sidebar():
+    """
+    Shows the filters in the sidebar. The widgets are created by app.py on every rerun, so their values are
+    kept while switching between the pages.
+    """
+    index = season_index()
+    seasons = list(range(index.first_season, index.last_season + 1))
+    with st.sidebar:
+        st.subheader("Filter")
+        st.select_slider("Saisons", options=seasons, value=(seasons[0], seasons[-1]), format_func=season_label, key="seasons")
+        st.radio("Wettbewerbe", list(SOURCES), horizontal=True, key="source")
+        st.radio("Spielort", list(VENUES), horizontal=True, key="venue")
+        st.caption("Der Spielort ist nur für Vereinstore und Länderspiele bekannt, die übrigen Zahlen werden nicht nach Spielort gefiltert. Titel werden nur nach Saison gefiltert.")
+        with st.expander("Darstellung"):
+            st.select_slider("Minuten pro Balken", options=MINUTE_BINS, value=DEFAULT_BINS["minute_bin"], key="minute_bin")
+            st.select_slider("Saisons pro Balken", options=SEASON_GROUPS, value=DEFAULT_BINS["season_group"], key="season_group")
+            st.select_slider("Wettbewerbe pro Diagramm", options=TOP_COMPETITIONS, value=DEFAULT_BINS["top_competitions"],
+                             format_func=lambda k: str(k) if k else "Alle", key="top_competitions")
+
+
+def current():
+    """
+    Returns the selected filters.
+
+    Returns:
+        filters: Keyword arguments of filtered_metrics(), None for every filter that is not set.
+    """
+    index = season_index()
+    seasons = tuple(st.session_state.get("seasons", (index.first_season, index.last_season)))
+    return {
+        "seasons": None if seasons == (index.first_season, index.last_season) else seasons,
+        "source": SOURCES[st.session_state.get("source", "Alle")],
+        "venue": VENUES[st.session_state.get("venue", "Alle")],
+    }
+
+
+def bins():
+    """
+    Returns the selected binning of the charts.
+
+    Returns:
+        bins: Dictionary of minute_bin, season_group and top_competitions, see analysis/binning.py. The number of
+              competitions is None for all competitions.
+    """
+    selected = {key: st.session_state.get(key, default) for key, default in DEFAULT_BINS.items()}
+    return {**selected, "top_competitions": selected["top_competitions"] or None}
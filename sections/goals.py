@@ -0,0 +1,95 @@
+import streamlit as st
+import pandas as pd
+
+from analysis.binning import minute_bins
+from analysis.instrument import span
+from analysis.metrics import for_player, player_totals
+from analysis.ranges import filtered_metrics
+from sections.charts import bar_chart, pie_chart
+from sections.common import players, points, short_names
+from sections.filters import bins, current
+
+###############################################################################
+################################ 1. Disziplin #################################
+###############################################################################
+
+with span("goals/metrics"):
+    goals = filtered_metrics("goals", **current())
+
+# pie chart of the club goal types, goal types with less than 20 goals are combined to "Andere"
+# every goal type keeps its colour between reruns, see analysis/charts.py
+def goal_types(player):
+    player_types = for_player(goals["types"], player).reset_index()
+    below_threshold = player_types[player_types['count'] < 20]
+    above_threshold = player_types[player_types['count'] >= 20]
+    below_aggregated = pd.DataFrame({
+        'goal_type': ["Andere"],
+        'count': [below_threshold['count'].sum()]
+    })
+    return pd.concat([above_threshold, below_aggregated], ignore_index=True)
+
+## Most successfull position for scoring
+def goal_positions(player):
+    positions = for_player(goals["positions"], player)
+    return positions.sort_values(ascending=False)
+
+## Most successfull scoring minute, summed to buckets of minutes on the server
+def goal_minutes(player):
+    return minute_bins(for_player(goals["minutes"], player), bins()["minute_bin"])
+
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<< Display Data for Goals >>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+st.header("Disziplin 1 - Tore")
+st.write("Ohne Tore kann man nur schwer ein Fussballspiel gewinnen, sie sind daher das Herzstück des Fussballs und ein Maßstab für Erfolg und Einfluss auf dem Spielfeld. In dieser ersten Disziplin werfen wir daher einen Blick auf die Torhistorie der beiden Giganten, um Unterschiede und Ähnlichkeiten in der Spielweise und Effizienz der beiden Spieler aufzuzeigen.")
+
+st.write("Zunächst werfen wir einen Blick auf die Art der Tore der beiden Spieler. Da jedoch nur die Torart Daten zu Club-Spielen öffentlich auf Transfermarkt verfügbar ist, werden hier keine Daten zu internationalen Spielen verwendet. Im Pie Chart ist zu erkennen, dass Christiano Ronaldo eher zum Rechtsschuss neigt und Lionel Messi eher den linken Fuß verwendet. Jedoch hat Ronaldo im Vergleich zu Messi eine gleichmäßige Verteilung der Torarten mit einer leichten Vorliebe für Rechtsschüsse. Bei Messi jedoch sind es zu einem sehr großen Teil Linksschüsse.")
+# display Goal types
+with span("goals/render types"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            # the filters of the sidebar can leave a player without club goals
+            if for_player(goals["types"], player).sum() > 0:
+                player_types = goal_types(player)
+                pie_chart(f"goals/types {short_names[player]}", player_types["goal_type"], player_types["count"],
+                          f'Club Goal Types Distribution for {player}')
+            else:
+                st.write(f"Keine Club Tore von {short_names[player]} für die gewählten Filter")
+
+st.write("Als nächstes analysieren wir die eingesetzten Spielerpositionen der beiden für deren Club Tore. Man kann erkennen, dass Christiano Ronaldo eher linksaußen gespielt hat, während Lionel Messi eher rechtsaußen gespielt hat. Beide fühlen sich in der Rolle des Stürmers wohl, sind jedoch als Flügelspieler erfolgreicher, was das Toreschießen angeht.")
+
+# display club goal positions
+with span("goals/render positions"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Club Goal Positions")
+            bar_chart(f"goals/positions {short_names[player]}", goal_positions(player), ordered=False)
+
+st.write("Abschließend werfen wir einen Blick auf die Verteilung der Minuten, in denen die Tore erzielt wurden. Die unten dargestellte Grafik zeigt bei beiden Spielern Ähnlichkeiten gegen Ende der ersten Halbzeit: Sie tendieren dazu, besonders häufig in der 45. Spielminute zu treffen. In der Nachspielzeit hingegen fallen selten Tore, was auf die meist kurze Dauer der ersten Nachspielzeit zurückzuführen ist. In der zweiten Halbzeit zeigen sich deutliche Unterschiede. Während Messi zwischen der 60. und 70. Minute weniger Tore erzielt, steigert er sich gegen Ende des Spiels deutlich. Ronaldo hingegen agiert in der zweiten Halbzeit konstanter und trifft auch in den Schlussminuten häufiger.")
+
+# display club goal frequency per minute
+with span("goals/render minutes"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Club Goal Frequency per Minute")
+            # keep the order of the minutes instead of sorting the labels alphabetically
+            bar_chart(f"goals/minutes {short_names[player]}", goal_minutes(player), sort=False)
+
+# display club goals per phase of the game
+with span("goals/render phases"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Club Goals per Match Phase")
+            bar_chart(f"goals/phases {short_names[player]}", for_player(goals["phases"], player), sort=False)
+
+
+st.write("Betrachtet man die absolute Anzahl der Tore im Profisport, zeigt sich ein knappes Ergebnis zugunsten von Cristiano Ronaldo. Er hat sowohl auf internationaler Ebene als auch im Verein mehr Tore erzielt als Lionel Messi und gewinnt damit die erste Disziplin.")
+with span("goals/render totals"):
+    for col, player in zip(st.columns(len(players)), players):
+        totals = player_totals(goals["totals"], player)
+        with col:
+            st.metric(label="Club Goals", value=f"{totals['club_goals']} Goals")
+            st.metric(label="International Goals", value=f"{totals['international_goals']} Goals")
+            st.metric(label="Total Goals", value=f"{totals['total_goals']} Goals")
+            st.write(points[player][0])
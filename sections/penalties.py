@@ -0,0 +1,84 @@
+import streamlit as st
+
+from analysis.binning import season_groups, top_k
+from analysis.instrument import span
+from analysis.metrics import for_player, player_totals
+from analysis.ranges import filtered_metrics
+from sections.charts import bar_chart
+from sections.common import players, points, short_names
+from sections.filters import bins, current
+
+###############################################################################
+################################ 2. Elfmeter ##################################
+###############################################################################
+
+with span("penalties/metrics"):
+    penalty_stats = filtered_metrics("penalties", **current())
+
+# amount of penalties per competition
+def penalty_competitions(player):
+    competitions = for_player(penalty_stats["per_competition"], player)
+    return competitions.sort_values(by='count', ascending=False)
+
+# amount of penalties per season, summed to groups of seasons on the server
+def penalties_per_saison(player):
+    return season_groups(for_player(penalty_stats["per_saison"], player), bins()["season_group"])
+
+# amount of scored penalties of the largest competitions, the others are combined to "Andere"
+def penalty_scored_competitions(player):
+    scored = for_player(penalty_stats["per_competition"], player)["scored"]
+    return top_k(scored[scored > 0].rename("count"), bins()["top_competitions"])
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<< Display Data for Penalties >>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+
+st.header("Disziplin 2 - Elfmeter")
+st.write("Elfmeter sind nicht nur eine Frage von Präzision und Nervenstärke, sondern auch ein zentraler Punkt in der polarisierenden Debatte zwischen Lionel Messi und Cristiano Ronaldo. In dieser Disziplin widmen wir uns den Elfmeterstatistiken der beiden Spieler, um Licht in diese kontroverse Thematik zu bringen und ihre Leistungen objektiv zu vergleichen.")
+
+# display penalties per year
+st.write(f"Sehen wir uns zunächst die Anzahl der geschossenen Elfmeter pro Saison an. Hier ist zu sehen, dass Ronaldo zu Beginn seiner Karriere im Profifussball bereits vermehrt Elfmeter schießen durfte als Messi. Dies zieht sich durch die gesamte Karriere der beiden Spieler und ist auch anhand der durchschnittlichen Anzahl an Elfmetern zu sehen.")
+with span("penalties/render per saison"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Penalties taken per Saison")
+            bar_chart(f"penalties/per saison {short_names[player]}", penalties_per_saison(player), sort=False)
+            st.metric(
+                label="Average Penalties per Season",
+                value=f"{penalty_stats['totals'].loc[player, 'per_season']:.2f} per Season"
+            )
+
+# display penalties per competition
+st.write("Nun betrachten wir die Verteilung der Wettbewerbe, in denen Elfmeter geschossen wurden. Es wird schnell deutlich, dass Ronaldo in einer Vielzahl unterschiedlicher Wettbewerbe vom Elfmeterpunkt aus erfolgreich war – deutlich mehr als sein Rivale Messi. Allerdings liegt Ronaldo in den Wettbewerben, an denen auch Lionel Messi teilgenommen hat, im Vergleich hinter ihm zurück. Diese Wettbewerbe umfassen die La Liga, die Copa del Rey, die UEFA Champions League sowie die Weltmeisterschaft. In diesen Wettbewerben erriecht Messi sogar die höhere Trefferquote.")
+with span("penalties/render per competition"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} Penalties per Competition")
+            st.write(penalty_competitions(player))
+
+# display penalty per competition type
+top_competitions = bins()["top_competitions"]
+top_label = "All Competitions" if top_competitions is None else f"Top {top_competitions} Competitions"
+with span("penalties/render scored per competition"):
+    for col, player in zip(st.columns(len(players)), players):
+        with col:
+            st.write(f"{short_names[player]} {top_label} by Penalty Scored")
+            bar_chart(f"penalties/scored per competition {short_names[player]}", penalty_scored_competitions(player),
+                      ordered=False, sort=False)
+
+# display total penalty stats
+st.write("Damit kommen wir schon zur entscheidenden Frage dieser Kategorie: Wer ist der bessere Elfmeterschütze? Ein Blick auf die Zahlen zeigt, dass Cristiano Ronaldo deutlich mehr Elfmeter ausgeführt hat als Lionel Messi und dabei die gleiche Anzahl an Fehlversuchen aufweist. Dadurch erzielt Ronaldo eine höhere Trefferquote als sein Rivale. Zudem hat er auch eine größere Anzahl verwandelter Elfmeter auf seinem Konto. Damit geht diese Runde eindeutig an Ronaldo!")
+with span("penalties/render totals"):
+    for col, player in zip(st.columns(len(players)), players):
+        totals = player_totals(penalty_stats["totals"], player)
+        with col:
+            st.metric(label="Total Penalties", value=f"{totals['total']} Penalties")
+            st.metric(label="Missed Penalties", value=f"{totals['missed']} Missed")
+            st.metric(label="Scored Penalties", value=f"{totals['scored']} Scored")
+            st.metric(
+                label="Average Scoring Rate",
+                value=f"{totals['scoring_rate'] * 100:.2f}%"
+            )
+            # without penalties in the filtered seasons there is no scoring rate
+            st.progress(float(totals['scoring_rate']) if totals['total'] > 0 else 0.0)
+            st.write(points[player][1])
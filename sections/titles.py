@@ -0,0 +1,53 @@
+import streamlit as st
+
+from analysis.instrument import span
+from analysis.metrics import player_totals, title_overlap
+from analysis.ranges import filtered_metrics
+from sections.common import players, points
+from sections.filters import current
+
+###############################################################################
+################################# 5. Titel ####################################
+###############################################################################
+
+with span("titles/metrics"):
+    title_stats = filtered_metrics("titles", **current())
+
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<< Display Data for Titles >>>>>>>>>>>>>>>>>>>>>#
+#<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>#
+
+st.header("Disziplin 5 - Titel")
+st.write("Und nun kommen wir zu unserer letzten, alles entscheidenden Kategorie: Lionel Messi und Cristiano Ronaldo sind nicht nur herausragende Athleten, sondern auch Rekordhalter und Champions in nahezu jeder Hinsicht. Ihre Karrieren sind gespickt mit Preisen und Titeln, die ihresgleichen suchen. Von nationalen Meisterschaften bis hin zu internationalen Triumphen, von individuellen Auszeichnungen wie dem Ballon d'Or bis hin zu Team-Erfolgen wie der Champions League – dieser Abschnitt widmet sich dem ultimativen Vergleich ihrer Errungenschaften. Wer hat die meisten Titel gesammelt? Welche Auszeichnungen unterstreichen ihre Dominanz? Und was sagen diese Erfolge über ihre Stellung in der Fußballgeschichte aus? Ein detaillierter Blick auf die schillernden Trophäenschränke der beiden Legenden.. ")
+
+st.write("Beide Spieler können auf eine beeindruckende Liste an Titeln und Erfolgen zurückblicken. Beginnen wir mit den Auszeichnungen, die Messi und Ronaldo gemeinsam haben: Beide wurden mehrfach Torschützenkönig, gewannen Champions-League-Titel, den Goldenen Schuh und wurden als Spieler der Saison ausgezeichnet. Messi hingegen übertrifft Ronaldo in der Anzahl der Ballon-d'Or-Siege, als Topvorbereiter sowie bei spanischen Pokalsiegen.")
+with span("titles/render shared titles"):
+    for col, player in zip(st.columns(len(players)), players):
+        shared, unique = title_overlap(title_stats["per_title"], player, players)
+        others = " or ".join(other for other in players if other != player)
+        with col:
+            st.write(f"Awards Won by {player} That Were Also Won by {others}")
+            st.write(shared)
+
+st.write("Nun werfen wir einen Blick auf die Unterschiede, also auf Titel, die der jeweils andere Spieler nie gewinnen konnte. Viele davon resultieren aus den Ligen, in denen sie gespielt haben. Da Ronaldo in der Primeira Liga, Premier League, Serie A und der Saudi League aktiv war, konnte er nur in Portugal, England, Italien und Saudi-Arabien Titel gewinnen. Messi hingegen hat in der Ligue 1 und der MLS gespielt und deshalb Erfolge in Frankreich und den USA gefeiert.")
+st.write("Auch auf internationaler Ebene gibt es markante Unterschiede: Messi, als Südamerikaner, tritt bei der Copa América an, während Ronaldo bei der Europameisterschaft spielt. Da sich die Leistungsniveaus dieser Turniere unterscheiden, ist ein direkter Vergleich schwierig – auch wenn beide die jeweils wichtigsten Kontinentalwettbewerbe repräsentieren. Jedoch hat einen Weltmeistertitel, welche Cristiano Ronaldo bislang verwehrt bleibt.")
+st.write("Die individuellen Erfolge sind nun folgende: Messi hat den Weltmeistertitel, eine olympische Goldmedaille und den Titel 'Spieler des Turniers' gewonnen, während Ronaldo als 'Fußballer des Jahres' ausgezeichnet wurde und den prestigeträchtigen Puskás Award für das beste Tor erhielt.")
+with span("titles/render unique titles"):
+    for col, player in zip(st.columns(len(players)), players):
+        shared, unique = title_overlap(title_stats["per_title"], player, players)
+        others = " or ".join(other for other in players if other != player)
+        with col:
+            st.write(f"Awards Won by {player} That Were Not Won by {others}")
+            st.write(unique)
+
+st.write("Beide Spieler haben in ihrer Fußballkarriere beeindruckende Erfolge erzielt und auf einem ähnlich hohen Niveau performt. Letztendlich kann Messi jedoch insgesamt mehr Titel vorweisen und entscheidet somit diese finale Disziplin für sich!")
+with span("titles/render totals"):
+    for col, player in zip(st.columns(len(players)), players):
+        totals = player_totals(title_stats["totals"], player)
+        with col:
+            st.metric(label="World Champion Titles", value=f"{totals['world_champion']} Titles")
+            st.metric(label="Continental Champion Titles", value=f"{totals['continental_champion']} Titles")
+            st.metric(label="Champions League Titles", value=f"{totals['champions_league']} Titles")
+            st.metric(label="Ballon d'Or Winner", value=f"{totals['ballon_dor']} Trophies")
+            st.metric(label="Total Titles", value=f"{totals['total']} Titles")
+            st.write(points[player][4])
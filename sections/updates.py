@@ -0,0 +1,34 @@
+"""
+Reruns the open page of a session once the data it shows was recomputed by the watcher of
+analysis/dependencies.py, without restarting the server or reloading the browser.
+"""
+import streamlit as st
+
+from analysis.dependencies import WATCH_SECONDS, versions, watch_data
+from sections.common import dependencies
+
+
+@st.fragment(run_every=WATCH_SECONDS if WATCH_SECONDS > 0 else None)
+def _check_versions(nodes):
+    # only this fragment runs every WATCH_SECONDS seconds, the page itself is only rerun after a change
+    if versions(nodes) != st.session_state.get("data_versions"):
+        st.session_state["data_updated"] = True
+        st.rerun(scope="app")
+
+
+def data_updates(script):
+    """
+    Remembers the versions of the data shown by a page and reruns the app when one of them changes.
+
+    Args:
+        script: Script of the open page, e.g. "sections/goals.py".
+    """
+    if WATCH_SECONDS <= 0:
+        return
+    watch_data()
+    # the filters in the sidebar of every page depend on the season range
+    nodes = ["season_range", *dependencies.get(script, [])]
+    st.session_state["data_versions"] = versions(nodes)
+    if st.session_state.pop("data_updated", False):
+        st.toast("Die Daten wurden aktualisiert.", icon="🔄")
+    _check_versions(nodes)
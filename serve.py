@@ -0,0 +1,36 @@
+"""
+Starts the streamlit server of app.py in a warmed up process.
+
+The datasets, cubes, metrics and indexes are loaded and computed by analysis/warmup.py before the server
+is started in the same process, so the server only accepts sessions once everything the pages share is in
+memory and its health check (/_stcore/health) only succeeds after the warm-up. All other arguments are
+passed to streamlit run.
+
+Usage:
+    python serve.py [--no-warm-up] [--server.port 8501 ...]
+"""
+import logging
+import os
+import sys
+
+from analysis.warmup import warm_up
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def main():
+    args = sys.argv[1:]
+    if "--no-warm-up" in args:
+        args.remove("--no-warm-up")
+    else:
+        logging.basicConfig(level=logging.INFO)
+        warm_up()
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", APP, *args]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
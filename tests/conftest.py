@@ -0,0 +1,74 @@
+"""
+Shared fixtures of the tests.
+"""
+import re
+from urllib.parse import urlsplit
+
+import pytest
+from bs4 import BeautifulSoup
+from selenium import webdriver
+
+
+class _Element:
+    def __init__(self, click=None):
+        self._click = click
+
+    def click(self):
+        self._click()
+
+
+class _SwitchTo:
+    def frame(self, frame):
+        pass
+
+
+class Driver:
+    """
+    Stands in for Chrome in the selenium fallbacks of the scrapers, serving saved pages. A link to the next
+    page is clicked like in the browser, within the box named by the XPath if it names one.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.path = None
+        self.switch_to = _SwitchTo()
+        self.requested = []
+
+    def get(self, url):
+        parts = urlsplit(url)
+        self.path = parts.path + ("?" + parts.query if parts.query else "")
+        self.requested.append(self.path)
+
+    @property
+    def page_source(self):
+        return self.pages[self.path].decode("utf-8")
+
+    def find_elements(self, by, value):
+        if value == "iframe":
+            return [_Element(), _Element()]
+        if "Zur naechsten Seite" not in value:
+            return []
+        soup = BeautifulSoup(self.page_source, "html.parser")
+        box = re.search(r"\[@class='box'\]\[(\d+)\]", value)
+        scope = soup.find_all("div", class_="box")[int(box.group(1)) - 1] if box else soup
+        return [_Element(lambda href=link["href"]: self.get(href))
+                for link in scope.find_all("a", title="Zur naechsten Seite")]
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    """
+    Returns a function replacing Chrome by a Driver serving the given pages, the waits of the scrapers are skipped.
+    """
+    def serve(pages, module):
+        drivers = []
+
+        def chrome():
+            drivers.append(Driver(pages))
+            return drivers[-1]
+
+        monkeypatch.setattr(webdriver, "Chrome", chrome)
+        monkeypatch.setattr(module.time, "sleep", lambda seconds: None)
+        return drivers
+
+    return serve
@@ -0,0 +1,46 @@
+"""
+Tests of the query service of analysis/api.py, served on a free local port.
+"""
+import json
+from urllib.request import urlopen
+
+import pytest
+
+from analysis.api import QueryServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with QueryServer() as server:
+        yield server
+
+
+def get(server, path):
+    with urlopen(server.base_url + path) as response:
+        return json.loads(response.read())
+
+
+def test_totals_of_empty_season_are_zero(server):
+    totals = get(server, "/players/Lionel%20Messi?season=1900")["totals"]
+    assert totals["goals"] == {"club_goals": 0, "international_goals": 0, "total_goals": 0}
+    assert totals["penalties"]["total"] == 0
+    assert totals["penalties"]["scoring_rate"] is None
+    assert totals["titles"]["total"] == 0
+
+
+def test_fair_play_of_empty_season_is_zero(server):
+    totals = get(server, "/players/Lionel%20Messi/fair_play?season=2050")["totals"]
+    assert totals == {"yellow": 0, "yellow_red": 0, "red": 0, "games": 0, "games_per_yellow": None,
+                      "games_per_red": None}
+
+
+def test_empty_competition_is_zero(server):
+    totals = get(server, "/players/Lionel%20Messi/goals?competition=Bundesliga")["totals"]
+    assert totals["total_goals"] == 0
+
+
+def test_filtered_totals_match_unfiltered(server):
+    # a season range covering every season gives the totals of the page
+    unfiltered = get(server, "/players/Christiano%20Ronaldo/penalties")["totals"]
+    filtered = get(server, "/players/Christiano%20Ronaldo/penalties?season=1900-2100")["totals"]
+    assert filtered == unfiltered
@@ -0,0 +1,66 @@
+"""
+Tests of the cubes of analysis/cube.py against the same aggregates computed from the csv files.
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.loading import load_cube
+
+
+def _csv(name):
+    return pd.read_csv(os.path.join(DATA_DIR, DATASETS[name]))
+
+
+def _totals(df, keys, measures):
+    grouped = df.groupby(keys, observed=True)[measures].sum()
+    return {tuple(map(str, key)): tuple(int(value) for value in row) for key, row in zip(grouped.index, grouped.values)}
+
+
+@pytest.mark.parametrize("name, column", [
+    ("goal_types", ["goal_type"]),
+    ("goal_positions", ["player_position"]),
+    ("goal_minutes", ["goal_minute", "added_time"]),
+])
+def test_goal_cubes_match_csv(name, column):
+    club_goals = _csv("club_goals").assign(goals=1)
+    cube = load_cube(name)
+    assert _totals(cube, ["player_name", "season", "venue", "competition", *column], ["goals"]) == \
+        _totals(club_goals, ["player_name", "saison", "venue", "league", *column], ["goals"])
+
+
+def test_penalty_cube_matches_csv():
+    penalties = _csv("penalties").assign(taken=1)
+    keys = ["player_name", "saison", "competition_type", "competition"]
+    assert _totals(load_cube("penalties"), keys, ["taken", "scored"]) == _totals(penalties, keys, ["taken", "has_scored"])
+
+
+def test_performance_cube_matches_csv():
+    performances = load_cube("performances")
+    measures = ["games", "goals", "assists", "yellow_cards", "yellow_red_cards", "red_cards"]
+
+    club = _csv("club_performances")
+    keys = ["player_name", "saison", "competition"]
+    assert _totals(performances[performances["source"] == "Club"], keys, measures) == \
+        _totals(club, keys, ["games_played", "goals", "assists", "yellow_cards", "yellow_red_cards", "red_cards"])
+    assert performances.loc[performances["source"] == "Club", "entries"].sum() == len(club)
+
+    international = _csv("international_performances")
+    date = pd.to_datetime(international["date"])
+    # seasons start in July
+    international = international.assign(season=date.dt.year - (date.dt.month < 7), games=1,
+                                         yellow_card=international["yellow_card"].notnull(),
+                                         yellow_red_card=international["yellow_red_card"].notnull(),
+                                         red_card=international["red_card"].notnull())
+    assert _totals(performances[performances["source"] == "International"],
+                   ["player_name", "season", "venue", "competition"], measures) == \
+        _totals(international, ["player_name", "season", "venue", "tournament"],
+                ["games", "goals", "assists_amount", "yellow_card", "yellow_red_card", "red_card"])
+
+
+def test_title_cube_matches_csv():
+    achievements = _csv("achievements").assign(titles=1)
+    keys = ["player_name", "year", "title"]
+    assert _totals(load_cube("titles"), keys, ["titles"]) == _totals(achievements, keys, ["titles"])
@@ -0,0 +1,48 @@
+"""
+Tests of merge() of scraping/incremental.py.
+"""
+import pandas as pd
+
+from scraping.incremental import merge
+
+KEYS = ["player_name", "game_id", "minute"]
+
+EXISTING = pd.DataFrame({
+    "player_name": ["Lionel Messi"] * 3 + ["Christiano Ronaldo"] * 3,
+    "game_id": ["3", "2", "1", "13", "12", "11"],
+    "date": ["2024-05-01", "2024-05-01", "2024-04-01", "2024-05-02", "2024-05-02", "2024-04-02"],
+    "minute": ["10", "20", "30", "40", "50", "60"],
+}, dtype=str)
+
+
+def scraped(player_name, rows):
+    return pd.DataFrame([{"player_name": player_name, **row} for row in rows], columns=EXISTING.columns, dtype=str)
+
+
+def test_window_is_replaced_by_scraped_rows():
+    new = pd.concat([
+        scraped("Lionel Messi", [{"game_id": "4", "date": "2024-05-08", "minute": "5"},
+                                 {"game_id": "3", "date": "2024-05-01", "minute": "10"}]),
+        scraped("Christiano Ronaldo", [{"game_id": "13", "date": "2024-05-02", "minute": "40"},
+                                       {"game_id": "12", "date": "2024-05-02", "minute": "50"}]),
+    ])
+    df, counts = merge(EXISTING, new, KEYS, "date", True)
+    assert list(df["game_id"]) == ["4", "3", "1", "13", "12", "11"]
+    assert counts == {"kept": 2, "replaced": 4, "added": 4}
+
+
+def test_player_without_scraped_rows_keeps_window():
+    # the page of Messi came back empty
+    new = scraped("Christiano Ronaldo", [{"game_id": "14", "date": "2024-05-09", "minute": "70"},
+                                         {"game_id": "13", "date": "2024-05-02", "minute": "40"},
+                                         {"game_id": "12", "date": "2024-05-02", "minute": "50"}])
+    df, counts = merge(EXISTING, new, KEYS, "date", True)
+    assert list(df[df["player_name"] == "Lionel Messi"]["game_id"]) == ["3", "2", "1"]
+    assert list(df[df["player_name"] == "Christiano Ronaldo"]["game_id"]) == ["14", "13", "12", "11"]
+    assert counts == {"kept": 4, "replaced": 2, "added": 3}
+
+
+def test_empty_scrape_keeps_dataset():
+    df, counts = merge(EXISTING, scraped("Lionel Messi", []), KEYS, "date", True)
+    pd.testing.assert_frame_equal(df, EXISTING)
+    assert counts == {"kept": 6, "replaced": 0, "added": 0}
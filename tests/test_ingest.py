@@ -0,0 +1,14 @@
+"""
+Tests of ingest_all() of analysis/ingest.py.
+"""
+from analysis import cube
+from analysis.config import DATA_DIR, DATASETS
+from analysis.ingest import ingest_all
+
+
+def test_cube_paths_do_not_replace_dataset_paths(tmp_path):
+    paths = ingest_all(DATA_DIR, str(tmp_path))
+    assert set(paths) == {"vocabularies", *DATASETS, *(f"cube:{name}" for name in cube.CUBES)}
+    assert paths["penalties"] != paths["cube:penalties"]
+    assert paths["cube:penalties"] == cube.cube_path("penalties", str(tmp_path))
+    assert len(set(paths.values())) == len(paths)
@@ -0,0 +1,50 @@
+"""
+Tests of the selenium fallback of scraping/injuries.py, with a driver serving the pages of
+benchmarks/transfermarkt_pages.py instead of Chrome, see tests/conftest.py.
+"""
+import pandas as pd
+import pytest
+
+from benchmarks.transfermarkt_pages import injury_pages
+from scraping import injuries
+
+PAGE = "https://www.transfermarkt.de/lionel-messi/verletzungen/spieler/28003/plus/1"
+
+# newest first, like the table on transfermarkt
+INJURIES = pd.DataFrame({
+    "saison": [f"{year % 100:02d}/{(year + 1) % 100:02d}" for year in range(2023, 2003, -1)],
+    "injury_description": ["Muskelfaserriss"] * 20,
+    "start_date": pd.date_range(start="2023-10-01", periods=20, freq="-180D"),
+    "end_date": pd.date_range(start="2023-10-21", periods=20, freq="-180D"),
+    "days": [20] * 20,
+    "missed_games": [3] * 20,
+})
+
+
+@pytest.fixture
+def driver(browser):
+    drivers = browser(injury_pages(INJURIES, PAGE, per_page=5), injuries)
+    # the driver is created by the scraper, its requests are read after the run
+    return lambda: drivers[0]
+
+
+def test_browser_reads_all_pages(driver):
+    df = injuries.createDataFrameForTables(injuries.getInjuryDataForPlayer(PAGE))
+    assert len(driver().requested) == 4
+    assert len(df) == len(INJURIES)
+    assert list(df["start_date"]) == list(INJURIES["start_date"])
+
+
+def test_browser_stops_at_since(driver):
+    since = INJURIES["start_date"].iloc[7]
+    df = injuries.createDataFrameForTables(injuries.getInjuryDataForPlayer(PAGE, since))
+    # the second page reaches back to the date, the third and fourth are not read
+    assert len(driver().requested) == 2
+    assert len(df) == 10
+
+
+def test_scrape_passes_since_to_browser(driver):
+    since = {"Lionel Messi": INJURIES["start_date"].iloc[2]}
+    df = injuries.scrape({"Lionel Messi": PAGE}, browser=True, since=since)
+    assert len(driver().requested) == 1
+    assert len(df) == 5
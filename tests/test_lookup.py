@@ -0,0 +1,41 @@
+"""
+Tests of the inverted indexes of analysis/lookup.py against a filter of the dataset by a boolean mask.
+"""
+import pandas as pd
+import pytest
+
+from analysis.loading import load_dataset
+from analysis.lookup import DRILL_DOWNS, drill_down, inverted_index
+
+
+def _value_sets(values):
+    # a single value, a few values across the vocabulary and a value that does not occur
+    values = list(values)
+    return [values[:1], values[::max(len(values) // 5, 1)], values[-2:] + ["unknown"], []]
+
+
+@pytest.mark.parametrize("name", list(DRILL_DOWNS))
+def test_drill_down_matches_mask(name):
+    dataset, column, columns = DRILL_DOWNS[name]
+    df = load_dataset(dataset)
+    index = inverted_index(dataset, column)
+    players = [None, *df["player_name"].dropna().unique(), "unknown"]
+    for values in _value_sets(index.values):
+        for player in players:
+            mask = df[column].isin(values)
+            if player is not None:
+                mask &= df["player_name"] == player
+            pd.testing.assert_frame_equal(drill_down(name, values, player), df.loc[mask, columns],
+                                          obj=f"{name} {values} {player}")
+
+
+@pytest.mark.parametrize("dataset, column", sorted({(dataset, column) for dataset, column, _ in DRILL_DOWNS.values()}))
+def test_counts_match_value_counts(dataset, column):
+    df = load_dataset(dataset)
+    index = inverted_index(dataset, column)
+    for player in [None, *df["player_name"].dropna().unique()]:
+        rows = df if player is None else df[df["player_name"] == player]
+        # rows with a missing player are not indexed
+        expected = rows.loc[rows["player_name"].notna(), column].value_counts()
+        expected = expected[expected > 0]
+        assert index.counts(player).to_dict() == expected.to_dict()
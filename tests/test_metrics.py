@@ -0,0 +1,119 @@
+"""
+Tests of the metrics of analysis/metrics.py.
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.metrics import CARD_COLUMNS, DISCIPLINES, discipline_metrics, for_player, player_totals
+from analysis.ranges import filtered_metrics
+
+
+@pytest.mark.parametrize("name", list(DISCIPLINES))
+def test_shared_metrics_are_read_only(name):
+    metrics = discipline_metrics(name)
+    with pytest.raises(TypeError):
+        metrics["totals"] = None
+    totals = metrics["totals"]
+    with pytest.raises(ValueError):
+        totals.iloc[0, 0] = 0
+    with pytest.raises(ValueError):
+        totals.loc[totals.index[0], totals.columns[0]] = 0
+    with pytest.raises(ValueError):
+        totals[totals.columns[0]].to_numpy()[0] = 0
+
+
+def test_filtered_metrics_are_read_only():
+    totals = filtered_metrics("penalties", seasons=(2009, 2014))["totals"]
+    with pytest.raises(ValueError):
+        totals.iloc[0, 0] = 0
+
+
+def test_derived_frames_can_be_changed():
+    totals = discipline_metrics("penalties")["totals"]
+    before = totals.copy()
+    player = for_player(discipline_metrics("penalties")["per_competition"], "Lionel Messi")
+    player["count"] = 0
+    derived = totals.reset_index()
+    derived.loc[0, "total"] = 0
+    assert totals.equals(before)
+
+
+# the csv files read as the page did before the metrics were computed in a single pass
+RAW = {name: pd.read_csv(os.path.join(DATA_DIR, file_name)) for name, file_name in DATASETS.items()
+       if name in ["achievements", "club_goals", "club_performances", "international_performances", "penalties"]}
+PLAYERS = sorted(RAW["club_goals"]["player_name"].unique())
+
+
+def _counts(series):
+    return {key: int(value) for key, value in series.items()}
+
+
+@pytest.mark.parametrize("player", PLAYERS)
+def test_goal_metrics_match_per_player_computation(player):
+    metrics = discipline_metrics("goals")
+    club_goals = RAW["club_goals"][RAW["club_goals"]["player_name"] == player]
+    international = RAW["international_performances"][RAW["international_performances"]["player_name"] == player]
+
+    assert _counts(for_player(metrics["types"], player)) == _counts(club_goals["goal_type"].value_counts())
+    assert _counts(for_player(metrics["positions"], player)) == _counts(club_goals["player_position"].value_counts())
+    assert _counts(for_player(metrics["minutes"], player)) == _counts(club_goals[["goal_minute", "added_time"]].value_counts())
+    totals = player_totals(metrics["totals"], player)
+    assert totals["club_goals"] == len(club_goals)
+    assert totals["international_goals"] == international["goals"].sum()
+
+
+@pytest.mark.parametrize("player", PLAYERS)
+def test_penalty_metrics_match_per_player_computation(player):
+    metrics = discipline_metrics("penalties")
+    penalties = RAW["penalties"][RAW["penalties"]["player_name"] == player]
+
+    assert _counts(for_player(metrics["per_saison"], player)) == _counts(penalties.groupby("saison").size())
+    per_competition = for_player(metrics["per_competition"], player)
+    assert _counts(per_competition["count"]) == _counts(penalties.groupby("competition").size())
+    assert _counts(per_competition["scored"]) == _counts(penalties.groupby("competition")["has_scored"].sum())
+    totals = player_totals(metrics["totals"], player)
+    assert totals["total"] == len(penalties)
+    assert totals["scored"] == penalties["has_scored"].sum()
+    assert totals["missed"] == (~penalties["has_scored"]).sum()
+    assert totals["per_season"] == pytest.approx(len(penalties) / penalties["saison"].nunique())
+
+
+@pytest.mark.parametrize("player", PLAYERS)
+def test_assist_and_card_metrics_match_per_player_computation(player):
+    club = RAW["club_performances"][RAW["club_performances"]["player_name"] == player]
+    international = RAW["international_performances"][RAW["international_performances"]["player_name"] == player]
+
+    assists = discipline_metrics("assists")
+    expected = pd.concat([international.groupby("tournament")["assists_amount"].sum(),
+                          club.groupby("competition")["assists"].sum()])
+    assert sorted(_counts(for_player(assists["per_tournament"]["assists"], player)).items()) == \
+        sorted((key, int(value)) for key, value in expected.items())
+    totals = player_totals(assists["totals"], player)
+    assert totals["club_assists"] == club["assists"].sum()
+    assert totals["international_assists"] == international["assists_amount"].sum()
+
+    fair_play = discipline_metrics("fair_play")
+    per_competition = for_player(fair_play["per_competition"], player)
+    club_cards = club.groupby("competition_type")[CARD_COLUMNS].sum()
+    international_cards = international[["yellow_card", "yellow_red_card", "red_card"]].notnull()
+    international_cards = international_cards.groupby(international["tournament"]).sum()
+    for column, international_column in zip(CARD_COLUMNS, international_cards.columns):
+        assert sorted(_counts(per_competition[column]).items()) == sorted(
+            [*_counts(club_cards[column]).items(), *_counts(international_cards[international_column]).items()])
+    totals = player_totals(fair_play["totals"], player)
+    assert totals["yellow"] == club["yellow_cards"].sum() + international["yellow_card"].notnull().sum()
+    assert totals["yellow_red"] == club["yellow_red_cards"].sum() + international["yellow_red_card"].notnull().sum()
+    assert totals["red"] == club["red_cards"].sum() + international["red_card"].notnull().sum()
+    assert totals["games"] == club["games_played"].sum() + len(club)
+
+
+@pytest.mark.parametrize("player", PLAYERS)
+def test_title_metrics_match_per_player_computation(player):
+    metrics = discipline_metrics("titles")
+    titles = RAW["achievements"][RAW["achievements"]["player_name"] == player]
+
+    assert _counts(for_player(metrics["per_title"]["count"], player)) == _counts(titles.groupby("title")["year"].count())
+    assert player_totals(metrics["totals"], player)["total"] == len(titles)
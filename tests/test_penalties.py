@@ -0,0 +1,40 @@
+"""
+Tests of the selenium fallback of scraping/penalties.py, with a driver serving the pages of
+benchmarks/transfermarkt_pages.py instead of Chrome, see tests/conftest.py.
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from analysis.config import DATA_DIR, DATASETS
+from benchmarks.transfermarkt_pages import penalty_pages
+from scraping import penalties
+
+PAGE = "https://www.transfermarkt.de/lionel-messi/elfmetertore/spieler/28003/saison_id//wettbewerb_id//plus/1"
+
+# stored newest first, like the tables on transfermarkt
+MESSI = pd.read_csv(os.path.join(DATA_DIR, DATASETS["penalties"]))
+MESSI = MESSI[MESSI["player_name"] == "Lionel Messi"].drop(columns="player_name")
+
+
+@pytest.fixture
+def drivers(browser):
+    return browser(penalty_pages(MESSI, PAGE), penalties)
+
+
+def test_browser_reads_all_pages(drivers):
+    df = penalties.createPenaltyDataFrameForTables(penalties.getSuccessfullPenaltyData(PAGE),
+                                                   penalties.geMissedPenaltyData(PAGE))
+    assert len(df) == len(MESSI)
+    assert df["has_scored"].sum() == MESSI["has_scored"].sum()
+    # 25 penalties per page
+    assert [len(driver.requested) for driver in drivers] == [5, 2]
+
+
+def test_scrape_passes_since_to_browser(drivers):
+    # the first page of both boxes reaches back beyond the 10th newest penalties
+    since = pd.Timestamp(MESSI.groupby("has_scored")["date"].nth(9).max())
+    df = penalties.scrape({"Lionel Messi": PAGE}, browser=True, since={"Lionel Messi": since})
+    assert [len(driver.requested) for driver in drivers] == [1, 1]
+    assert len(df) == 50
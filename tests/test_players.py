@@ -0,0 +1,56 @@
+"""
+Tests of the page urls of scraping/players.py and their cache entries.
+"""
+import os
+from datetime import date
+
+from scraping import players
+from scraping.cache import ResponseCache
+from scraping.fetch import Fetcher
+from scraping.standin import FixtureServer, save_fixture
+
+MESSI = players.load_players()["Lionel Messi"]
+
+
+class _Tomorrow(date):
+    @classmethod
+    def today(cls):
+        return date(2031, 1, 1)
+
+
+def test_international_page_ends_today(monkeypatch):
+    monkeypatch.setattr(players, "UNTIL", None)
+    monkeypatch.setattr(players, "date", _Tomorrow)
+    assert "/ende/2031-01-01/" in players.player_page(MESSI, "international_performances")
+
+
+def test_international_page_ends_at_scrape_until(monkeypatch):
+    monkeypatch.setattr(players, "UNTIL", date(2024, 12, 26))
+    monkeypatch.setattr(players, "date", _Tomorrow)
+    assert "/ende/2024-12-26/" in players.player_page(MESSI, "international_performances")
+
+
+def test_page_of_the_next_day_is_revalidated(tmp_path, monkeypatch):
+    today = players.player_page(MESSI, "international_performances", date(2024, 12, 25))
+    tomorrow = players.player_page(MESSI, "international_performances", date(2024, 12, 26))
+    fixtures = str(tmp_path / "fixtures")
+    save_fixture(today, b"<table>Spiele</table>", fixtures)
+    save_fixture(tomorrow, b"<table>Spiele</table>", fixtures)
+    cache = ResponseCache(str(tmp_path / "cache"))
+    stored = []
+    put = cache.put
+    monkeypatch.setattr(cache, "put", lambda url, *args: stored.append(url) or put(url, *args))
+    with FixtureServer(fixtures) as server:
+        fetcher = Fetcher(requests_per_second=None, base_url=server.base_url, cache=cache)
+        assert fetcher.fetch(today) == b"<table>Spiele</table>"
+        # unchanged, the server answers the validators of the page of the day before with 304
+        assert fetcher.fetch(tomorrow) == b"<table>Spiele</table>"
+        assert stored == [today]
+        assert cache.get(tomorrow)["url"] == tomorrow
+        assert len(os.listdir(tmp_path / "cache" / "index")) == 1
+
+        # a new game is fetched although the page of the day before has the same cache entry
+        save_fixture(tomorrow, b"<table>Spiele und ein neues</table>", fixtures)
+        assert fetcher.fetch(tomorrow) == b"<table>Spiele und ein neues</table>"
+        assert stored == [today, tomorrow]
+        fetcher.close()
@@ -0,0 +1,52 @@
+"""
+Tests of the season index of analysis/ranges.py against the totals computed from the filtered cubes and
+from the csv files.
+"""
+import os
+
+import pandas as pd
+import pytest
+
+from analysis.config import DATA_DIR, DATASETS
+from analysis.cube import season_start
+from analysis.loading import load_cube
+from analysis.metrics import DISCIPLINES, select
+from analysis.ranges import SOURCES, SUMMED_TOTALS, VENUES, filtered_metrics, season_index
+
+SEASONS = [None, (2009, 2014), (2016, 2016), (2020, 2040), (1980, 2002)]
+
+
+def _computed_totals(name, seasons, source, venue):
+    # the totals as computed before the index, from the cubes filtered row by row
+    sources, compute = DISCIPLINES[name]
+    totals = compute(*[select(load_cube(cube), seasons, source, venue) for cube in sources])["totals"]
+    players = season_index().players
+    return totals.reindex(index=players, columns=SUMMED_TOTALS[name]).fillna(0).astype("int64")
+
+
+@pytest.mark.parametrize("name", list(SUMMED_TOTALS))
+@pytest.mark.parametrize("seasons", SEASONS)
+def test_index_totals_match_filtered_cubes(name, seasons):
+    index = season_index()
+    for source in SOURCES:
+        for venue in VENUES:
+            totals = index.totals(name, seasons, source, venue)[SUMMED_TOTALS[name]]
+            expected = _computed_totals(name, seasons, source, venue)
+            pd.testing.assert_frame_equal(totals, expected, check_names=False, obj=f"{name} {seasons} {source} {venue}")
+
+
+def test_filtered_totals_match_csv():
+    seasons = (2009, 2014)
+    penalties = pd.read_csv(os.path.join(DATA_DIR, DATASETS["penalties"]))
+    penalties = penalties[season_start(penalties["saison"]).between(*seasons) & (penalties["competition_type"] == "Club")]
+    totals = filtered_metrics("penalties", seasons=seasons, source="Club")["totals"]
+    for player, rows in penalties.groupby("player_name"):
+        assert totals.loc[player, "total"] == len(rows)
+        assert totals.loc[player, "scored"] == rows["has_scored"].sum()
+        assert totals.loc[player, "seasons"] == rows["saison"].nunique()
+
+    club_goals = pd.read_csv(os.path.join(DATA_DIR, DATASETS["club_goals"]))
+    club_goals = club_goals[club_goals["saison"].between(*seasons) & (club_goals["venue"] == "H")]
+    totals = filtered_metrics("goals", seasons=seasons, venue="H")["totals"]
+    for player, rows in club_goals.groupby("player_name"):
+        assert totals.loc[player, "club_goals"] == len(rows)